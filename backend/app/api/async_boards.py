@@ -0,0 +1,55 @@
+"""Async twins of the read endpoints in ``app.api.boards``.
+
+Registered ahead of the sync router when ``DATABASE_ASYNC`` is on; writes
+keep going through the sync handlers.
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_db, get_current_user_async
+from app.models.board import Board
+from app.models.board_member import BoardMember
+from app.models.user import User
+from app.schemas.board import BoardOut
+
+router = APIRouter(prefix="/boards", tags=["Boards"])
+
+
+@router.get("/", response_model=list[BoardOut])
+async def list_boards(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    result = await db.execute(
+        select(Board)
+        .join(BoardMember, BoardMember.board_id == Board.id)
+        .where(BoardMember.user_id == current_user.id)
+    )
+    return result.scalars().all()
+
+
+@router.get("/{board_id}", response_model=BoardOut)
+async def get_board(
+    board_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    board = await db.scalar(select(Board).where(Board.id == board_id))
+
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    if board.owner_id != current_user.id:
+        membership = await db.scalar(
+            select(BoardMember.id).where(
+                BoardMember.board_id == board.id, BoardMember.user_id == current_user.id
+            )
+        )
+        if not membership:
+            raise HTTPException(status_code=403, detail="Not authorized")
+
+    return board
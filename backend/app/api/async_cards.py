@@ -0,0 +1,49 @@
+"""Async twins of the read endpoints in ``app.api.cards``."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.cards import CARD_LIST
+from app.api.deps import authorize_board_read_async, get_async_db, security
+from app.core import queries
+from app.core.streaming import STREAM_OPTIONS, json_array_async
+from app.models.card import Card
+from app.models.list import List
+from app.schemas.card import CardOut
+
+router = APIRouter(prefix="/cards", tags=["Cards"])
+
+
+@router.get("/", response_model=list[CardOut])
+async def list_cards(
+    list_id: UUID,
+    stream: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    board_id = await db.scalar(select(List.board_id).where(List.id == list_id))
+    if not board_id:
+        raise HTTPException(status_code=404, detail="List not found")
+
+    await authorize_board_read_async(board_id, credentials, db)
+
+    if stream:
+        rows = await db.stream(
+            queries.card_rows_in_list(board_id, list_id),
+            execution_options=STREAM_OPTIONS,
+        )
+        return StreamingResponse(
+            json_array_async(rows.partitions(), CARD_LIST),
+            media_type="application/json",
+        )
+    result = await db.execute(
+        select(Card)
+        .where(Card.board_id == board_id, Card.list_id == list_id)
+        .order_by(Card.position)
+    )
+    return result.scalars().all()
@@ -0,0 +1,28 @@
+"""Async twins of the read endpoints in ``app.api.lists``."""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import authorize_board_read_async, get_async_db, security
+from app.models.list import List
+from app.schemas.list import ListOut
+
+router = APIRouter(prefix="/lists", tags=["Lists"])
+
+
+@router.get("/board/{board_id}", response_model=list[ListOut])
+async def get_lists(
+    board_id: UUID,
+    db: AsyncSession = Depends(get_async_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    await authorize_board_read_async(board_id, credentials, db)
+
+    result = await db.execute(
+        select(List).where(List.board_id == board_id).order_by(List.position)
+    )
+    return result.scalars().all()
@@ -1,44 +1,163 @@
-from fastapi import APIRouter, Depends, HTTPException
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.core.database import SessionLocal
-from app.core.security import create_access_token, hash_password, verify_password
+from app.api.deps import remember_writes, transactional
+from app.core.config import settings
+from app.core.database import SessionLocal, db_router, dialect_insert
+from app.core.revocation import revoked_sessions
+from app.core.security import (
+    create_access_token,
+    generate_token,
+    hash_password,
+    hash_token,
+    verify_and_update_password,
+)
+from app.models.refresh_token import RefreshToken
 from app.models.user import User
-from app.schemas.auth import LoginRequest
+from app.schemas.auth import LoginRequest, RefreshRequest
 from app.schemas.user import UserCreate, UserOut
 
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
-def get_db():
+def get_db(response: Response):
+    # Every auth route writes, so to the primary; the client is then sent
+    # there to read its new user or session back.
     db = SessionLocal()
+    if db_router.replicas:
+        remember_writes(db, response)
     try:
         yield db
     finally:
         db.close()
 
 
+def issue_tokens(db: Session, user_id: uuid.UUID, family_id: uuid.UUID) -> dict:
+    """Add a refresh token for ``family_id`` to the session and return the
+    new token pair. The caller commits."""
+    refresh_token = generate_token()
+    db.add(
+        RefreshToken(
+            user_id=user_id,
+            family_id=family_id,
+            token_hash=hash_token(refresh_token),
+            expires_at=datetime.now(UTC)
+            + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    return {
+        "access_token": create_access_token(
+            subject=str(user_id), session_id=str(family_id)
+        ),
+        "refresh_token": refresh_token,
+        "token_type": "bearer",
+    }
+
+
+def revoke_family(db: Session, family_id: uuid.UUID) -> None:
+    """Revoke every refresh token of a login session and deny its access
+    tokens in this process right away. The caller commits."""
+    db.query(RefreshToken).filter(
+        RefreshToken.family_id == family_id,
+        RefreshToken.revoked_at.is_(None),
+    ).update({RefreshToken.revoked_at: datetime.now(UTC)}, synchronize_session=False)
+    revoked_sessions.revoke(str(family_id))
+
+
 @router.post("/register", response_model=UserOut)
+@transactional()
 def register(user: UserCreate, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.email == user.email).first():
+    stmt = (
+        dialect_insert(db, User)
+        .values(
+            email=user.email,
+            username=user.username,
+            password_hash=hash_password(user.password),
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User)
+    )
+    try:
+        db_user = db.execute(stmt).scalar_one_or_none()
+    except IntegrityError as err:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Username already used") from err
+    if db_user is None:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Email already used")
 
-    db_user = User(
-        email=user.email,
-        username=user.username,
-        password_hash=hash_password(user.password),
-    )
-    db.add(db_user)
     db.commit()
-    db.refresh(db_user)
     return db_user
 
 
 @router.post("/login")
+@transactional()
 def login(payload: LoginRequest, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.email == payload.email).first()
-    if not user or not verify_password(payload.password, user.password_hash):
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+
+    valid, new_hash = verify_and_update_password(payload.password, user.password_hash)
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    token = create_access_token(subject=str(user.id))
-    return {"access_token": token, "token_type": "bearer"}
+    if new_hash:
+        # Hash was made with an older scheme or cost: upgrade it transparently.
+        user.password_hash = new_hash
+
+    tokens = issue_tokens(db, user.id, family_id=uuid.uuid4())
+    db.commit()
+    return tokens
+
+
+@router.post("/refresh")
+@transactional()
+def refresh(payload: RefreshRequest, db: Session = Depends(get_db)):
+    now = datetime.now(UTC)
+    token = (
+        db.query(RefreshToken)
+        .filter(RefreshToken.token_hash == hash_token(payload.refresh_token))
+        .first()
+    )
+    if not token or token.revoked_at is not None:
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+    if token.used_at is not None:
+        # A rotated token came back: assume it was stolen and end the session.
+        revoke_family(db, token.family_id)
+        db.commit()
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+    if token.expires_at <= now:
+        raise HTTPException(status_code=401, detail="Refresh token expired")
+
+    # Conditional update so two concurrent refreshes cannot both rotate.
+    claimed = (
+        db.query(RefreshToken)
+        .filter(RefreshToken.id == token.id, RefreshToken.used_at.is_(None))
+        .update({RefreshToken.used_at: now}, synchronize_session=False)
+    )
+    if not claimed:
+        db.rollback()
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
+
+    tokens = issue_tokens(db, token.user_id, family_id=token.family_id)
+    db.commit()
+    return tokens
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+@transactional()
+def logout(payload: RefreshRequest, db: Session = Depends(get_db)):
+    token = (
+        db.query(RefreshToken)
+        .filter(RefreshToken.token_hash == hash_token(payload.refresh_token))
+        .first()
+    )
+    if token:
+        revoke_family(db, token.family_id)
+        db.commit()
@@ -3,7 +3,10 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db, require_board_owner
+from app.api.deps import get_current_user, get_db, require_board_owner, transactional
+from app.core import queries
+from app.core.database import dialect_insert
+from app.models.board import Board
 from app.models.board_member import BoardMember
 from app.models.user import User
 from app.schemas.board_member import (
@@ -16,6 +19,7 @@ router = APIRouter(prefix="/boards/{board_id}/members", tags=["Board Members"])
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
+@transactional()
 def add_member_by_email(
     board_id: UUID,
     payload: BoardMemberAddByEmail,
@@ -26,19 +30,18 @@ def add_member_by_email(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    exists = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == board_id,
-            BoardMember.user_id == user.id,
+    stmt = (
+        dialect_insert(db, BoardMember)
+        .values(board_id=board_id, user_id=user.id, role="member")
+        .on_conflict_do_nothing(
+            index_elements=[BoardMember.board_id, BoardMember.user_id]
         )
-        .first()
+        .returning(BoardMember.id)
     )
-    if exists:
+    if db.execute(stmt).scalar_one_or_none() is None:
+        db.rollback()
         raise HTTPException(status_code=400, detail="User already member of this board")
 
-    bm = BoardMember(board_id=board_id, user_id=user.id, role="member")
-    db.add(bm)
     db.commit()
 
     return {"detail": "Member added"}
@@ -51,41 +54,38 @@ def list_members(
     current_user=Depends(get_current_user),
 ):
     # Vérifier que l'utilisateur courant est membre du board
-    is_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == board_id,
-            BoardMember.user_id == current_user.id,
-        )
-        .first()
-    )
+    is_member = queries.get_membership(db, board_id, current_user.id)
     if not is_member:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    rows = (
-        db.query(
-            BoardMember.user_id,
-            BoardMember.role,
-            User.email,
-            User.username,
-        )
-        .join(User, User.id == BoardMember.user_id)
+    # Two queries rather than a join: users may live in another database
+    # than the board (see app.core.sharding).
+    members = (
+        db.query(BoardMember.user_id, BoardMember.role)
         .filter(BoardMember.board_id == board_id)
         .all()
     )
+    users = {
+        user.id: user
+        for user in db.query(User.id, User.email, User.username).filter(
+            User.id.in_([member.user_id for member in members])
+        )
+    }
 
     return [
         {
-            "user_id": row.user_id,
-            "email": row.email,
-            "username": row.username,
-            "role": row.role,
+            "user_id": member.user_id,
+            "email": users[member.user_id].email,
+            "username": users[member.user_id].username,
+            "role": member.role,
         }
-        for row in rows
+        for member in members
+        if member.user_id in users
     ]
 
 
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
+@transactional()
 def remove_member_by_email(
     board_id: UUID,
     payload: BoardMemberRemoveByEmail,
@@ -96,14 +96,7 @@ def remove_member_by_email(
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == board_id,
-            BoardMember.user_id == user.id,
-        )
-        .first()
-    )
+    member = queries.get_membership(db, board_id, user.id)
     if not member:
         raise HTTPException(
             status_code=404, detail="User is not a member of this board"
@@ -116,4 +109,9 @@ def remove_member_by_email(
         )
 
     db.delete(member)
+    # Invalidate board-scoped tokens that may have been minted for them.
+    db.query(Board).filter(Board.id == board_id).update(
+        {Board.membership_epoch: Board.membership_epoch + 1},
+        synchronize_session=False,
+    )
     db.commit()
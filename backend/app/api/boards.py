@@ -1,13 +1,31 @@
+from datetime import UTC, datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import (
+    authorize_board_read,
+    get_board_member,
+    get_current_user,
+    get_db,
+    security,
+    transactional,
+)
+from app.core import board_snapshots, queries
+from app.core.security import create_board_token
+from app.core.soft_delete import INCLUDE_DELETED, restorable_since
 from app.models.board import Board
 from app.models.board_member import BoardMember
 from app.models.user import User
-from app.schemas.board import BoardCreate, BoardOut, BoardUpdate
+from app.schemas.board import (
+    BoardCreate,
+    BoardOut,
+    BoardSnapshotOut,
+    BoardTokenOut,
+    BoardUpdate,
+)
 
 router = APIRouter(prefix="/boards", tags=["Boards"])
 
@@ -26,6 +44,7 @@ def list_boards(
 
 
 @router.post("/", response_model=BoardOut, status_code=status.HTTP_201_CREATED)
+@transactional()
 def create_board(
     board_in: BoardCreate,
     db: Session = Depends(get_db),
@@ -47,9 +66,9 @@ def create_board(
         role="owner",
     )
     db.add(board_member)
+    board_snapshots.create_snapshot(db, board)
 
     db.commit()
-    db.refresh(board)
 
     return board
 
@@ -66,20 +85,31 @@ def get_board(
         raise HTTPException(status_code=404, detail="Board not found")
 
     if board.owner_id != current_user.id:
-        membership = (
-            db.query(BoardMember)
-            .filter(
-                BoardMember.board_id == board.id, BoardMember.user_id == current_user.id
-            )
-            .first()
-        )
+        membership = queries.get_membership(db, board.id, current_user.id)
         if not membership:
             raise HTTPException(status_code=403, detail="Not authorized")
 
     return board
 
 
+@router.get("/{board_id}/snapshot", response_model=BoardSnapshotOut)
+def get_board_snapshot(
+    board_id: UUID,
+    db: Session = Depends(get_db),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    """The whole board, lists, cards and assignees, in one range scan over
+    its snapshot entries. The stored JSON is sent without being parsed."""
+    authorize_board_read(board_id, credentials, db)
+
+    document = board_snapshots.read_document(db, board_id)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    return Response(content=document, media_type="application/json")
+
+
 @router.put("/{board_id}", response_model=BoardOut)
+@transactional()
 def update_board(
     board_id: UUID,
     board_in: BoardUpdate,
@@ -103,12 +133,13 @@ def update_board(
     if board_in.background_thumb_url is not None:
         board.background_thumb_url = board_in.background_thumb_url
 
+    board_snapshots.put_board(db, board)
     db.commit()
-    db.refresh(board)
     return board
 
 
 @router.delete("/{board_id}", status_code=status.HTTP_204_NO_CONTENT)
+@transactional()
 def delete_board(
     board_id: UUID,
     db: Session = Depends(get_db),
@@ -122,5 +153,57 @@ def delete_board(
     if board.owner_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    db.delete(board)
+    # Soft delete: the purge worker removes the board and its content once
+    # the retention window is over.
+    board.deleted_at = datetime.now(UTC)
+    db.commit()
+
+
+@router.post("/{board_id}/restore", response_model=BoardOut)
+@transactional()
+def restore_board(
+    board_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    board = (
+        db.query(Board)
+        .execution_options(**{INCLUDE_DELETED: True})
+        .filter(Board.id == board_id, Board.deleted_at >= restorable_since())
+        .first()
+    )
+
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    if board.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    board.deleted_at = None
     db.commit()
+    return board
+
+
+@router.post(
+    "/{board_id}/scoped-tokens",
+    response_model=BoardTokenOut,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_scoped_token(
+    board_id: UUID,
+    db: Session = Depends(get_db),
+    member: BoardMember = Depends(get_board_member),
+):
+    """Mint a short-lived, read-only token for this board, for dashboards and
+    integrations that should not hold a full user token."""
+    epoch = db.query(Board.membership_epoch).filter(Board.id == board_id).scalar()
+    if epoch is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    token, expires_at = create_board_token(
+        subject=str(member.user_id),
+        board_id=board_id,
+        role=member.role,
+        epoch=epoch,
+    )
+    return {"access_token": token, "expires_at": expires_at}
@@ -3,8 +3,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db, require_card_board_member
-from app.models.board_member import BoardMember
+from app.api.deps import (
+    get_current_user,
+    get_db,
+    require_card_board_member,
+    transactional,
+)
+from app.core import board_snapshots, queries
+from app.core.database import dialect_insert
 from app.models.card_member import CardMember
 from app.models.user import User
 from app.schemas.card_member import CardMemberByEmail, CardMemberOut
@@ -15,23 +21,26 @@ router = APIRouter(prefix="/cards/{card_id}/members", tags=["Card Members"])
 @router.get("/", response_model=list[CardMemberOut])
 def list_card_members(
     card_id: UUID,
+    board_id: UUID | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     card, _board_id = require_card_board_member(
         card_id=card_id,
+        board_id=board_id,
         db=db,
         current_user=current_user,
     )
 
+    # Users may live in another database than the card, so no join.
+    assigned = (
+        db.query(CardMember.user_id)
+        .filter(CardMember.board_id == card.board_id, CardMember.card_id == card.id)
+        .all()
+    )
     rows = (
-        db.query(
-            User.id,
-            User.email,
-            User.username,
-        )
-        .join(CardMember, CardMember.user_id == User.id)
-        .filter(CardMember.card_id == card.id)
+        db.query(User.id, User.email, User.username)
+        .filter(User.id.in_([row.user_id for row in assigned]))
         .all()
     )
 
@@ -46,61 +55,58 @@ def list_card_members(
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
+@transactional()
 def add_card_member(
     card_id: UUID,
     payload: CardMemberByEmail,
+    board_id: UUID | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     card, board_id = require_card_board_member(
-        card_id=card_id, db=db, current_user=current_user
+        card_id=card_id, board_id=board_id, db=db, current_user=current_user
     )
 
     user = db.query(User).filter(User.email == payload.email).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    target_is_board_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == board_id,
-            BoardMember.user_id == user.id,
-        )
-        .first()
-    )
+    target_is_board_member = queries.get_membership(db, board_id, user.id)
     if not target_is_board_member:
         raise HTTPException(
             status_code=400, detail="User is not a member of this board"
         )
 
-    exists = (
-        db.query(CardMember)
-        .filter(
-            CardMember.card_id == card.id,
-            CardMember.user_id == user.id,
+    stmt = (
+        dialect_insert(db, CardMember)
+        .values(card_id=card.id, user_id=user.id, board_id=card.board_id)
+        .on_conflict_do_nothing(
+            index_elements=[CardMember.card_id, CardMember.user_id, CardMember.board_id]
         )
-        .first()
+        .returning(CardMember.id)
     )
-    if exists:
+    if db.execute(stmt).scalar_one_or_none() is None:
+        db.rollback()
         raise HTTPException(
             status_code=400, detail="User already assigned to this card"
         )
 
-    cm = CardMember(card_id=card.id, user_id=user.id)
-    db.add(cm)
+    board_snapshots.put_card(db, card)
     db.commit()
     return {"detail": "Member assigned to card"}
 
 
 @router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
+@transactional()
 def remove_card_member(
     card_id: UUID,
     payload: CardMemberByEmail,
+    board_id: UUID | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     card, _board_id = require_card_board_member(
-        card_id=card_id, db=db, current_user=current_user
+        card_id=card_id, board_id=board_id, db=db, current_user=current_user
     )
 
     user = db.query(User).filter(User.email == payload.email).first()
@@ -110,6 +116,7 @@ def remove_card_member(
     cm = (
         db.query(CardMember)
         .filter(
+            CardMember.board_id == card.board_id,
             CardMember.card_id == card.id,
             CardMember.user_id == user.id,
         )
@@ -119,4 +126,5 @@ def remove_card_member(
         raise HTTPException(status_code=404, detail="Assignment not found")
 
     db.delete(cm)
+    board_snapshots.put_card(db, card)
     db.commit()
@@ -1,10 +1,24 @@
+from datetime import UTC, datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, get_db
-from app.models.board_member import BoardMember
+from app.api.deps import (
+    authorize_board_read,
+    get_current_user,
+    get_db,
+    security,
+    transactional,
+)
+from app.core import board_snapshots, queries
+from app.core.database import shard_router
+from app.core.sharding import colocated_id
+from app.core.soft_delete import INCLUDE_DELETED, restorable_since
+from app.core.streaming import STREAM_OPTIONS, json_array
 from app.models.card import Card
 from app.models.list import List
 from app.models.user import User
@@ -12,32 +26,45 @@ from app.schemas.card import CardCreate, CardOut, CardUpdate
 
 router = APIRouter(prefix="/cards", tags=["Cards"])
 
+CARD_LIST = TypeAdapter(list[CardOut])
+
+
+def _count_cards(db: Session, list_id: UUID, delta: int) -> None:
+    """Move ``list_id``'s card_count by ``delta`` in the current transaction.
+    A single UPDATE, so concurrent changes to the same list cannot lose one."""
+    db.query(List).filter(List.id == list_id).update(
+        {List.card_count: List.card_count + delta}, synchronize_session=False
+    )
+
+
+def _card_query(db: Session, card_id: UUID, board_id: UUID | None):
+    """``queries.get_card`` as a query, for lookups it does not cover."""
+    query = db.query(Card).filter(Card.id == card_id)
+    if board_id is not None:
+        query = query.filter(Card.board_id == board_id)
+    return query
+
 
 @router.post("/", response_model=CardOut, status_code=status.HTTP_201_CREATED)
+# Appends after the last card, as create_list appends after the last list.
+@transactional("SERIALIZABLE")
 def create_card(
     list_id: UUID,
     card_in: CardCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    list_ = db.query(List).filter(List.id == list_id).first()
+    list_ = queries.get_list(db, list_id)
     if not list_:
         raise HTTPException(status_code=404, detail="List not found")
 
-    is_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == list_.board_id,
-            BoardMember.user_id == current_user.id,
-        )
-        .first()
-    )
+    is_member = queries.get_membership(db, list_.board_id, current_user.id)
     if not is_member:
         raise HTTPException(status_code=403, detail="Not authorized")
 
     last_card = (
         db.query(Card)
-        .filter(Card.list_id == list_id)
+        .filter(Card.board_id == list_.board_id, Card.list_id == list_id)
         .order_by(Card.position.desc())
         .first()
     )
@@ -48,100 +75,152 @@ def create_card(
         title=card_in.title,
         description=card_in.description,
         list_id=list_id,
+        board_id=list_.board_id,
         creator_id=current_user.id,
         position=position,
     )
 
     db.add(card)
+    _count_cards(db, list_id, 1)
+    board_snapshots.put_card(db, card)
     db.commit()
-    db.refresh(card)
     return card
 
 
 @router.get("/", response_model=list[CardOut])
 def list_cards(
     list_id: UUID,
+    stream: bool = False,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
-    list_ = db.query(List).filter(List.id == list_id).first()
+    """With ``stream=true`` the cards are read through a server-side cursor
+    and written out a batch at a time, so memory stays flat however long the
+    list is."""
+    list_ = queries.get_list(db, list_id)
     if not list_:
         raise HTTPException(status_code=404, detail="List not found")
 
-    is_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == list_.board_id,
-            BoardMember.user_id == current_user.id,
-        )
-        .first()
-    )
-    if not is_member:
-        raise HTTPException(status_code=403, detail="Not authorized")
+    authorize_board_read(list_.board_id, credentials, db)
 
-    return db.query(Card).filter(Card.list_id == list_id).order_by(Card.position).all()
+    if stream:
+        rows = db.execute(
+            queries.card_rows_in_list(list_.board_id, list_id),
+            execution_options=STREAM_OPTIONS,
+        )
+        return StreamingResponse(
+            json_array(rows.partitions(), CARD_LIST), media_type="application/json"
+        )
+    return queries.get_cards_in_list(db, list_.board_id, list_id)
 
 
 @router.put("/{card_id}", response_model=CardOut)
+@transactional("REPEATABLE READ")
 def update_card(
     card_id: UUID,
     card_in: CardUpdate,
+    board_id: UUID | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    card = db.query(Card).filter(Card.id == card_id).first()
+    card = queries.get_card(db, card_id, board_id)
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
 
-    list_ = card.list
-    is_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == list_.board_id,
-            BoardMember.user_id == current_user.id,
-        )
-        .first()
-    )
+    is_member = queries.get_membership(db, card.board_id, current_user.id)
     if not is_member:
         raise HTTPException(status_code=403, detail="Not authorized")
 
+    old_board_id, old_id = card.board_id, card.id
     if card_in.title is not None:
         card.title = card_in.title
     if card_in.description is not None:
         card.description = card_in.description
     if card_in.position is not None:
         card.position = card_in.position
-    if card_in.list_id is not None:
-        card.list_id = card_in.list_id
+    if card_in.list_id is not None and card_in.list_id != card.list_id:
+        if shard_router is not None and shard_router.shard_for(
+            card_in.list_id
+        ) != shard_router.shard_for(card.board_id):
+            raise HTTPException(
+                status_code=400,
+                detail="Cannot move a card to a board on another shard",
+            )
+        target = queries.get_list(db, card_in.list_id)
+        if not target:
+            raise HTTPException(status_code=404, detail="List not found")
+        if target.board_id != card.board_id:
+            target_member = queries.get_membership(db, target.board_id, current_user.id)
+            if not target_member:
+                raise HTTPException(status_code=403, detail="Not authorized")
+        _count_cards(db, card.list_id, -1)
+        _count_cards(db, target.id, 1)
+        card.list_id = target.id
+        if target.board_id != card.board_id:
+            card.board_id = target.board_id
+            # Its id routes requests to its board's shard, so it takes one
+            # from the new board's bucket; its assignees follow both through
+            # their foreign key.
+            card.id = colocated_id(target.board_id)
     if card_in.label_ids is not None:
         card.label_ids = card_in.label_ids
 
+    if card.board_id != old_board_id:
+        board_snapshots.drop_card(db, old_board_id, old_id)
+    board_snapshots.put_card(db, card)
     db.commit()
-    db.refresh(card)
     return card
 
 
 @router.delete("/{card_id}", status_code=status.HTTP_204_NO_CONTENT)
+@transactional()
 def delete_card(
     card_id: UUID,
+    board_id: UUID | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    card = db.query(Card).filter(Card.id == card_id).first()
+    card = queries.get_card(db, card_id, board_id)
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
 
-    list_ = card.list
-    is_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == list_.board_id,
-            BoardMember.user_id == current_user.id,
-        )
+    is_member = queries.get_membership(db, card.board_id, current_user.id)
+    if not is_member:
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    card.deleted_at = datetime.now(UTC)
+    _count_cards(db, card.list_id, -1)
+    board_snapshots.drop_card(db, card.board_id, card.id)
+    db.commit()
+
+
+@router.post("/{card_id}/restore", response_model=CardOut)
+@transactional()
+def restore_card(
+    card_id: UUID,
+    board_id: UUID | None = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    card = (
+        _card_query(db, card_id, board_id)
+        .execution_options(**{INCLUDE_DELETED: True})
+        .filter(Card.deleted_at >= restorable_since())
         .first()
     )
+    if not card:
+        raise HTTPException(status_code=404, detail="Card not found")
+
+    list_ = queries.get_list(db, card.list_id)
+    if not list_:
+        raise HTTPException(status_code=404, detail="List not found")
+
+    is_member = queries.get_membership(db, list_.board_id, current_user.id)
     if not is_member:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    db.delete(card)
+    card.deleted_at = None
+    _count_cards(db, card.list_id, 1)
+    board_snapshots.put_card(db, card)
     db.commit()
+    return card
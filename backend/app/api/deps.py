@@ -1,34 +1,250 @@
+import functools
+import math
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any, NamedTuple
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
 
+from app.core import queries
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.core.database import SessionLocal
+from app.core.database import (
+    AsyncSessionLocal,
+    SessionLocal,
+    async_db_router,
+    db_router,
+    shard_router,
+)
+from app.core.query_monitor import current_route
+from app.core.revocation import revoked_sessions
+from app.core.security import BOARD_TOKEN_TYPE, PERSONAL_TOKEN_PREFIX, hash_token
+from app.core.sharding import shard_key
+from app.core.transactions import TransactionConflictError, run_in_transaction
+from app.models.board import Board
 from app.models.board_member import BoardMember
 from app.models.card import Card
-from app.models.list import List
+from app.models.personal_access_token import PersonalAccessToken
 from app.models.user import User
 
 security = HTTPBearer()
 
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
 
-def get_db():
-    db = SessionLocal()
+# The Unix time of a client's last write, handed to it with the response and
+# sent back with its next requests, so they read from the primary until the
+# replicas have caught up. A cookie for browsers; other clients may echo the
+# header instead.
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+
+
+class PersonalTokenInfo(NamedTuple):
+    id: UUID
+    user_id: UUID
+    scopes: frozenset[str]
+    expires_at: datetime | None
+
+
+class BoardAccess(NamedTuple):
+    board_id: UUID
+    user_id: UUID
+    role: str
+
+
+# Keyed by token digest, so plaintext tokens never sit in memory.
+personal_token_cache = TTLCache(
+    maxsize=settings.PAT_CACHE_SIZE, ttl=settings.PAT_CACHE_TTL_SECONDS
+)
+
+
+async def track_route(request: Request) -> None:
+    """Label this request's queries in the slow-query log. Async so the
+    context variable is set in the request's own context and inherited by
+    the sync dependencies and handler that run after it."""
+    # Put the parameter names back so the same route always logs the same
+    # label, whatever ids it was called with.
+    path = request.url.path
+    for name, value in request.path_params.items():
+        path = path.replace(str(value), f"{{{name}}}", 1)
+    current_route.set(f"{request.method} {path}")
+
+
+def last_write(request: Request) -> float | None:
+    """When the client last wrote, as it tells us, if it did."""
+    value = request.headers.get(LAST_WRITE_HEADER) or request.cookies.get(
+        LAST_WRITE_COOKIE
+    )
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def remember_writes(db: Session, response: Response) -> None:
+    """Hand the client its write time once ``db`` commits a write, on the
+    response the route is still building, so it goes out with that very
+    response. Commits that wrote nothing, such as the one ending the read
+    transaction before a retryable write begins (see
+    ``app.core.transactions``), leave the client free to read from replicas."""
+    wrote = False
+
+    def flushed(session: Session, _flush_context) -> None:
+        nonlocal wrote
+        wrote = True
+
+    def executed(state: ORMExecuteState) -> None:
+        nonlocal wrote
+        if state.is_insert or state.is_update or state.is_delete:
+            wrote = True
+
+    def forget(session: Session, previous_transaction) -> None:
+        nonlocal wrote
+        # A savepoint rolled back leaves the transaction's other writes.
+        if not previous_transaction.nested:
+            wrote = False
+
+    def mark(session: Session) -> None:
+        nonlocal wrote
+        if not wrote:
+            return
+        wrote = False
+        written_at = f"{time.time():.3f}"
+        if LAST_WRITE_HEADER not in response.headers:
+            response.set_cookie(
+                LAST_WRITE_COOKIE,
+                written_at,
+                max_age=math.ceil(settings.REPLICA_PIN_SECONDS),
+                httponly=True,
+                samesite="lax",
+            )
+        response.headers[LAST_WRITE_HEADER] = written_at
+
+    event.listen(db, "after_flush", flushed)
+    event.listen(db, "do_orm_execute", executed)
+    event.listen(db, "after_soft_rollback", forget)
+    event.listen(db, "after_commit", mark)
+
+
+def get_db(request: Request, response: Response):
+    """Session bound to a replica for reads, to the primary otherwise. With
+    sharding, board data goes to the shard of the board the request names."""
+    read_only = request.method in SAFE_METHODS
+    written_at = last_write(request) if read_only else None
+    if shard_router is None:
+        db = SessionLocal(bind=db_router.engine_for(read_only, written_at))
+    else:
+        key = shard_key({**request.query_params, **request.path_params})
+        db = shard_router.session(read_only, written_at, key)
+    if not read_only and db_router.replicas:
+        remember_writes(db, response)
     try:
         yield db
     finally:
         db.close()
 
 
+def transactional(isolation_level: str | None = None) -> Callable:
+    """Run a write route through ``run_in_transaction``: retried on deadlocks
+    and serialization failures, answered with a 409 once retries run out.
+    The route must take its session as ``db``."""
+
+    def decorate(endpoint: Callable) -> Callable:
+        @functools.wraps(endpoint)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return run_in_transaction(
+                    kwargs["db"],
+                    lambda: endpoint(*args, **kwargs),
+                    name=endpoint.__name__,
+                    isolation_level=isolation_level,
+                )
+            except TransactionConflictError as err:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Conflicting concurrent update, please retry",
+                ) from err
+
+        return wrapper
+
+    return decorate
+
+
+async def get_async_db(request: Request, response: Response):
+    read_only = request.method in SAFE_METHODS
+    written_at = last_write(request) if read_only else None
+    async with AsyncSessionLocal(
+        bind=async_db_router.engine_for(read_only, written_at)
+    ) as db:
+        if not read_only and async_db_router.replicas:
+            remember_writes(db.sync_session, response)
+        yield db
+
+
+def lookup_personal_token(token: str, db: Session) -> PersonalTokenInfo | None:
+    digest = hash_token(token)
+    info = personal_token_cache.get(digest)
+    if info is not None:
+        return info
+
+    row = (
+        db.query(
+            PersonalAccessToken.id,
+            PersonalAccessToken.user_id,
+            PersonalAccessToken.scopes,
+            PersonalAccessToken.expires_at,
+        )
+        .filter(PersonalAccessToken.token_hash == digest)
+        .first()
+    )
+    if row is None:
+        return None
+
+    info = PersonalTokenInfo(
+        id=row.id,
+        user_id=row.user_id,
+        scopes=frozenset(row.scopes.split()),
+        expires_at=row.expires_at,
+    )
+    personal_token_cache.set(digest, info)
+    return info
+
+
+def _load_user(db: Session, user_id) -> User:
+    user = queries.get_user(db, user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found",
+        )
+
+    return user
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
     token = credentials.credentials
 
+    if token.startswith(PERSONAL_TOKEN_PREFIX):
+        info = lookup_personal_token(token, db)
+        if info is None or (
+            info.expires_at is not None and info.expires_at <= datetime.now(UTC)
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token",
+            )
+        return _load_user(db, info.user_id)
+
     try:
         payload = jwt.decode(
             token,
@@ -36,7 +252,9 @@ def get_current_user(
             algorithms=[settings.JWT_ALGORITHM],
         )
         user_id: str | None = payload.get("sub")
-        if user_id is None:
+        # Board-scoped tokens only authorize reads on their board, see
+        # authorize_board_read.
+        if user_id is None or payload.get("typ") == BOARD_TOKEN_TYPE:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token",
@@ -47,14 +265,130 @@ def get_current_user(
             detail="Invalid token",
         ) from err
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    session_id: str | None = payload.get("sid")
+    if session_id is not None:
+        revoked_sessions.reload_if_stale(db)
+        if revoked_sessions.is_revoked(session_id):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token revoked",
+            )
+
+    return _load_user(db, user_id)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """``get_current_user`` for async handlers. The sync logic runs through
+    ``run_sync``, which awaits the driver instead of blocking a thread."""
+    return await db.run_sync(
+        lambda session: get_current_user(credentials=credentials, db=session)
+    )
+
+
+def _decode_board_token(token: str) -> dict | None:
+    if token.startswith(PERSONAL_TOKEN_PREFIX):
+        return None
+    try:
+        payload = jwt.decode(
+            token,
+            settings.JWT_SECRET,
+            algorithms=[settings.JWT_ALGORITHM],
+        )
+    except JWTError:
+        return None
+    if payload.get("typ") != BOARD_TOKEN_TYPE:
+        return None
+    return payload
+
+
+def authorize_board_read(
+    board_id: UUID,
+    credentials: HTTPAuthorizationCredentials,
+    db: Session,
+) -> BoardAccess:
+    """Authorize a read on ``board_id``.
+
+    A board-scoped token is trusted for its role claim and only checked
+    against the board's membership epoch, so no ``BoardMember`` query is
+    made. Any other credential goes through ``get_current_user`` and a
+    membership lookup.
+    """
+    claims = _decode_board_token(credentials.credentials)
+    if claims is None:
+        current_user = get_current_user(credentials=credentials, db=db)
+        member = queries.get_membership(db, board_id, current_user.id)
+        if not member:
+            raise HTTPException(status_code=403, detail="Not authorized")
+        return BoardAccess(board_id, current_user.id, member.role)
+
+    if claims.get("bid") != str(board_id):
+        raise HTTPException(status_code=403, detail="Token not valid for this board")
+
+    epoch = db.query(Board.membership_epoch).filter(Board.id == board_id).scalar()
+    if epoch is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+    if epoch != claims.get("epoch"):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            detail="Token revoked",
         )
 
-    return user
+    return BoardAccess(board_id, UUID(claims["sub"]), claims["role"])
+
+
+async def authorize_board_read_async(
+    board_id: UUID,
+    credentials: HTTPAuthorizationCredentials,
+    db: AsyncSession,
+) -> BoardAccess:
+    return await db.run_sync(
+        lambda session: authorize_board_read(board_id, credentials, session)
+    )
+
+
+def _personal_token(request: Request) -> str | None:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token.startswith(PERSONAL_TOKEN_PREFIX):
+        return None
+    return token
+
+
+def _check_scope(request: Request, info: PersonalTokenInfo | None) -> None:
+    if info is None:
+        return
+
+    required = "read" if request.method in SAFE_METHODS else "write"
+    if required not in info.scopes:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Token lacks the '{required}' scope",
+        )
+
+
+def enforce_token_scope(request: Request, db: Session = Depends(get_db)) -> None:
+    """Reject writes made with a read-only personal access token.
+
+    JWTs carry no scopes and pass through; authentication itself is left to
+    ``get_current_user``.
+    """
+    token = _personal_token(request)
+    if token is not None:
+        _check_scope(request, lookup_personal_token(token, db))
+
+
+async def enforce_token_scope_async(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> None:
+    """``enforce_token_scope`` for async routers: the lookup shares the
+    handler's async session instead of opening a sync one on a worker
+    thread."""
+    token = _personal_token(request)
+    if token is not None:
+        info = await db.run_sync(lambda session: lookup_personal_token(token, session))
+        _check_scope(request, info)
 
 
 def get_board_member(
@@ -62,14 +396,7 @@ def get_board_member(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> BoardMember:
-    member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == board_id,
-            BoardMember.user_id == current_user.id,
-        )
-        .first()
-    )
+    member = queries.get_membership(db, board_id, current_user.id)
 
     if not member:
         raise HTTPException(
@@ -85,17 +412,9 @@ def require_board_owner(
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ) -> BoardMember:
-    member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == board_id,
-            BoardMember.user_id == current_user.id,
-            BoardMember.role == "owner",
-        )
-        .first()
-    )
+    member = queries.get_membership(db, board_id, current_user.id)
 
-    if not member:
+    if not member or member.role != "owner":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only board owner can perform this action",
@@ -106,26 +425,16 @@ def require_board_owner(
 
 def require_card_board_member(
     card_id: UUID,
+    board_id: UUID | None = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> tuple[Card, UUID]:
-    card = db.query(Card).filter(Card.id == card_id).first()
+    card = queries.get_card(db, card_id, board_id)
     if not card:
         raise HTTPException(status_code=404, detail="Card not found")
 
-    list_ = db.query(List).filter(List.id == card.list_id).first()
-    if not list_:
-        raise HTTPException(status_code=404, detail="List not found")
-
-    member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == list_.board_id,
-            BoardMember.user_id == current_user.id,
-        )
-        .first()
-    )
+    member = queries.get_membership(db, card.board_id, current_user.id)
     if not member:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    return card, list_.board_id
+    return card, card.board_id
@@ -0,0 +1,80 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user, get_db, require_board_owner, transactional
+from app.core.config import settings
+from app.core.database import dialect_insert
+from app.core.security import create_invitation_token, verify_invitation_token
+from app.core.sharding import route_to_board
+from app.models.board import Board
+from app.models.board_member import BoardMember
+from app.models.user import User
+from app.schemas.invitation import BoardInvitationCreate, BoardInvitationOut
+
+router = APIRouter(tags=["Invitations"])
+
+
+@router.post(
+    "/boards/{board_id}/invitations",
+    response_model=BoardInvitationOut,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_invitation(
+    board_id: UUID,
+    payload: BoardInvitationCreate,
+    _: BoardMember = Depends(require_board_owner),
+):
+    hours = payload.expires_in_hours or settings.INVITATION_EXPIRE_HOURS
+    expires_at = datetime.now(UTC) + timedelta(hours=hours)
+
+    return {
+        "token": create_invitation_token(board_id, payload.role, expires_at),
+        "board_id": board_id,
+        "role": payload.role,
+        "expires_at": expires_at,
+    }
+
+
+@router.post("/invitations/{token}/accept")
+@transactional()
+def accept_invitation(
+    token: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    invitation = verify_invitation_token(token)
+    if invitation is None:
+        raise HTTPException(status_code=400, detail="Invalid or expired invitation")
+    board_id, role = invitation
+    route_to_board(db, board_id)
+
+    # The foreign key only catches boards that are gone for good; one in the
+    # trash keeps its row.
+    board = (
+        db.query(Board.id)
+        .filter(Board.id == board_id, Board.deleted_at.is_(None))
+        .first()
+    )
+    if board is None:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    # An upsert: redeeming twice is a no-op.
+    stmt = (
+        dialect_insert(db, BoardMember)
+        .values(board_id=board_id, user_id=current_user.id, role=role)
+        .on_conflict_do_nothing(
+            index_elements=[BoardMember.board_id, BoardMember.user_id]
+        )
+    )
+    try:
+        db.execute(stmt)
+        db.commit()
+    except IntegrityError as err:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Board not found") from err
+
+    return {"detail": "Invitation accepted", "board_id": board_id}
@@ -1,10 +1,22 @@
+from datetime import UTC, datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import update
 from sqlalchemy.orm import Session
-
-from app.api.deps import get_current_user, get_db
-from app.models.board_member import BoardMember
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.api.deps import (
+    authorize_board_read,
+    get_current_user,
+    get_db,
+    security,
+    transactional,
+)
+from app.core import board_snapshots, queries
+from app.core.soft_delete import INCLUDE_DELETED, restorable_since
+from app.models.card import Card
 from app.models.list import List
 from app.models.user import User
 from app.schemas.list import ListCreate, ListOut, ListUpdate
@@ -16,18 +28,9 @@ router = APIRouter(prefix="/lists", tags=["Lists"])
 def get_lists(
     board_id: UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
-    is_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == board_id, BoardMember.user_id == current_user.id
-        )
-        .first()
-    )
-
-    if not is_member:
-        raise HTTPException(status_code=403, detail="Not a board member")
+    authorize_board_read(board_id, credentials, db)
 
     return (
         db.query(List).filter(List.board_id == board_id).order_by(List.position).all()
@@ -35,19 +38,16 @@ def get_lists(
 
 
 @router.post("/", response_model=ListOut, status_code=status.HTTP_201_CREATED)
+# Two creates that read the same last position and each insert a row update
+# nothing in common: only SERIALIZABLE sees the conflict, and one is retried.
+@transactional("SERIALIZABLE")
 def create_list(
     list_in: ListCreate,
     board_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    is_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == board_id, BoardMember.user_id == current_user.id
-        )
-        .first()
-    )
+    is_member = queries.get_membership(db, board_id, current_user.id)
 
     if not is_member:
         raise HTTPException(status_code=403, detail="Not authorized")
@@ -68,31 +68,26 @@ def create_list(
     )
 
     db.add(new_list)
+    board_snapshots.put_list(db, new_list)
     db.commit()
-    db.refresh(new_list)
 
     return new_list
 
 
 @router.put("/{list_id}", response_model=ListOut)
+@transactional("REPEATABLE READ")
 def update_list(
     list_id: UUID,
     list_in: ListUpdate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    lst = db.query(List).filter(List.id == list_id).first()
+    lst = queries.get_list(db, list_id)
 
     if not lst:
         raise HTTPException(status_code=404, detail="List not found")
 
-    is_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == lst.board_id, BoardMember.user_id == current_user.id
-        )
-        .first()
-    )
+    is_member = queries.get_membership(db, lst.board_id, current_user.id)
 
     if not is_member:
         raise HTTPException(status_code=403, detail="Not authorized")
@@ -103,33 +98,86 @@ def update_list(
     if list_in.position is not None:
         lst.position = list_in.position
 
+    board_snapshots.put_list(db, lst)
     db.commit()
-    db.refresh(lst)
 
     return lst
 
 
 @router.delete("/{list_id}", status_code=status.HTTP_204_NO_CONTENT)
+@transactional()
 def delete_list(
     list_id: UUID,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    lst = db.query(List).filter(List.id == list_id).first()
+    lst = queries.get_list(db, list_id)
 
     if not lst:
         raise HTTPException(status_code=404, detail="List not found")
 
-    is_member = (
-        db.query(BoardMember)
-        .filter(
-            BoardMember.board_id == lst.board_id, BoardMember.user_id == current_user.id
-        )
+    is_member = queries.get_membership(db, lst.board_id, current_user.id)
+
+    if not is_member:
+        raise HTTPException(status_code=403, detail="Not authorized")
+
+    # Its cards are stamped with the same time, so card lookups need not
+    # check the list and restore_list knows which cards to bring back.
+    now = datetime.now(UTC)
+    lst.deleted_at = now
+    lst.card_count = 0
+    db.query(Card).filter(
+        Card.board_id == lst.board_id,
+        Card.list_id == lst.id,
+        Card.deleted_at.is_(None),
+    ).update({Card.deleted_at: now}, synchronize_session=False)
+    board_snapshots.drop_list(db, lst.board_id, lst.id)
+    db.commit()
+
+
+@router.post("/{list_id}/restore", response_model=ListOut)
+@transactional()
+def restore_list(
+    list_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    lst = (
+        db.query(List)
+        .execution_options(**{INCLUDE_DELETED: True})
+        .filter(List.id == list_id, List.deleted_at >= restorable_since())
         .first()
     )
 
+    if not lst:
+        raise HTTPException(status_code=404, detail="List not found")
+
+    is_member = queries.get_membership(db, lst.board_id, current_user.id)
+
     if not is_member:
         raise HTTPException(status_code=403, detail="Not authorized")
 
-    db.delete(lst)
+    restored = (
+        db.query(Card)
+        .filter(
+            Card.board_id == lst.board_id,
+            Card.list_id == lst.id,
+            Card.deleted_at == lst.deleted_at,
+        )
+        .update({Card.deleted_at: None}, synchronize_session=False)
+    )
+    # One UPDATE, as in cards._count_cards, and the count it wrote kept on
+    # the instance, so the response needs no reload.
+    card_count = db.execute(
+        update(List)
+        .where(List.id == lst.id)
+        .values(card_count=List.card_count + restored)
+        .returning(List.card_count)
+        .execution_options(synchronize_session=False)
+    ).scalar_one()
+    set_committed_value(lst, "card_count", card_count)
+    lst.deleted_at = None
+    board_snapshots.put_list(db, lst, with_cards=True)
     db.commit()
+
+    return lst
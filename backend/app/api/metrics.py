@@ -0,0 +1,59 @@
+import hmac
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from app.core.config import settings
+from app.core.database import (
+    async_engine,
+    async_replica_engines,
+    engine,
+    replica_engines,
+)
+from app.core.transactions import transaction_metrics
+
+
+def require_metrics_token(request: Request) -> None:
+    """Only operators see these statistics: the caller must present
+    ``METRICS_TOKEN`` as a bearer token, and without one configured the
+    endpoints do not exist."""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(
+        token.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid metrics token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+    dependencies=[Depends(require_metrics_token)],
+)
+
+
+@router.get("/db-pool")
+def db_pool_metrics():
+    """Live connection pool statistics for this worker process."""
+    engines = {"sync": engine, "async": async_engine}
+    engines.update((f"replica-{i}", eng) for i, eng in enumerate(replica_engines))
+    engines.update(
+        (f"async-replica-{i}", eng) for i, eng in enumerate(async_replica_engines)
+    )
+    return {
+        name: eng.pool.metrics.snapshot(eng.pool)
+        for name, eng in engines.items()
+        if eng is not None
+    }
+
+
+@router.get("/transactions")
+def transaction_metrics_snapshot():
+    """Write transactions retried after a deadlock or serialization failure,
+    and those given up on with a 409, for this worker process."""
+    return transaction_metrics.snapshot()
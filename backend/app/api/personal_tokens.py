@@ -0,0 +1,86 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user, get_db, personal_token_cache, transactional
+from app.core.security import generate_personal_token, hash_token
+from app.models.personal_access_token import PersonalAccessToken
+from app.models.user import User
+from app.schemas.personal_access_token import (
+    PersonalAccessTokenCreate,
+    PersonalAccessTokenCreated,
+    PersonalAccessTokenOut,
+)
+
+router = APIRouter(prefix="/users/me/tokens", tags=["Personal Access Tokens"])
+
+
+@router.post(
+    "/",
+    response_model=PersonalAccessTokenCreated,
+    status_code=status.HTTP_201_CREATED,
+)
+@transactional()
+def create_token(
+    payload: PersonalAccessTokenCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    token = generate_personal_token()
+    expires_at = (
+        datetime.now(UTC) + timedelta(days=payload.expires_in_days)
+        if payload.expires_in_days is not None
+        else None
+    )
+
+    pat = PersonalAccessToken(
+        user_id=current_user.id,
+        name=payload.name,
+        token_hash=hash_token(token),
+        scopes=" ".join(sorted(set(payload.scopes))),
+        expires_at=expires_at,
+    )
+    db.add(pat)
+    db.commit()
+
+    return PersonalAccessTokenCreated(
+        **PersonalAccessTokenOut.model_validate(pat).model_dump(), token=token
+    )
+
+
+@router.get("/", response_model=list[PersonalAccessTokenOut])
+def list_tokens(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    return (
+        db.query(PersonalAccessToken)
+        .filter(PersonalAccessToken.user_id == current_user.id)
+        .order_by(PersonalAccessToken.created_at)
+        .all()
+    )
+
+
+@router.delete("/{token_id}", status_code=status.HTTP_204_NO_CONTENT)
+@transactional()
+def revoke_token(
+    token_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    pat = (
+        db.query(PersonalAccessToken)
+        .filter(
+            PersonalAccessToken.id == token_id,
+            PersonalAccessToken.user_id == current_user.id,
+        )
+        .first()
+    )
+    if not pat:
+        raise HTTPException(status_code=404, detail="Token not found")
+
+    personal_token_cache.pop(pat.token_hash)
+    db.delete(pat)
+    db.commit()
@@ -1,18 +1,40 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.api.async_boards import router as async_boards_router
+from app.api.async_cards import router as async_cards_router
+from app.api.async_lists import router as async_lists_router
 from app.api.auth import router as auth_router
 from app.api.board_members import router as board_members_router
 from app.api.boards import router as boards_router
 from app.api.card_members import router as card_members_router
 from app.api.cards import router as cards_router
+from app.api.deps import enforce_token_scope, enforce_token_scope_async, track_route
+from app.api.invitations import router as invitations_router
 from app.api.lists import router as lists_router
+from app.api.metrics import router as metrics_router
+from app.api.personal_tokens import router as personal_tokens_router
 from app.api.users import router as users_router
+from app.core.config import settings
 
-api_router = APIRouter(prefix="/api")
-api_router.include_router(auth_router)
-api_router.include_router(users_router)
-api_router.include_router(boards_router)
-api_router.include_router(lists_router)
-api_router.include_router(cards_router)
-api_router.include_router(board_members_router)
-api_router.include_router(card_members_router)
+async_reads_router = APIRouter(dependencies=[Depends(enforce_token_scope_async)])
+async_reads_router.include_router(async_boards_router)
+async_reads_router.include_router(async_lists_router)
+async_reads_router.include_router(async_cards_router)
+
+sync_router = APIRouter(dependencies=[Depends(enforce_token_scope)])
+sync_router.include_router(auth_router)
+sync_router.include_router(users_router)
+sync_router.include_router(personal_tokens_router)
+sync_router.include_router(boards_router)
+sync_router.include_router(lists_router)
+sync_router.include_router(cards_router)
+sync_router.include_router(board_members_router)
+sync_router.include_router(invitations_router)
+sync_router.include_router(card_members_router)
+sync_router.include_router(metrics_router)
+
+api_router = APIRouter(prefix="/api", dependencies=[Depends(track_route)])
+if settings.DATABASE_ASYNC:
+    # Routes match in registration order, so these shadow their sync twins.
+    api_router.include_router(async_reads_router)
+api_router.include_router(sync_router)
@@ -0,0 +1,96 @@
+"""Benchmark password hashing on this host and recommend a cost.
+
+Usage::
+
+    python -m app.commands.calibrate_hashing --target-ms 250
+
+The recommended value goes into ``PASSWORD_HASH_ROUNDS``. Existing hashes are
+upgraded (or downgraded) to the new cost on the next successful login.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+
+from app.core.config import settings
+from app.core.security import build_pwd_context
+
+# Cost bounds accepted by passlib for the schemes we care about.
+ROUNDS_RANGES = {
+    "bcrypt": (4, 16),
+    "sha256_crypt": (1000, 1_000_000),
+    "sha512_crypt": (1000, 1_000_000),
+    "pbkdf2_sha256": (1000, 1_000_000),
+}
+
+
+def measure_hash_ms(scheme: str, rounds: int, samples: int = 3) -> float:
+    """Return the best-of-``samples`` hashing time in milliseconds."""
+    context = build_pwd_context(scheme, rounds)
+    best = float("inf")
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.hash("calibration-password")
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def recommend_rounds(
+    scheme: str,
+    target_ms: float,
+    measure: Callable[[str, int], float] = measure_hash_ms,
+) -> tuple[int, list[tuple[int, float]]]:
+    """Return the highest cost whose hashing time stays under ``target_ms``,
+    with the measurements taken to get there.
+
+    bcrypt cost is logarithmic, so it is walked one step at a time; the other
+    schemes are linear in ``rounds`` and are extrapolated from one sample.
+    """
+    low, high = ROUNDS_RANGES.get(scheme, ROUNDS_RANGES["bcrypt"])
+    samples: list[tuple[int, float]] = []
+
+    if scheme == "bcrypt":
+        best = low
+        for rounds in range(low, high + 1):
+            elapsed = measure(scheme, rounds)
+            samples.append((rounds, elapsed))
+            if elapsed > target_ms:
+                break
+            best = rounds
+        return best, samples
+
+    elapsed = measure(scheme, low)
+    samples.append((low, elapsed))
+    per_round = elapsed / low
+    best = int(target_ms / per_round) if per_round else high
+    return max(low, min(high, best)), samples
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--scheme",
+        default=settings.PASSWORD_HASH_SCHEME,
+        choices=sorted(ROUNDS_RANGES),
+    )
+    parser.add_argument(
+        "--target-ms",
+        type=float,
+        default=250.0,
+        help="Acceptable hashing latency per login, in milliseconds.",
+    )
+    args = parser.parse_args(argv)
+
+    rounds, samples = recommend_rounds(args.scheme, args.target_ms)
+    for sample_rounds, elapsed in samples:
+        sys.stdout.write(f"{args.scheme} rounds={sample_rounds}: {elapsed:.1f} ms\n")
+    sys.stdout.write(
+        f"\nRecommended: PASSWORD_HASH_SCHEME={args.scheme} "
+        f"PASSWORD_HASH_ROUNDS={rounds}\n"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
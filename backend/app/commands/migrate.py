@@ -0,0 +1,163 @@
+"""Bring the database schema up to date.
+
+Usage::
+
+    python -m app.commands.migrate [--no-wait]
+
+Postgres runs the Alembic migrations. Replicas starting together all call
+this: the first takes a Postgres advisory lock and migrates, the others wait
+for it and then find nothing left to do, or with ``--no-wait`` skip at once.
+Indexes are built concurrently (see ``migrations/env.py``). A fresh embedded SQLite database is
+created from the models and stamped at head instead, because the existing
+migrations ALTER constraints in ways SQLite cannot; migrations added later
+run on SQLite in batch mode (see ``migrations/env.py``).
+
+Every database in ``DATABASE_SHARD_URLS`` is migrated after the global one.
+Shards hold the same schema minus the foreign keys into the global tables,
+whose rows live in another database (see ``app.core.sharding``).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.pool import NullPool
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+import app.models  # noqa: F401  (registers every table on Base.metadata)
+from app.core.config import settings
+from app.core.database import Base, shard_urls
+from app.core.sharding import GLOBAL_TABLES
+from app.core.sqlite import configure_sqlite_engine
+from app.models.partitioning import is_board_partition
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# Key of the advisory lock held while migrating; any constant shared by all
+# replicas would do. Advisory locks are per database, so shards migrate in
+# parallel.
+MIGRATION_LOCK_KEY = 0x45504954524C  # "EPITRL"
+MIGRATION_LOCK_POLL_SECONDS = 1.0
+
+
+def migrate(url: str | None = None, shard: bool = False, wait: bool = True) -> str:
+    """Upgrade the database at ``url`` to head and return what was done:
+    ``"created"`` for a fresh SQLite database, ``"upgraded"`` otherwise, or
+    ``"skipped"`` when ``wait`` is false and another process is migrating.
+    ``shard`` marks a board shard."""
+    engine = create_engine(url or settings.DATABASE_URL, poolclass=NullPool)
+    if engine.dialect.name == "sqlite":
+        configure_sqlite_engine(engine)
+        # Migrations rebuild tables by copying them; dropping the old copy
+        # must not cascade. Checked again with foreign_key_check below.
+        event.listen(engine, "connect", _disable_foreign_keys)
+    config = Config(str(ALEMBIC_INI))
+    try:
+        with engine.connect() as connection:
+            config.attributes["connection"] = connection
+            if engine.dialect.name == "postgresql":
+                if not _lock(connection, wait):
+                    return "skipped"
+            elif not inspect(connection).has_table("alembic_version"):
+                _create_schema(connection, shard)
+                command.stamp(config, "head")
+                connection.commit()
+                return "created"
+            # On Postgres no transaction is open here, so Alembic runs one
+            # per migration and can step out of it for concurrent index
+            # builds. On SQLite everything runs in the transaction above.
+            command.upgrade(config, "head")
+            if shard:
+                _drop_global_foreign_keys(connection)
+            if engine.dialect.name == "sqlite":
+                violations = connection.exec_driver_sql("PRAGMA foreign_key_check")
+                if violations.first() is not None:
+                    raise RuntimeError("Migration left foreign key violations")
+            connection.commit()
+            return "upgraded"
+    finally:
+        engine.dispose()
+
+
+def _lock(connection, wait: bool) -> bool:
+    """Take the migration lock for the rest of the session, closed with the
+    connection; return False if ``wait`` is false and it is taken.
+
+    Waiters poll rather than block in ``pg_advisory_lock``: a concurrent
+    index build waits for every open transaction to end, including one
+    blocked on the lock, which would deadlock with the migrating process.
+    """
+    while True:
+        locked = connection.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY}
+        ).scalar()
+        connection.commit()
+        if locked or not wait:
+            return locked
+        time.sleep(MIGRATION_LOCK_POLL_SECONDS)
+
+
+def _create_schema(connection, shard: bool) -> None:
+    if not shard:
+        Base.metadata.create_all(connection)
+        return
+    for table in Base.metadata.sorted_tables:
+        local_keys = [
+            key
+            for key in table.foreign_key_constraints
+            if key.referred_table.name not in GLOBAL_TABLES
+        ]
+        connection.execute(
+            CreateTable(table, include_foreign_key_constraints=local_keys)
+        )
+        for index in table.indexes:
+            connection.execute(CreateIndex(index))
+
+
+def _drop_global_foreign_keys(connection) -> None:
+    """Drop the foreign keys migrations create from board tables into the
+    global ones. SQLite shards are created without them."""
+    if connection.dialect.name == "sqlite":
+        return
+    inspector = inspect(connection)
+    for table in inspector.get_table_names():
+        # Partitions inherit their parent's keys, dropped with them.
+        if table in GLOBAL_TABLES or is_board_partition(table):
+            continue
+        for key in inspector.get_foreign_keys(table):
+            if key["referred_table"] in GLOBAL_TABLES:
+                connection.exec_driver_sql(
+                    f'ALTER TABLE "{table}" DROP CONSTRAINT "{key["name"]}"'
+                )
+
+
+def _disable_foreign_keys(dbapi_connection, _connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=OFF")
+    cursor.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--no-wait",
+        dest="wait",
+        action="store_false",
+        help="skip instead of waiting when another process is migrating",
+    )
+    args = parser.parse_args(argv)
+
+    outcome = migrate(wait=args.wait)
+    sys.stdout.write(f"Database schema {outcome}.\n")
+    for index, url in enumerate(shard_urls):
+        outcome = migrate(url, shard=True, wait=args.wait)
+        sys.stdout.write(f"Shard {index} schema {outcome}.\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
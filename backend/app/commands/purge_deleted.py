@@ -0,0 +1,150 @@
+"""Hard-delete boards, lists and cards soft-deleted past the retention window,
+and expired refresh tokens.
+
+Usage::
+
+    python -m app.commands.purge_deleted          # one pass
+    python -m app.commands.purge_deleted --loop   # run as a background worker
+
+Rows are removed ``PURGE_BATCH_SIZE`` at a time, each batch in its own short
+transaction followed by a ``PURGE_BATCH_PAUSE_SECONDS`` pause, so purging a
+huge board never holds many locks for long. Cards go before their lists and
+lists before their boards, leaving the final cascades almost nothing to do.
+With ``DATABASE_SHARD_URLS`` set, every shard is purged in turn. Refresh
+tokens, kept in ``DATABASE_URL``, are deleted the same way once expired.
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine, shard_router
+from app.core.soft_delete import INCLUDE_DELETED, restorable_since
+from app.core.sqlite import immediate_writes
+from app.models.board import Board
+from app.models.card import Card
+from app.models.list import List
+from app.models.refresh_token import RefreshToken
+
+
+def _delete_in_batches(
+    db: Session,
+    model,
+    condition,
+    batch_size: int,
+    pause: float,
+    sleep: Callable[[float], None],
+) -> int:
+    deleted = 0
+    while True:
+        batch = select(model.id).where(condition).limit(batch_size)
+        result = db.execute(
+            delete(model).where(model.id.in_(batch)),
+            execution_options={"synchronize_session": False, INCLUDE_DELETED: True},
+        )
+        db.commit()
+        deleted += result.rowcount
+        if result.rowcount < batch_size:
+            return deleted
+        sleep(pause)
+
+
+def purge_deleted(
+    db: Session,
+    before: datetime | None = None,
+    batch_size: int | None = None,
+    pause: float | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> dict[str, int]:
+    """Purge rows soft-deleted before ``before`` (default: the end of the
+    retention window) and return how many of each kind were removed."""
+    before = before or restorable_since()
+    batch_size = batch_size or settings.PURGE_BATCH_SIZE
+    pause = settings.PURGE_BATCH_PAUSE_SECONDS if pause is None else pause
+
+    expired_boards = select(Board.id).where(Board.deleted_at < before)
+    expired_lists = select(List.id).where(List.deleted_at < before)
+    conditions = {
+        "cards": (
+            Card,
+            or_(
+                Card.deleted_at < before,
+                Card.list_id.in_(expired_lists),
+                Card.board_id.in_(expired_boards),
+            ),
+        ),
+        "lists": (
+            List,
+            or_(List.deleted_at < before, List.board_id.in_(expired_boards)),
+        ),
+        "boards": (Board, Board.deleted_at < before),
+    }
+    return {
+        name: _delete_in_batches(db, model, condition, batch_size, pause, sleep)
+        for name, (model, condition) in conditions.items()
+    }
+
+
+def purge_expired_tokens(
+    db: Session,
+    now: datetime | None = None,
+    batch_size: int | None = None,
+    pause: float | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+) -> int:
+    """Delete refresh tokens past their expiry and return how many were
+    removed. Revoked ones stay while the revocation list still reads them."""
+    now = now or datetime.now(UTC)
+    batch_size = batch_size or settings.PURGE_BATCH_SIZE
+    pause = settings.PURGE_BATCH_PAUSE_SECONDS if pause is None else pause
+    forgotten = now - timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
+    condition = (RefreshToken.expires_at < now) & or_(
+        RefreshToken.revoked_at.is_(None), RefreshToken.revoked_at < forgotten
+    )
+    return _delete_in_batches(db, RefreshToken, condition, batch_size, pause, sleep)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="Keep purging every PURGE_INTERVAL_SECONDS instead of exiting.",
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.PURGE_BATCH_SIZE)
+    parser.add_argument(
+        "--pause", type=float, default=settings.PURGE_BATCH_PAUSE_SECONDS
+    )
+    args = parser.parse_args(argv)
+
+    engines = shard_router.shards if shard_router is not None else [engine]
+    while True:
+        for bind in engines:
+            db = SessionLocal(bind=immediate_writes(bind))
+            try:
+                counts = purge_deleted(db, batch_size=args.batch_size, pause=args.pause)
+            finally:
+                db.close()
+            summary = ", ".join(f"{count} {name}" for name, count in counts.items())
+            sys.stdout.write(f"Purged {summary}\n")
+        db = SessionLocal(bind=immediate_writes(engine))
+        try:
+            tokens = purge_expired_tokens(
+                db, batch_size=args.batch_size, pause=args.pause
+            )
+        finally:
+            db.close()
+        sys.stdout.write(f"Purged {tokens} expired refresh tokens\n")
+        if not args.loop:
+            return 0
+        time.sleep(settings.PURGE_INTERVAL_SECONDS)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Rebuild every board's snapshot from its lists, cards and assignees.
+
+Usage::
+
+    python -m app.commands.rebuild_snapshots
+
+Snapshot entries are written in the same transaction as every board write,
+so this builds the ones of boards not written to since snapshots were
+introduced and repairs drift from rows written around the API. Boards are
+walked ``PURGE_BATCH_SIZE`` at a time, each batch in its own short
+``REPEATABLE READ`` transaction, and only entries that are missing, wrong or
+left over are written or removed. With ``DATABASE_SHARD_URLS`` set, every
+shard is rebuilt in turn.
+"""
+
+import argparse
+import sys
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.board_snapshots import build_entries, drop_entries, put_entries
+from app.core.config import settings
+from app.core.database import SessionLocal, engine, shard_router
+from app.core.sqlite import immediate_writes
+from app.core.transactions import run_in_transaction
+from app.models.board import Board
+from app.models.board_snapshot import BoardSnapshotEntry
+
+FIELDS = ("kind", "list_id", "position", "document")
+
+
+def _stored(db: Session, board_ids: list[UUID]) -> dict[tuple, tuple]:
+    rows = db.execute(
+        select(
+            BoardSnapshotEntry.board_id,
+            BoardSnapshotEntry.entry_id,
+            *(getattr(BoardSnapshotEntry, field) for field in FIELDS),
+        ).where(BoardSnapshotEntry.board_id.in_(board_ids))
+    )
+    return {(row[0], row[1]): tuple(row[2:]) for row in rows}
+
+
+def _rebuild_batch(db: Session, board_ids: list[UUID]) -> int:
+    stored = _stored(db, board_ids)
+    written = 0
+    for board_id in board_ids:
+        entries = build_entries(db, board_id) or []
+        changed = [
+            entry
+            for entry in entries
+            if stored.pop((board_id, entry["entry_id"]), None)
+            != tuple(entry[field] for field in FIELDS)
+        ]
+        # What is left belongs to lists and cards that are gone.
+        stale = [entry_id for owner, entry_id in stored if owner == board_id]
+        if stale:
+            drop_entries(db, board_id, BoardSnapshotEntry.entry_id.in_(stale))
+        if changed or stale:
+            put_entries(db, changed)
+            written += 1
+    db.commit()
+    return written
+
+
+def rebuild_snapshots(db: Session, batch_size: int | None = None) -> int:
+    """Write missing or drifted snapshot entries and return how many boards
+    needed it."""
+    batch_size = batch_size or settings.PURGE_BATCH_SIZE
+    written = 0
+    after = None
+    while True:
+        ids = select(Board.id).order_by(Board.id).limit(batch_size)
+        if after is not None:
+            ids = ids.where(Board.id > after)
+        batch = db.execute(ids).scalars().all()
+        if not batch:
+            return written
+        # A write landing on an entry between the build and the update
+        # fails the batch to serialize, and the batch is built again.
+        written += run_in_transaction(
+            db,
+            lambda batch=batch: _rebuild_batch(db, batch),
+            name="rebuild_snapshots",
+            isolation_level="REPEATABLE READ",
+        )
+        after = batch[-1]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=settings.PURGE_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    engines = shard_router.shards if shard_router is not None else [engine]
+    for bind in engines:
+        db = SessionLocal(bind=immediate_writes(bind))
+        try:
+            written = rebuild_snapshots(db, batch_size=args.batch_size)
+        finally:
+            db.close()
+        sys.stdout.write(f"Rebuilt the snapshots of {written} boards\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
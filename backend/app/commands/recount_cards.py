@@ -0,0 +1,86 @@
+"""Recompute every list's card_count from the cards table.
+
+Usage::
+
+    python -m app.commands.recount_cards
+
+The counters are kept in the same transaction as every card change, so this
+only repairs drift from rows written around the API (manual fixes, restores
+from backup). Lists are fixed ``PURGE_BATCH_SIZE`` at a time, each batch in
+its own short transaction, and only counters that are actually wrong are
+written. With ``DATABASE_SHARD_URLS`` set, every shard is recounted in turn.
+"""
+
+import argparse
+import sys
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine, shard_router
+from app.core.soft_delete import INCLUDE_DELETED
+from app.core.sqlite import immediate_writes
+from app.models.card import Card
+from app.models.list import List
+
+
+def live_card_count():
+    """Correlated count of the live cards of the list being updated."""
+    return (
+        select(func.count())
+        .select_from(Card)
+        .where(
+            Card.board_id == List.board_id,
+            Card.list_id == List.id,
+            Card.deleted_at.is_(None),
+        )
+        .scalar_subquery()
+    )
+
+
+def recount_cards(db: Session, batch_size: int | None = None) -> int:
+    """Fix drifted counters and return how many lists were corrected."""
+    batch_size = batch_size or settings.PURGE_BATCH_SIZE
+    fixed = 0
+    after = None
+    while True:
+        # Walk lists by id so each batch is an index range scan.
+        ids = select(List.id).order_by(List.id).limit(batch_size)
+        if after is not None:
+            ids = ids.where(List.id > after)
+        batch = (
+            db.execute(ids, execution_options={INCLUDE_DELETED: True}).scalars().all()
+        )
+        if not batch:
+            return fixed
+        count = live_card_count()
+        result = db.execute(
+            update(List)
+            .where(List.id.in_(batch), List.card_count != count)
+            .values(card_count=count),
+            execution_options={"synchronize_session": False},
+        )
+        db.commit()
+        fixed += result.rowcount
+        after = batch[-1]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=settings.PURGE_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    engines = shard_router.shards if shard_router is not None else [engine]
+    for bind in engines:
+        db = SessionLocal(bind=immediate_writes(bind))
+        try:
+            fixed = recount_cards(db, batch_size=args.batch_size)
+        finally:
+            db.close()
+        sys.stdout.write(f"Fixed {fixed} list card counts\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""Keep each board's snapshot entries in step with its lists and cards.
+
+Opening a board used to take the board, its lists and one query per list of
+cards and assignees; the snapshot serves it from one range scan over the
+board's entries (``app.models.board_snapshot``): one for the board's own
+fields, one per live list and one per live card. Each entry holds its JSON
+already serialized, and the entries are joined into the response without
+being parsed. Every write route replaces or removes the entries of what it
+changed just before committing. Writes to different cards of a board touch
+different rows and never wait on each other, and no write re-serializes
+more than the one list or card it changed. A list's ``card_count`` is
+counted from its card entries on read.
+
+Assignees are kept as user ids: users may live in another database than the
+board, and their names are already on the board's member list.
+
+A board without a board entry (created before snapshots existed) is built
+from its rows on read; ``app.commands.rebuild_snapshots`` stores its entries.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import String, cast, delete, or_, select
+from sqlalchemy.orm import Session
+
+from app.core.database import dialect_insert
+from app.core.sharding import route_to_board
+from app.models.board import Board
+from app.models.board_snapshot import BoardSnapshotEntry
+from app.models.card import Card
+from app.models.card_member import CardMember
+from app.models.list import List
+from app.schemas.board import BoardOut, SnapshotCard
+from app.schemas.list import ListOut
+
+BOARD = "board"
+LIST = "list"
+CARD = "card"
+
+# Entries per INSERT, well under SQLite's limit on bound parameters.
+WRITE_BATCH_ENTRIES = 1000
+
+Entry = dict[str, Any]
+
+
+def _entry(
+    board_id: UUID,
+    entry_id: UUID,
+    kind: str,
+    document: str,
+    list_id: UUID | None = None,
+    position: int = 0,
+) -> Entry:
+    return {
+        "board_id": board_id,
+        "entry_id": entry_id,
+        "kind": kind,
+        "list_id": list_id,
+        "position": position,
+        "document": document,
+    }
+
+
+def _board_entry(board: Board) -> Entry:
+    document = BoardOut.model_validate(board).model_dump_json()
+    return _entry(board.id, board.id, BOARD, document)
+
+
+def _list_entry(lst: List) -> Entry:
+    # card_count is added on read, from the list's card entries.
+    document = ListOut.model_validate(lst).model_dump_json(exclude={"card_count"})
+    return _entry(lst.board_id, lst.id, LIST, document, position=lst.position)
+
+
+def _card_entry(card: Card, assignee_ids: list[UUID]) -> Entry:
+    snapshot_card = SnapshotCard.model_validate(card)
+    snapshot_card.assignee_ids = sorted(assignee_ids)
+    return _entry(
+        card.board_id,
+        card.id,
+        CARD,
+        snapshot_card.model_dump_json(),
+        list_id=card.list_id,
+        position=card.position,
+    )
+
+
+def _card_entries(db: Session, board_id: UUID, list_id: UUID | None) -> list[Entry]:
+    """Entries for the live cards of a list, or of the whole board."""
+    cards = db.query(Card).filter(Card.board_id == board_id)
+    members = db.query(CardMember.card_id, CardMember.user_id).filter(
+        CardMember.board_id == board_id
+    )
+    if list_id is not None:
+        cards = cards.filter(Card.list_id == list_id)
+        members = members.join(
+            Card, (Card.board_id == board_id) & (Card.id == CardMember.card_id)
+        ).filter(Card.list_id == list_id)
+    assignees: dict[UUID, list[UUID]] = {}
+    for card_id, user_id in members:
+        assignees.setdefault(card_id, []).append(user_id)
+    return [_card_entry(card, assignees.get(card.id, [])) for card in cards]
+
+
+def build_entries(db: Session, board_id: UUID) -> list[Entry] | None:
+    """The snapshot entries of ``board_id`` read from its rows, or None if
+    the board does not exist."""
+    board = db.query(Board).filter(Board.id == board_id).first()
+    if board is None:
+        return None
+    lists = db.query(List).filter(List.board_id == board_id)
+    return [
+        _board_entry(board),
+        *(_list_entry(lst) for lst in lists),
+        *_card_entries(db, board_id, None),
+    ]
+
+
+def _join(rows: Iterable[tuple[str, Any, Any, str]]) -> str | None:
+    """The snapshot document from ``(kind, entry_id, list_id, document)``
+    rows in position order, or None without a board entry."""
+    board = None
+    lists: list[tuple[Any, str]] = []
+    cards: dict[Any, list[str]] = {}
+    for kind, entry_id, list_id, document in rows:
+        if kind == BOARD:
+            board = document
+        elif kind == LIST:
+            lists.append((entry_id, document))
+        else:
+            cards.setdefault(list_id, []).append(document)
+    if board is None:
+        return None
+    # Every document is a JSON object: reopen it to append fields.
+    joined = []
+    for list_id, document in lists:
+        own = cards.get(list_id, [])
+        joined.append(
+            f'{document[:-1]},"card_count":{len(own)},"cards":[{",".join(own)}]}}'
+        )
+    return f'{board[:-1]},"lists":[{",".join(joined)}]}}'
+
+
+def build_document(db: Session, board_id: UUID) -> str | None:
+    """The snapshot of ``board_id`` built from its rows, or None if the board
+    does not exist."""
+    entries = build_entries(db, board_id)
+    if entries is None:
+        return None
+    entries.sort(key=lambda entry: (entry["position"], entry["entry_id"]))
+    return _join(
+        (entry["kind"], entry["entry_id"], entry["list_id"], entry["document"])
+        for entry in entries
+    )
+
+
+def read_document(db: Session, board_id: UUID) -> str | None:
+    """The snapshot of ``board_id`` as JSON text, or None if the board does
+    not exist."""
+    # Plain rows off the connection, and ids, only matched against each
+    # other, as text: ORM rows and UUID objects were most of the cost of
+    # reading a large board.
+    rows = db.connection().execute(
+        select(
+            BoardSnapshotEntry.kind,
+            cast(BoardSnapshotEntry.entry_id, String),
+            cast(BoardSnapshotEntry.list_id, String),
+            BoardSnapshotEntry.document,
+        )
+        .where(BoardSnapshotEntry.board_id == board_id)
+        .order_by(BoardSnapshotEntry.position, BoardSnapshotEntry.entry_id)
+    )
+    document = _join(rows)
+    if document is None:
+        # Boards created before snapshots existed.
+        return build_document(db, board_id)
+    return document
+
+
+def put_entries(db: Session, entries: list[Entry]) -> None:
+    """Insert ``entries``, replacing the ones already stored."""
+    for start in range(0, len(entries), WRITE_BATCH_ENTRIES):
+        insert = dialect_insert(db, BoardSnapshotEntry).values(
+            entries[start : start + WRITE_BATCH_ENTRIES]
+        )
+        db.execute(
+            insert.on_conflict_do_update(
+                index_elements=[
+                    BoardSnapshotEntry.board_id,
+                    BoardSnapshotEntry.entry_id,
+                ],
+                set_={
+                    "list_id": insert.excluded.list_id,
+                    "position": insert.excluded.position,
+                    "document": insert.excluded.document,
+                },
+            )
+        )
+
+
+def drop_entries(db: Session, board_id: UUID, *conditions) -> None:
+    """Delete the entries of ``board_id`` matching any of ``conditions``."""
+    db.execute(
+        delete(BoardSnapshotEntry).where(
+            BoardSnapshotEntry.board_id == board_id, or_(*conditions)
+        )
+    )
+
+
+def create_snapshot(db: Session, board: Board) -> None:
+    """Start the snapshot of a board that was just created."""
+    db.flush()
+    # Its id, minted by the flush, is the only route to its shard.
+    route_to_board(db, board.id)
+    put_entries(db, [_board_entry(board)])
+
+
+def put_board(db: Session, board: Board) -> None:
+    """Refresh the board's own fields."""
+    put_entries(db, [_board_entry(board)])
+
+
+def put_list(db: Session, lst: List, with_cards: bool = False) -> None:
+    """Refresh a created, updated or restored list. ``with_cards`` also
+    stores its live cards, for a list coming back from the trash."""
+    # The list, and the cards read with it, may not be flushed yet.
+    db.flush()
+    entries = [_list_entry(lst)]
+    if with_cards:
+        entries += _card_entries(db, lst.board_id, lst.id)
+    put_entries(db, entries)
+
+
+def drop_list(db: Session, board_id: UUID, list_id: UUID) -> None:
+    """Remove a deleted list and its cards."""
+    drop_entries(
+        db,
+        board_id,
+        BoardSnapshotEntry.entry_id == list_id,
+        BoardSnapshotEntry.list_id == list_id,
+    )
+
+
+def put_card(db: Session, card: Card) -> None:
+    """Refresh a created, updated, moved or restored card, or one whose
+    assignees changed."""
+    # Assignees just added or removed are read back.
+    db.flush()
+    assignee_ids = db.execute(
+        select(CardMember.user_id).where(
+            CardMember.board_id == card.board_id, CardMember.card_id == card.id
+        )
+    ).scalars()
+    put_entries(db, [_card_entry(card, list(assignee_ids))])
+
+
+def drop_card(db: Session, board_id: UUID, card_id: UUID) -> None:
+    """Remove a deleted card, or one moved to another board."""
+    drop_entries(db, board_id, BoardSnapshotEntry.entry_id == card_id)
@@ -1,9 +1,120 @@
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from app.core.config import settings
+from app.core.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    pool_options,
+    with_own_metrics,
+)
+from app.core.query_monitor import timeout_connect_args
+from app.core.replicas import ReplicaRouter
+from app.core.sharding import ShardRouter
+from app.core.sqlite import configure_sqlite_engine, immediate_writes
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def async_database_url(url: str) -> URL:
+    """Return ``url`` with its driver swapped for the asyncio one."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+
+def _create_engine(url, poolclass):
+    engine = create_engine(
+        url,
+        poolclass=poolclass,
+        connect_args=timeout_connect_args(url),
+        **pool_options(),
+    )
+    if engine.dialect.name == "sqlite":
+        configure_sqlite_engine(engine)
+    return engine
+
+
+def _create_async_engine(url, poolclass):
+    url = async_database_url(url)
+    engine = create_async_engine(
+        url,
+        poolclass=poolclass,
+        connect_args=timeout_connect_args(url),
+        **pool_options(),
+    )
+    if engine.dialect.name == "sqlite":
+        configure_sqlite_engine(engine.sync_engine)
+    return engine
+
+
+engine = _create_engine(settings.DATABASE_URL, InstrumentedQueuePool)
+# Committed objects keep their state: INSERTs and UPDATEs already know (or
+# RETURN, see eager_defaults) every column, so reloading them is a wasted
+# round trip. Sessions are per request, so nothing goes stale for long.
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+# Only built in async mode, so asyncpg stays optional otherwise.
+async_engine = (
+    _create_async_engine(settings.DATABASE_URL, InstrumentedAsyncQueuePool)
+    if settings.DATABASE_ASYNC
+    else None
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+replica_urls = [
+    url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",") if url.strip()
+]
+replica_engines = [
+    _create_engine(url, with_own_metrics(InstrumentedQueuePool)) for url in replica_urls
+]
+async_replica_engines = [
+    _create_async_engine(url, with_own_metrics(InstrumentedAsyncQueuePool))
+    for url in (replica_urls if settings.DATABASE_ASYNC else [])
+]
+db_router = ReplicaRouter(
+    engine,
+    replica_engines,
+    settings.REPLICA_PIN_SECONDS,
+    writer=immediate_writes(engine),
+)
+async_db_router = ReplicaRouter(
+    async_engine,
+    async_replica_engines,
+    settings.REPLICA_PIN_SECONDS,
+    writer=immediate_writes(async_engine),
+)
+
+shard_urls = [
+    url.strip() for url in settings.DATABASE_SHARD_URLS.split(",") if url.strip()
+]
+if shard_urls and settings.DATABASE_ASYNC:
+    raise RuntimeError("DATABASE_SHARD_URLS is not supported with DATABASE_ASYNC")
+shard_router = (
+    ShardRouter(
+        db_router,
+        [
+            _create_engine(url, with_own_metrics(InstrumentedQueuePool))
+            for url in shard_urls
+        ],
+    )
+    if shard_urls
+    else None
+)
 
 Base = declarative_base()
+
+
+def dialect_insert(db: Session, model):
+    """Return an INSERT for ``model`` built for the session's dialect, so
+    ``on_conflict_do_nothing`` is available on both Postgres and SQLite."""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
@@ -0,0 +1,82 @@
+import threading
+from bisect import bisect_left
+
+# Upper bounds, in seconds, for connection checkout waits.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """Cumulative histogram over fixed upper bounds, Prometheus style."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._counts[bisect_left(self.buckets, value)] += 1
+            self._sum += value
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative, running = {}, 0
+        for bound, count in zip((*self.buckets, "+Inf"), counts, strict=True):
+            running += count
+            cumulative[str(bound)] = running
+        return {"buckets": cumulative, "count": running, "sum": total}
+
+
+class PoolMetrics:
+    """Checkout wait times and timeouts for one connection pool."""
+
+    def __init__(self):
+        self.wait_seconds = Histogram(WAIT_BUCKETS)
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool) -> dict:
+        return {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            # QueuePool counts overflow from -size; only report real overflow.
+            "overflow": max(0, pool.overflow()),
+            "timeouts": self.timeouts,
+            "wait_seconds": self.wait_seconds.snapshot(),
+        }
+
+
+class TransactionMetrics:
+    """Retried and abandoned write transactions, per operation."""
+
+    def __init__(self):
+        self._counts: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _record(self, operation: str, outcome: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(operation, {"retries": 0, "give_ups": 0})
+            counts[outcome] += 1
+
+    def record_retry(self, operation: str) -> None:
+        self._record(operation, "retries")
+
+    def record_give_up(self, operation: str) -> None:
+        self._record(operation, "give_ups")
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            operations = {name: dict(counts) for name, counts in self._counts.items()}
+        return {
+            "retries": sum(counts["retries"] for counts in operations.values()),
+            "give_ups": sum(counts["give_ups"] for counts in operations.values()),
+            "operations": operations,
+        }
@@ -0,0 +1,51 @@
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.config import settings
+from app.core.metrics import PoolMetrics
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout and counts the ones that hit ``pool_timeout``.
+
+    ``metrics`` lives on the class because SQLAlchemy rebuilds pools (on
+    ``dispose`` and after a failover) without the creator's extra state.
+    """
+
+    metrics: PoolMetrics
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.wait_seconds.observe(time.perf_counter() - started)
+        return connection
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+
+def with_own_metrics(pool_class: type) -> type:
+    """Subclass ``pool_class`` with fresh metrics, one per extra engine."""
+    return type(pool_class.__name__, (pool_class,), {"metrics": PoolMetrics()})
+
+
+def pool_options() -> dict:
+    """``create_engine`` pool arguments from the ``DB_POOL_*`` settings."""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
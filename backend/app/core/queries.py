@@ -0,0 +1,89 @@
+"""Hot-path lookups as cached lambda statements.
+
+``lambda_stmt`` keys its cache on the lambda's code, so each call reuses the
+statement built, and compiled, the first time and only binds new parameter
+values, where ``db.query(...).filter(...)`` rebuilds the whole construct and
+its cache key on every request. See ``benchmarks/query_overhead.py``.
+
+Each lookup hides deleted rows itself and runs with ``FILTERS_DELETED``: the
+soft-delete hook's options, added to a lambda statement, would build and key
+a new statement on every call.
+"""
+
+from uuid import UUID
+
+from sqlalchemy import Select, lambda_stmt, select
+from sqlalchemy.orm import Session
+
+from app.core.soft_delete import FILTERS_DELETED
+from app.models.board import Board
+from app.models.board_member import BoardMember
+from app.models.card import Card
+from app.models.list import List
+from app.models.user import User
+from app.schemas.card import CardOut
+
+_FILTERED = {FILTERS_DELETED: True}
+
+
+def get_user(db: Session, user_id: UUID) -> User | None:
+    stmt = lambda_stmt(lambda: select(User).where(User.id == user_id))
+    return db.execute(stmt, execution_options=_FILTERED).scalars().first()
+
+
+def get_membership(db: Session, board_id: UUID, user_id: UUID) -> BoardMember | None:
+    stmt = lambda_stmt(
+        lambda: select(BoardMember).where(
+            BoardMember.board_id == board_id,
+            BoardMember.user_id == user_id,
+            # Memberships of a deleted board are hidden, as by the hook.
+            BoardMember.board_id.in_(
+                select(Board.id).where(Board.deleted_at.is_(None))
+            ),
+        )
+    )
+    return db.execute(stmt, execution_options=_FILTERED).scalars().first()
+
+
+def get_list(db: Session, list_id: UUID) -> List | None:
+    stmt = lambda_stmt(
+        lambda: select(List).where(List.id == list_id, List.deleted_at.is_(None))
+    )
+    return db.execute(stmt, execution_options=_FILTERED).scalars().first()
+
+
+def get_card(db: Session, card_id: UUID, board_id: UUID | None = None) -> Card | None:
+    """Cards are partitioned by board: given the card's ``board_id`` the
+    lookup reads one partition instead of probing each of them."""
+    stmt = lambda_stmt(
+        lambda: select(Card).where(Card.id == card_id, Card.deleted_at.is_(None))
+    )
+    if board_id is not None:
+        stmt += lambda s: s.where(Card.board_id == board_id)
+    return db.execute(stmt, execution_options=_FILTERED).scalars().first()
+
+
+def get_cards_in_list(db: Session, board_id: UUID, list_id: UUID) -> list[Card]:
+    stmt = lambda_stmt(
+        lambda: (
+            select(Card)
+            .where(
+                Card.board_id == board_id,
+                Card.list_id == list_id,
+                Card.deleted_at.is_(None),
+            )
+            .order_by(Card.position)
+        )
+    )
+    return list(db.execute(stmt, execution_options=_FILTERED).scalars())
+
+
+def card_rows_in_list(board_id: UUID, list_id: UUID) -> Select:
+    """The columns of ``CardOut`` rather than ``Card`` objects, for streaming
+    a list too long to load into the session."""
+    columns = [getattr(Card, name) for name in CardOut.model_fields]
+    return (
+        select(*columns)
+        .where(Card.board_id == board_id, Card.list_id == list_id)
+        .order_by(Card.position)
+    )
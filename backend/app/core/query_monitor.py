@@ -0,0 +1,139 @@
+"""Statement timeouts and slow-query logging for every engine."""
+
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.slow_queries")
+
+# "GET /api/cards/{card_id}"-style label of the request being served, set by
+# ``app.api.deps.track_route``.
+current_route: ContextVar[str | None] = ContextVar("current_route", default=None)
+
+MAX_PARAMS_LENGTH = 1000
+
+# Row locks are taken by EXPLAIN ANALYZE too.
+LOCKING_CLAUSE = re.compile(r"\bFOR\s+(NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b")
+
+# Plans are captured one at a time, off the request's connection and thread;
+# slow queries seen while one is being captured are logged without a plan.
+_explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="explain")
+_explaining = threading.Lock()
+
+
+def timeout_connect_args(url) -> dict:
+    """``connect_args`` that make Postgres cancel any statement running longer
+    than ``DB_STATEMENT_TIMEOUT_MS``, set once per connection rather than per
+    transaction so it costs no extra round trip."""
+    timeout = settings.DB_STATEMENT_TIMEOUT_MS
+    parsed = make_url(url)
+    if not timeout or parsed.get_backend_name() != "postgresql":
+        return {}
+    if parsed.get_driver_name() == "asyncpg":
+        return {"server_settings": {"statement_timeout": str(timeout)}}
+    return {"options": f"-c statement_timeout={timeout}"}
+
+
+@event.listens_for(Session, "after_begin")
+def _set_route_timeout(session, transaction, connection):
+    """Override the connection-wide timeout for the routes listed in
+    ``DB_ROUTE_STATEMENT_TIMEOUTS_MS``, for this transaction only."""
+    timeout = settings.DB_ROUTE_STATEMENT_TIMEOUTS_MS.get(current_route.get())
+    if timeout is None or connection.dialect.name != "postgresql":
+        return
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout)}")
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_started_at"].pop()) * 1000
+    if elapsed_ms < settings.SLOW_QUERY_MS:
+        return
+
+    params = repr(parameters)
+    if len(params) > MAX_PARAMS_LENGTH:
+        params = params[:MAX_PARAMS_LENGTH] + "..."
+    logger.warning(
+        "Slow query (%.1f ms) on %s: %s -- parameters: %s",
+        elapsed_ms,
+        current_route.get() or "<no route>",
+        statement,
+        params,
+    )
+
+    if (
+        settings.SLOW_QUERY_EXPLAIN
+        and elapsed_ms >= settings.SLOW_QUERY_EXPLAIN_MS
+        and conn.dialect.name == "postgresql"
+        # A sync engine of its own is needed to connect from another thread.
+        and not conn.dialect.is_async
+        and not executemany
+        and explainable(statement)
+        and _explaining.acquire(blocking=False)
+    ):
+        _explainer.submit(
+            _log_plan, conn.engine, statement, parameters, current_route.get()
+        )
+
+
+@event.listens_for(Engine, "handle_error")
+def _log_failed_query(context):
+    # Statements cancelled by statement_timeout end up here, not in
+    # after_cursor_execute; they are the slowest of all.
+    conn = context.connection
+    if conn is None or not conn.info.get("query_started_at"):
+        return
+    elapsed_ms = (time.perf_counter() - conn.info["query_started_at"].pop()) * 1000
+    if elapsed_ms >= settings.SLOW_QUERY_MS:
+        logger.warning(
+            "Failed query (%.1f ms) on %s: %s -- %s",
+            elapsed_ms,
+            current_route.get() or "<no route>",
+            context.statement,
+            context.original_exception,
+        )
+
+
+def explainable(statement: str) -> bool:
+    """Whether ``statement`` can be run again under EXPLAIN ANALYZE: only
+    plain SELECTs, which neither write nor lock rows."""
+    statement = statement.lstrip().upper()
+    return statement.startswith("SELECT") and not LOCKING_CLAUSE.search(statement)
+
+
+def _explain(engine: Engine, statement: str, parameters) -> str:
+    # Its own connection, in a read-only transaction rolled back at the end:
+    # the request's transaction is never touched, and the statement, run
+    # again, cannot write whatever it calls.
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+        rows = conn.exec_driver_sql(
+            f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+        )
+        return "\n".join(row[0] for row in rows)
+
+
+def _log_plan(engine: Engine, statement: str, parameters, route: str | None) -> None:
+    try:
+        plan = _explain(engine, statement, parameters)
+    except Exception as err:  # the plan is best effort, the query succeeded
+        plan = f"<EXPLAIN failed: {err}>"
+    finally:
+        _explaining.release()
+    logger.warning(
+        "Plan for slow query on %s: %s\n%s", route or "<no route>", statement, plan
+    )
@@ -0,0 +1,43 @@
+import random
+import time
+from typing import Any
+
+
+class ReplicaRouter:
+    """Pick the engine a request's session is bound to.
+
+    Reads go to a random replica, writes to the primary. A client that wrote
+    less than ``pin_seconds`` ago, going by the write time it sends back
+    (see ``app.api.deps.last_write``), reads from the primary so it sees its
+    own writes despite replication lag. The time travels with the client, so
+    this holds whichever worker serves the read.
+
+    ``writer``, when given, is the primary as writes should use it (on SQLite,
+    with ``BEGIN IMMEDIATE`` transactions).
+    """
+
+    def __init__(
+        self,
+        primary: Any,
+        replicas: list[Any],
+        pin_seconds: float,
+        writer: Any = None,
+    ):
+        self.primary = primary
+        self.writer = primary if writer is None else writer
+        self.replicas = replicas
+        self.pin_seconds = pin_seconds
+
+    def engine_for(self, read_only: bool, written_at: float | None = None) -> Any:
+        if not read_only:
+            return self.writer
+        if not self.replicas:
+            return self.primary
+        if written_at is not None and self.pinned(written_at):
+            return self.primary
+        return random.choice(self.replicas)
+
+    def pinned(self, written_at: float) -> bool:
+        """Whether a write made at ``written_at`` (Unix time) may not have
+        reached the replicas yet."""
+        return 0 <= time.time() - written_at < self.pin_seconds
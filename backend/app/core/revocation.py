@@ -0,0 +1,71 @@
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.refresh_token import RefreshToken
+
+
+class RevocationList:
+    """In-process deny-list of revoked login sessions.
+
+    Access tokens are checked against this set only, so validating them never
+    touches the database. The set is reloaded from ``refresh_tokens`` at most
+    once per ``refresh_seconds``; revocations made by this process are visible
+    immediately, those made by other workers after their next reload.
+    """
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._revoked: frozenset[str] = frozenset()
+        # Sessions revoked by this process, with when: a reload whose query
+        # does not see the revocation committed yet must not forget them.
+        self._revoked_here: dict[str, float] = {}
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+
+    def is_revoked(self, session_id: str) -> bool:
+        return session_id in self._revoked
+
+    def revoke(self, session_id: str) -> None:
+        with self._lock:
+            self._revoked_here[session_id] = time.monotonic()
+            self._revoked = self._revoked | {session_id}
+
+    def is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self.refresh_seconds
+        )
+
+    def reload(self, db: Session) -> None:
+        # Access tokens outlive their session's revocation by at most their
+        # own lifetime, so older revocations can be forgotten.
+        since = datetime.now(UTC) - timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
+        rows = (
+            db.query(RefreshToken.family_id)
+            .filter(RefreshToken.revoked_at >= since)
+            .distinct()
+            .all()
+        )
+        with self._lock:
+            now = time.monotonic()
+            lifetime = settings.JWT_EXPIRE_MINUTES * 60
+            self._revoked_here = {
+                session_id: revoked_at
+                for session_id, revoked_at in self._revoked_here.items()
+                if now - revoked_at < lifetime
+            }
+            self._revoked = frozenset(str(row.family_id) for row in rows).union(
+                self._revoked_here
+            )
+            self._loaded_at = now
+
+    def reload_if_stale(self, db: Session) -> None:
+        if self.is_stale():
+            self.reload(db)
+
+
+revoked_sessions = RevocationList(settings.REVOCATION_REFRESH_SECONDS)
@@ -1,11 +1,31 @@
+import base64
+import hashlib
+import hmac
+import secrets
 from datetime import UTC, datetime, timedelta
+from uuid import UUID
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def build_pwd_context(scheme: str, rounds: int | None = None) -> CryptContext:
+    """Build a context hashing with ``scheme`` at ``rounds``.
+
+    bcrypt stays registered so hashes created before a scheme change still
+    verify; ``deprecated="auto"`` flags them (and any hash whose cost differs
+    from ``rounds``) as needing an update.
+    """
+    schemes = list(dict.fromkeys([scheme, "bcrypt"]))
+    options = {f"{scheme}__rounds": rounds} if rounds is not None else {}
+    return CryptContext(schemes=schemes, deprecated="auto", **options)
+
+
+pwd_context = build_pwd_context(
+    settings.PASSWORD_HASH_SCHEME, settings.PASSWORD_HASH_ROUNDS
+)
 
 
 def hash_password(password: str) -> str:
@@ -16,14 +36,109 @@ def verify_password(password: str, hashed: str) -> bool:
     return pwd_context.verify(password, hashed)
 
 
-def create_access_token(subject: str) -> str:
+def verify_and_update_password(password: str, hashed: str) -> tuple[bool, str | None]:
+    """Verify ``password`` and return a replacement hash when ``hashed`` is
+    outdated (other scheme or cost), ``None`` otherwise."""
+    return pwd_context.verify_and_update(password, hashed)
+
+
+def create_access_token(subject: str, session_id: str | None = None) -> str:
     expire = datetime.now(UTC) + timedelta(minutes=settings.JWT_EXPIRE_MINUTES)
     to_encode = {
         "sub": subject,
         "exp": expire,
     }
+    if session_id is not None:
+        to_encode["sid"] = session_id
     return jwt.encode(
         to_encode,
         settings.JWT_SECRET,
         algorithm=settings.JWT_ALGORITHM,
     )
+
+
+# Lets get_current_user tell personal access tokens from JWTs without
+# attempting to decode them.
+PERSONAL_TOKEN_PREFIX = "etp_"
+
+
+BOARD_TOKEN_TYPE = "board"
+
+
+def create_board_token(
+    subject: str, board_id: UUID, role: str, epoch: int
+) -> tuple[str, datetime]:
+    """Mint a short-lived JWT that only grants read access to one board.
+
+    Returns the token and its expiry. ``epoch`` is the board's
+    ``membership_epoch`` at minting time.
+    """
+    expire = datetime.now(UTC) + timedelta(minutes=settings.BOARD_TOKEN_EXPIRE_MINUTES)
+    to_encode = {
+        "sub": subject,
+        "exp": expire,
+        "typ": BOARD_TOKEN_TYPE,
+        "bid": str(board_id),
+        "role": role,
+        "epoch": epoch,
+    }
+    token = jwt.encode(
+        to_encode,
+        settings.JWT_SECRET,
+        algorithm=settings.JWT_ALGORITHM,
+    )
+    return token, expire
+
+
+def generate_token() -> str:
+    """Return a random, URL-safe opaque token."""
+    return secrets.token_urlsafe(32)
+
+
+def generate_personal_token() -> str:
+    return PERSONAL_TOKEN_PREFIX + generate_token()
+
+
+def hash_token(token: str) -> str:
+    """Digest stored in place of opaque tokens. High-entropy secrets do not
+    need a slow hash, so a single SHA-256 keeps lookups cheap."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(message: bytes) -> bytes:
+    return hmac.new(settings.JWT_SECRET.encode(), message, hashlib.sha256).digest()
+
+
+def create_invitation_token(board_id: UUID, role: str, expires_at: datetime) -> str:
+    """Sign a board invitation. The token is ``payload.signature``, both
+    base64url encoded, with payload ``board_id:role:expiry``."""
+    payload = f"{board_id.hex}:{role}:{int(expires_at.timestamp())}".encode()
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def verify_invitation_token(token: str) -> tuple[UUID, str] | None:
+    """Return ``(board_id, role)`` for a valid, unexpired invitation, ``None``
+    otherwise. Needs no database access."""
+    try:
+        encoded_payload, encoded_signature = token.split(".")
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+        board_hex, role, expires = payload.decode().split(":")
+        board_id = UUID(hex=board_hex)
+        expires_at = int(expires)
+    except ValueError:
+        return None
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        return None
+    if expires_at <= datetime.now(UTC).timestamp():
+        return None
+    return board_id, role
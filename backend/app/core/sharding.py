@@ -0,0 +1,171 @@
+"""Board-keyed sharding across several databases.
+
+Users, their login sessions and personal tokens live in the global database
+(``DATABASE_URL``); boards and everything on them live in one of the
+``DATABASE_SHARD_URLS``.
+
+Rows are routed without a directory lookup: the low bits of an id are its
+bucket, one of ``SHARD_BUCKETS``. A board's id is random, and the ids of its
+lists, cards and memberships are minted in the board's bucket (see
+``board_scoped_id``), so any id in a request path names its shard. Buckets
+map to shards in contiguous ranges: doubling the shard count splits every
+shard in two, and no board has to move anywhere else.
+
+Requests carry a ``board_id``, ``list_id`` or ``card_id`` (see ``shard_key``)
+and their session goes to that shard. Reads without one, such as listing a
+user's boards, run on every shard and concatenate the results. A card moved
+to another board gets a new id in that board's bucket, but its row stays in
+its database, so moves between boards are limited to boards on the same
+shard.
+"""
+
+import uuid
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.orm import ORMExecuteState
+
+from app.core.replicas import ReplicaRouter
+from app.core.sqlite import immediate_writes
+
+SHARD_BUCKETS = 1024
+GLOBAL_SHARD = "global"
+# Tables kept in the global database; every other table is sharded by board.
+GLOBAL_TABLES = frozenset({"users", "refresh_tokens", "personal_access_tokens"})
+# Request parameters a session can be routed by, in the order they are tried.
+SHARD_KEY_PARAMS = ("board_id", "list_id", "card_id")
+# Session.info key holding the id the session is routed by.
+SHARD_KEY = "shard_key"
+
+
+def bucket_of(id_: Any) -> int:
+    if not isinstance(id_, uuid.UUID):
+        id_ = uuid.UUID(str(id_))
+    return id_.int % SHARD_BUCKETS
+
+
+def colocated_id(owner_id: Any) -> uuid.UUID:
+    """A fresh random id in the same bucket as ``owner_id``."""
+    fresh = uuid.uuid4().int
+    return uuid.UUID(int=fresh - fresh % SHARD_BUCKETS + bucket_of(owner_id))
+
+
+def board_scoped_id(context) -> uuid.UUID:
+    """Column default for rows that belong to a board: an id in the bucket of
+    the row's ``board_id``, so the id alone routes to the board's shard."""
+    return colocated_id(context.get_current_parameters()["board_id"])
+
+
+def shard_key(params: Mapping[str, str]) -> uuid.UUID | None:
+    """The id a request should be routed by, from its path or query
+    parameters; malformed ids are left to request validation."""
+    for name in SHARD_KEY_PARAMS:
+        value = params.get(name)
+        if value is None:
+            continue
+        try:
+            return uuid.UUID(value)
+        except ValueError:
+            continue
+    return None
+
+
+def route_to_board(db, board_id: uuid.UUID) -> None:
+    """Route ``db`` to ``board_id``'s shard, for requests that only learn
+    their board from the body or a token. A no-op without sharding."""
+    db.info[SHARD_KEY] = board_id
+
+
+def _is_global(mapper) -> bool:
+    return mapper is None or mapper.local_table.name in GLOBAL_TABLES
+
+
+class ShardRouter:
+    """Open sessions spanning the global database and every shard.
+
+    The global database goes through ``global_router``, so its replicas and
+    read-your-writes pinning still apply. Shards are their primaries only.
+    """
+
+    def __init__(self, global_router: ReplicaRouter, shards: list[Any]):
+        self.global_router = global_router
+        self.shards = shards
+
+    def shard_for(self, id_: Any) -> str:
+        return str(bucket_of(id_) * len(self.shards) // SHARD_BUCKETS)
+
+    def session(
+        self,
+        read_only: bool,
+        written_at: float | None = None,
+        key: uuid.UUID | None = None,
+    ) -> "BoardShardedSession":
+        binds = {GLOBAL_SHARD: self.global_router.engine_for(read_only, written_at)}
+        for index, engine in enumerate(self.shards):
+            binds[str(index)] = engine if read_only else immediate_writes(engine)
+        session = BoardShardedSession(
+            self, shards=binds, autoflush=False, expire_on_commit=False
+        )
+        route_to_board(session, key)
+        return session
+
+
+class BoardShardedSession(ShardedSession):
+    """Session routing global tables to the global database and board rows to
+    their board's shard."""
+
+    def __init__(self, router: ShardRouter, **kwargs: Any):
+        self.router = router
+        super().__init__(
+            shard_chooser=self._choose_shard,
+            identity_chooser=self._choose_identity,
+            execute_chooser=self._choose_execute,
+            **kwargs,
+        )
+
+    def _routed_shard(self) -> str | None:
+        key = self.info.get(SHARD_KEY)
+        return None if key is None else self.router.shard_for(key)
+
+    def get_bind(self, mapper=None, **kwargs: Any):
+        # Session.get_bind accepts a mapped class or nothing at all;
+        # ShardedSession only a mapper.
+        if mapper is not None:
+            mapper = sa_inspect(mapper)
+        elif kwargs.get("shard_id") is None and kwargs.get("instance") is None:
+            kwargs["shard_id"] = self._routed_shard() or GLOBAL_SHARD
+        return super().get_bind(mapper, **kwargs)
+
+    def _choose_shard(self, mapper, instance, clause=None, **kwargs: Any) -> str:
+        if _is_global(mapper):
+            return GLOBAL_SHARD
+        if instance is None:
+            return self._routed_shard() or GLOBAL_SHARD
+        key = getattr(instance, "board_id", None)
+        if key is None:
+            # A new board: its id decides its shard, so mint it now.
+            if instance.id is None:
+                instance.id = uuid.uuid4()
+            key = instance.id
+        return self.router.shard_for(key)
+
+    def _choose_identity(self, mapper, primary_key, **kwargs: Any) -> list[str]:
+        if _is_global(mapper):
+            return [GLOBAL_SHARD]
+        names = [column.key for column in mapper.primary_key]
+        key = primary_key[names.index("board_id")] if "board_id" in names else None
+        return [self.router.shard_for(primary_key[0] if key is None else key)]
+
+    def _choose_execute(self, orm_context: ORMExecuteState) -> list[str]:
+        if _is_global(orm_context.bind_mapper):
+            return [GLOBAL_SHARD]
+        routed = self._routed_shard()
+        if routed is not None:
+            return [routed]
+        if orm_context.is_select:
+            return [str(index) for index in range(len(self.router.shards))]
+        raise RuntimeError(
+            "Writes to board data need a board to route to, see route_to_board"
+        )
@@ -0,0 +1,52 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from app.core.config import settings
+from app.models.board import Board
+from app.models.board_member import BoardMember
+from app.models.mixins import SoftDeleteMixin
+
+# Execution option that turns the filter off, for restores and the purge.
+INCLUDE_DELETED = "include_deleted"
+# Execution option for statements that filter out deleted rows themselves,
+# such as the cached lookups of ``app.core.queries``: adding the options
+# below would rebuild them on every call. Lazy loads from the rows they
+# return are not filtered.
+FILTERS_DELETED = "filters_deleted"
+
+
+def restorable_since() -> datetime:
+    """Rows deleted before this are past the retention window: they can no
+    longer be restored and are due for purging."""
+    return datetime.now(UTC) - timedelta(days=settings.SOFT_DELETE_RETENTION_DAYS)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _hide_soft_deleted(execute_state: ORMExecuteState) -> None:
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+        or execute_state.execution_options.get(INCLUDE_DELETED, False)
+        or execute_state.execution_options.get(FILTERS_DELETED, False)
+    ):
+        return
+
+    # Lazy loads from the returned objects inherit these options.
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(
+            SoftDeleteMixin,
+            lambda cls: cls.deleted_at.is_(None),
+            include_aliases=True,
+        ),
+        # Memberships of a deleted board are hidden too, so every membership
+        # check treats the board as gone.
+        with_loader_criteria(
+            BoardMember,
+            BoardMember.board_id.in_(
+                select(Board.id).where(Board.deleted_at.is_(None))
+            ),
+        ),
+    )
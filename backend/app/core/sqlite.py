@@ -0,0 +1,54 @@
+"""Embedded SQLite backend for single-node installs.
+
+Connections run in WAL mode, so readers never wait on the writer, with
+``synchronous=NORMAL`` (a power loss may lose the last commits but never
+corrupts the file), memory-mapped reads and a busy timeout.
+
+SQLite allows one writer at a time. Transactions started for a write
+request open with ``BEGIN IMMEDIATE`` (see ``immediate_writes``), taking the
+write lock up front: concurrent writers then queue on the busy timeout
+instead of failing with ``SQLITE_BUSY`` when a read transaction tries to
+upgrade to a write. Every other transaction opens with a plain ``BEGIN``.
+"""
+
+from functools import cache
+
+from sqlalchemy import event
+
+from app.core.config import settings
+
+# Execution option marking a bind whose transactions take the write lock.
+BEGIN_IMMEDIATE = "sqlite_begin_immediate"
+
+
+def configure_sqlite_engine(engine) -> None:
+    """Apply the pragmas and transaction handling above to ``engine`` (sync,
+    or the ``sync_engine`` of an async one)."""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, _connection_record):
+        # Let SQLAlchemy, not the driver, decide when transactions begin.
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE_BYTES)}")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        if conn.get_execution_options().get(BEGIN_IMMEDIATE):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            conn.exec_driver_sql("BEGIN")
+
+
+@cache
+def immediate_writes(bind):
+    """``bind`` with its transactions taking the write lock up front on
+    SQLite; other backends are returned unchanged."""
+    if bind is None or bind.dialect.name != "sqlite":
+        return bind
+    return bind.execution_options(**{BEGIN_IMMEDIATE: True})
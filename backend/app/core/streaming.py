@@ -0,0 +1,45 @@
+"""Serialize large result sets as a JSON array, one batch at a time.
+
+The rows come from a ``yield_per`` query (a server-side cursor on Postgres),
+are validated and encoded a batch at a time and written out as they are
+produced, so a response's memory use depends on the batch size, not on how
+many rows it holds. The body is byte-for-byte what the non-streaming
+endpoint returns.
+"""
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import Any
+
+from pydantic import TypeAdapter
+
+# Rows fetched, validated and written per batch.
+STREAM_BATCH_ROWS = 500
+STREAM_OPTIONS = {"yield_per": STREAM_BATCH_ROWS}
+
+
+def _encode(batch: Any, adapter: TypeAdapter) -> bytes:
+    # Drop the brackets around the batch's own JSON array.
+    return adapter.dump_json(adapter.validate_python(batch, from_attributes=True))[1:-1]
+
+
+def json_array(batches: Iterable[Any], adapter: TypeAdapter) -> Iterator[bytes]:
+    """Encode rows, given in batches, into the chunks of one JSON array.
+    ``adapter`` validates a list of rows, e.g. ``TypeAdapter(list[CardOut])``."""
+    separator = b"["
+    for batch in batches:
+        if batch:
+            yield separator + _encode(batch, adapter)
+            separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+async def json_array_async(
+    batches: AsyncIterable[Any], adapter: TypeAdapter
+) -> AsyncIterator[bytes]:
+    """``json_array`` over an async result's batches."""
+    separator = b"["
+    async for batch in batches:
+        if batch:
+            yield separator + _encode(batch, adapter)
+            separator = b","
+    yield b"[]" if separator == b"[" else b"]"
@@ -0,0 +1,84 @@
+"""Run write operations as retryable transactions.
+
+Concurrent drags lock the same card and list rows, so some transactions lose
+to a deadlock or, under ``REPEATABLE READ`` or ``SERIALIZABLE``, a
+serialization failure; on SQLite a writer can outwait the busy timeout. None
+of these mean the request was wrong: the operation is rolled back and run
+again from the start, after a random pause that doubles per attempt (full
+jitter, so retries of colliding requests spread out instead of colliding
+again).
+
+Operations must therefore be safe to re-run: everything they do goes through
+the session, which the rollback undoes.
+"""
+
+import random
+import time
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.metrics import TransactionMetrics
+
+# serialization_failure, deadlock_detected
+TRANSIENT_SQLSTATES = frozenset({"40001", "40P01"})
+
+transaction_metrics = TransactionMetrics()
+
+
+class TransactionConflictError(Exception):
+    """An operation still conflicted after every retry."""
+
+
+def is_transient(err: DBAPIError) -> bool:
+    sqlstate = getattr(err.orig, "pgcode", None) or getattr(err.orig, "sqlstate", None)
+    if sqlstate in TRANSIENT_SQLSTATES:
+        return True
+    return "database is locked" in str(err.orig)
+
+
+def retry_delay(attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt`` (from 1)."""
+    ceiling = min(
+        settings.TX_RETRY_MAX_MS, settings.TX_RETRY_BASE_MS * 2 ** (attempt - 1)
+    )
+    return random.uniform(0, ceiling) / 1000
+
+
+def _begin(db: Session, isolation_level: str | None) -> None:
+    # Only Postgres has levels to choose from; SQLite is always serializable.
+    if isolation_level is None or db.get_bind().dialect.name != "postgresql":
+        return
+    # The level applies from the transaction's first statement, so end the
+    # read-only one the request's dependencies opened.
+    db.commit()
+    db.connection(execution_options={"isolation_level": isolation_level})
+
+
+def run_in_transaction(
+    db: Session,
+    operation: Callable[[], Any],
+    *,
+    name: str,
+    isolation_level: str | None = None,
+) -> Any:
+    """Run ``operation``, which commits through ``db``, retrying it on
+    transient errors; raise ``TransactionConflictError`` once retries run out."""
+    attempt = 1
+    while True:
+        _begin(db, isolation_level)
+        try:
+            return operation()
+        except DBAPIError as err:
+            db.rollback()
+            if not is_transient(err):
+                raise
+            if attempt >= settings.TX_RETRY_ATTEMPTS:
+                transaction_metrics.record_give_up(name)
+                raise TransactionConflictError(name) from err
+            transaction_metrics.record_retry(name)
+            time.sleep(retry_delay(attempt))
+            attempt += 1
@@ -3,5 +3,8 @@ from app.models.card_member import CardMember as CardMember
 
 from .board import Board as Board
 from .board_member import BoardMember as BoardMember
+from .board_snapshot import BoardSnapshotEntry as BoardSnapshotEntry
 from .list import List as List
+from .personal_access_token import PersonalAccessToken as PersonalAccessToken
+from .refresh_token import RefreshToken as RefreshToken
 from .user import User as User
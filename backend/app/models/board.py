@@ -1,35 +1,48 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.mixins import SoftDeleteMixin
+from app.models.types import GUID, UTCDateTime
 
 
-class Board(Base):
+class Board(SoftDeleteMixin, Base):
     __tablename__ = "boards"
+    # Fetch server defaults (membership_epoch) with INSERT ... RETURNING.
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
     title = Column(String, nullable=False)
 
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    owner_id = Column(GUID, ForeignKey("users.id"), nullable=False)
     owner = relationship("User", back_populates="owned_boards")
 
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
 
     background_kind = Column(String, nullable=False, default="gradient")
     background_value = Column(String, nullable=True)
     background_thumb_url = Column(String, nullable=True)
 
+    # Bumped whenever a member loses access; board-scoped tokens minted under
+    # an older epoch stop being accepted.
+    membership_epoch = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # Children are removed by ON DELETE CASCADE; the ORM does not load them
+    # just to delete them one by one.
     members = relationship(
-        "BoardMember", back_populates="board", cascade="all, delete-orphan"
+        "BoardMember",
+        back_populates="board",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     lists = relationship(
         "List",
         back_populates="board",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="List.position",
     )
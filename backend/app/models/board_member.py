@@ -1,21 +1,24 @@
-import uuid
-
-from sqlalchemy import Column, ForeignKey, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.core.sharding import board_scoped_id
+from app.models.types import GUID
 
 
 class BoardMember(Base):
     __tablename__ = "board_members"
+    __table_args__ = (
+        # Also the index behind every membership check.
+        UniqueConstraint("board_id", "user_id", name="uq_board_members_board_user"),
+        # list_boards filters on user_id and joins on board_id.
+        Index("ix_board_members_user_id_board_id", "user_id", "board_id"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID, primary_key=True, default=board_scoped_id)
 
-    board_id = Column(
-        UUID(as_uuid=True), ForeignKey("boards.id", ondelete="CASCADE"), nullable=False
-    )
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    board_id = Column(GUID, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(GUID, ForeignKey("users.id"), nullable=False)
 
     role = Column(String, nullable=False, default="member")
 
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, ForeignKey, Integer, String, Text
+
+from app.core.database import Base
+from app.models.types import GUID
+
+
+class BoardSnapshotEntry(Base):
+    """One piece of a board's snapshot: the board's own fields, one list's,
+    or one card's with its assignees, as the JSON the snapshot endpoint
+    sends. Opening a board reads its entries in a single range scan. Kept by
+    ``app.core.board_snapshots`` in the same transaction as every write it
+    reflects, which only replaces the entries it changed."""
+
+    __tablename__ = "board_snapshot_entries"
+
+    board_id = Column(
+        GUID, ForeignKey("boards.id", ondelete="CASCADE"), primary_key=True
+    )
+    # The id of the board, list or card.
+    entry_id = Column(GUID, primary_key=True)
+    kind = Column(String, nullable=False)
+    # The list a card entry belongs to.
+    list_id = Column(GUID, nullable=True)
+    position = Column(Integer, nullable=False, default=0)
+    # Serialized JSON, sent back without being parsed.
+    document = Column(Text, nullable=False)
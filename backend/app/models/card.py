@@ -1,29 +1,44 @@
-import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy import Column, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.core.sharding import board_scoped_id
+from app.models.mixins import SoftDeleteMixin
+from app.models.partitioning import PARTITIONED_BY_BOARD, create_board_partitions
+from app.models.types import GUID, IntegerArray, UTCDateTime
 
 
-class Card(Base):
+class Card(SoftDeleteMixin, Base):
     __tablename__ = "cards"
+    __table_args__ = (
+        Index("ix_cards_list_id_position", "list_id", "position"),
+        PARTITIONED_BY_BOARD,
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID, primary_key=True, default=board_scoped_id)
 
     title = Column(String, nullable=False)
     description = Column(Text, nullable=True)
 
     position = Column(Integer, nullable=False)
 
-    list_id = Column(UUID(as_uuid=True), ForeignKey("lists.id"), nullable=False)
-    creator_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    list_id = Column(GUID, ForeignKey("lists.id", ondelete="CASCADE"), nullable=False)
+    creator_id = Column(GUID, ForeignKey("users.id"), nullable=False)
+    # Copied from the list so authorization and board-wide queries need not
+    # join through lists. Kept in sync on create and on cross-list moves.
+    # Also the partition key, hence part of the primary key.
+    board_id = Column(
+        GUID,
+        ForeignKey("boards.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    )
 
-    label_ids = Column(ARRAY(Integer), nullable=False, default=list)
+    label_ids = Column(IntegerArray, nullable=False, default=list)
 
-    created_at = Column(DateTime, default=lambda: datetime.now(UTC))
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
 
     list = relationship("List", back_populates="cards")
     creator = relationship("User")
@@ -32,4 +47,8 @@ class Card(Base):
         "CardMember",
         back_populates="card",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
+
+
+create_board_partitions(Card.__table__)
@@ -1,26 +1,43 @@
-import uuid
-
-from sqlalchemy import Column, ForeignKey, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Column,
+    ForeignKey,
+    ForeignKeyConstraint,
+    Index,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.core.sharding import board_scoped_id
+from app.models.partitioning import PARTITIONED_BY_BOARD, create_board_partitions
+from app.models.types import GUID
 
 
 class CardMember(Base):
     __tablename__ = "card_members"
     __table_args__ = (
-        UniqueConstraint("card_id", "user_id", name="uq_card_members_card_user"),
+        # Follows its card's board_id, including when the card moves board.
+        ForeignKeyConstraint(
+            ["card_id", "board_id"],
+            ["cards.id", "cards.board_id"],
+            ondelete="CASCADE",
+            onupdate="CASCADE",
+        ),
+        UniqueConstraint(
+            "card_id", "user_id", "board_id", name="uq_card_members_card_user"
+        ),
+        Index("ix_card_members_user_id", "user_id"),
+        PARTITIONED_BY_BOARD,
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID, primary_key=True, default=board_scoped_id)
+    board_id = Column(GUID, primary_key=True)
 
-    card_id = Column(
-        UUID(as_uuid=True), ForeignKey("cards.id", ondelete="CASCADE"), nullable=False
-    )
-    user_id = Column(
-        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
-    )
+    card_id = Column(GUID, nullable=False)
+    user_id = Column(GUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     card = relationship("Card", back_populates="members")
     user = relationship("User", back_populates="assigned_cards")
+
+
+create_board_partitions(CardMember.__table__)
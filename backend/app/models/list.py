@@ -1,20 +1,24 @@
-import uuid
-
-from sqlalchemy import Column, ForeignKey, Integer, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.core.sharding import board_scoped_id
+from app.models.mixins import SoftDeleteMixin
+from app.models.types import GUID
 
 
-class List(Base):
+class List(SoftDeleteMixin, Base):
     __tablename__ = "lists"
+    __table_args__ = (Index("ix_lists_board_id_position", "board_id", "position"),)
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID, primary_key=True, default=board_scoped_id)
     title = Column(String, nullable=False)
     position = Column(Integer, nullable=False)
+    # Live (not soft-deleted) cards, kept by the card and list routes in the
+    # same transaction as the change; app.commands.recount_cards repairs it.
+    card_count = Column(Integer, nullable=False, default=0, server_default="0")
 
-    board_id = Column(UUID(as_uuid=True), ForeignKey("boards.id"), nullable=False)
+    board_id = Column(GUID, ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
 
     board = relationship("Board", back_populates="lists")
 
@@ -22,5 +26,6 @@ class List(Base):
         "Card",
         back_populates="list",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         order_by="Card.position",
     )
@@ -0,0 +1,13 @@
+from sqlalchemy import Column
+
+from app.models.types import UTCDateTime
+
+
+class SoftDeleteMixin:
+    """Rows are hidden, not deleted, until the purge removes them for good.
+
+    Queries skip rows with ``deleted_at`` set unless they opt out, see
+    ``app.core.soft_delete``.
+    """
+
+    deleted_at = Column(UTCDateTime, nullable=True, index=True)
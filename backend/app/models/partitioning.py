@@ -0,0 +1,38 @@
+"""Hash partitioning of the card tables by board.
+
+On Postgres ``cards`` and ``card_members`` are partitioned by
+``HASH (board_id)``, so a query filtering on ``board_id`` reads a single
+partition. Their primary and unique keys include ``board_id``, as Postgres
+requires of partitioned tables. On SQLite the tables stay plain.
+"""
+
+import re
+
+from sqlalchemy import DDL, Table, event
+
+BOARD_PARTITIONS = 16
+
+# Table keyword arguments of a table partitioned by board.
+PARTITIONED_BY_BOARD = {"postgresql_partition_by": "HASH (board_id)"}
+
+_PARTITION_NAME = re.compile(r"^(cards|card_members)_p\d+$")
+
+
+def create_board_partitions(table: Table) -> None:
+    """Create ``table``'s partitions along with it (``create_all``); the
+    migrations create their own."""
+    for remainder in range(BOARD_PARTITIONS):
+        event.listen(
+            table,
+            "after_create",
+            DDL(
+                f"CREATE TABLE {table.name}_p{remainder} PARTITION OF {table.name} "
+                f"FOR VALUES WITH (MODULUS {BOARD_PARTITIONS}, "
+                f"REMAINDER {remainder})"
+            ).execute_if(dialect="postgresql"),
+        )
+
+
+def is_board_partition(table_name: str) -> bool:
+    """Whether ``table_name`` is a partition rather than a mapped table."""
+    return bool(_PARTITION_NAME.match(table_name))
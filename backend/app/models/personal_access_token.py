@@ -0,0 +1,30 @@
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, ForeignKey, String
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+from app.models.types import GUID, UTCDateTime
+
+
+class PersonalAccessToken(Base):
+    __tablename__ = "personal_access_tokens"
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+
+    user_id = Column(
+        GUID,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    name = Column(String, nullable=False)
+    token_hash = Column(String(64), nullable=False, unique=True, index=True)
+    # Space separated, OAuth style: "read", "read write".
+    scopes = Column(String, nullable=False, default="read")
+
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
+    expires_at = Column(UTCDateTime, nullable=True)
+
+    user = relationship("User")
@@ -0,0 +1,45 @@
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import Column, ForeignKey, Index, String, text
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+from app.models.types import GUID, UTCDateTime
+
+
+class RefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+    __table_args__ = (
+        # Revoked tokens are few: every worker reloads the recent ones (see
+        # app.core.revocation) from this small partial index.
+        Index(
+            "ix_refresh_tokens_revoked_at",
+            "revoked_at",
+            postgresql_where=text("revoked_at IS NOT NULL"),
+            sqlite_where=text("revoked_at IS NOT NULL"),
+        ),
+    )
+
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
+
+    user_id = Column(
+        GUID,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # Every token issued by rotation shares the family of the original login;
+    # access tokens carry it as their ``sid`` claim.
+    family_id = Column(GUID, nullable=False, index=True)
+    token_hash = Column(String(64), nullable=False, unique=True, index=True)
+
+    created_at = Column(UTCDateTime, default=lambda: datetime.now(UTC))
+    # Expired tokens are deleted by app.commands.purge_deleted.
+    expires_at = Column(UTCDateTime, nullable=False, index=True)
+    # Set when the token is exchanged for a new one; presenting it again means
+    # it leaked, and the whole family gets revoked.
+    used_at = Column(UTCDateTime, nullable=True)
+    revoked_at = Column(UTCDateTime, nullable=True)
+
+    user = relationship("User")
@@ -0,0 +1,81 @@
+"""Column types shared by the models.
+
+Postgres gets its native ``UUID`` and ``ARRAY`` types; the embedded SQLite
+backend (see ``app.core.sqlite``) stores UUIDs as 32-char hex strings and
+arrays as JSON text. Timestamps always come back as aware UTC datetimes.
+"""
+
+import json
+import uuid
+from datetime import UTC
+
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.types import TypeDecorator
+
+
+class JSONEncodedList(TypeDecorator):
+    """Stores a Python list as a JSON-encoded TEXT column (SQLite compat)."""
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return json.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return []
+        return json.loads(value)
+
+
+class SQLiteUUID(TypeDecorator):
+    """Stores UUID as a 32-char hex string in SQLite, returns uuid.UUID."""
+
+    impl = String(32)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return value.hex
+        # Accept string representations too
+        return uuid.UUID(str(value)).hex
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return value
+        return uuid.UUID(value)
+
+
+class UTCDateTime(TypeDecorator):
+    """A ``timestamptz`` column read and written as aware UTC datetimes.
+
+    SQLite keeps no offset and Postgres answers in the session's time zone;
+    either way a value reads back equal to, and serialized like, the one an
+    INSERT was given.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or value.tzinfo is None:
+            return value
+        return value.astimezone(UTC)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is None:  # SQLite drops the offset; values are UTC
+            return value.replace(tzinfo=UTC)
+        return value.astimezone(UTC)
+
+
+GUID = UUID(as_uuid=True).with_variant(SQLiteUUID(), "sqlite")
+IntegerArray = ARRAY(Integer).with_variant(JSONEncodedList(), "sqlite")
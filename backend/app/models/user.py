@@ -1,16 +1,16 @@
 import uuid
 
-from sqlalchemy import Column, String
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Index, String, func
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.types import GUID
 
 
 class User(Base):
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(GUID, primary_key=True, default=uuid.uuid4)
     email = Column(String, unique=True, index=True, nullable=False)
     username = Column(String, unique=True, index=True, nullable=False)
     password_hash = Column(String, nullable=False)
@@ -23,3 +23,9 @@ class User(Base):
         back_populates="user",
         cascade="all, delete-orphan",
     )
+
+
+# Emails are stored lower-cased (see app.schemas.user), so lookups stay plain
+# equality probes on ix_users_email; this index keeps rows written around the
+# API from reintroducing duplicates that differ only in case.
+Index("ix_users_email_lower", func.lower(User.email), unique=True)
@@ -1,6 +1,15 @@
-from pydantic import BaseModel
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel
+
+from app.schemas.user import normalize_email
 
 
 class LoginRequest(BaseModel):
-    email: str
+    # Not an EmailStr: a malformed address is just a failed login.
+    email: Annotated[str, AfterValidator(normalize_email)]
     password: str
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
@@ -4,6 +4,9 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
 
+from app.schemas.card import CardOut
+from app.schemas.list import ListOut
+
 BackgroundKind = Literal["gradient", "unsplash"]
 
 
@@ -33,3 +36,24 @@ class BoardUpdate(BaseModel):
     background_kind: BackgroundKind | None = None
     background_value: str | None = None
     background_thumb_url: str | None = None
+
+
+class BoardTokenOut(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    expires_at: datetime
+
+
+class SnapshotCard(CardOut):
+    assignee_ids: list[UUID] = []
+
+
+class SnapshotList(ListOut):
+    cards: list[SnapshotCard] = []
+
+
+class BoardSnapshotOut(BoardOut):
+    """A whole board as stored in its snapshot: lists by position, each with
+    its cards by position."""
+
+    lists: list[SnapshotList]
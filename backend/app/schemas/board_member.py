@@ -2,13 +2,15 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr
 
+from app.schemas.user import NormalizedEmail
+
 
 class BoardMemberAddByEmail(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
 
 
 class BoardMemberRemoveByEmail(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
 
 
 class BoardMemberOut(BaseModel):
@@ -2,9 +2,11 @@ from uuid import UUID
 
 from pydantic import BaseModel, EmailStr
 
+from app.schemas.user import NormalizedEmail
+
 
 class CardMemberByEmail(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
 
 
 class CardMemberOut(BaseModel):
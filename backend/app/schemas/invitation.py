@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+InvitationRole = Literal["member"]
+
+
+class BoardInvitationCreate(BaseModel):
+    role: InvitationRole = "member"
+    # Defaults to settings.INVITATION_EXPIRE_HOURS.
+    expires_in_hours: int | None = Field(default=None, ge=1)
+
+
+class BoardInvitationOut(BaseModel):
+    token: str
+    board_id: UUID
+    role: InvitationRole
+    expires_at: datetime
@@ -22,3 +22,4 @@ class ListOut(ListBase):
     id: UUID
     position: int
     board_id: UUID
+    card_count: int
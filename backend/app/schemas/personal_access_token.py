@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+TokenScope = Literal["read", "write"]
+
+
+class PersonalAccessTokenCreate(BaseModel):
+    name: str
+    scopes: list[TokenScope] = Field(default_factory=lambda: ["read"], min_length=1)
+    # ``None`` issues a token that never expires.
+    expires_in_days: int | None = Field(default=90, ge=1)
+
+
+class PersonalAccessTokenOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
+    name: str
+    scopes: list[TokenScope]
+    created_at: datetime
+    expires_at: datetime | None = None
+
+    @field_validator("scopes", mode="before")
+    @classmethod
+    def split_scopes(cls, value):
+        if isinstance(value, str):
+            return value.split()
+        return value
+
+
+class PersonalAccessTokenCreated(PersonalAccessTokenOut):
+    # Only ever returned once, at creation.
+    token: str
@@ -1,10 +1,20 @@
+from typing import Annotated
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr
+
+
+def normalize_email(value: str) -> str:
+    """Emails are stored and looked up lower-cased, so the lookup is an
+    equality probe on ``ix_users_email`` whatever case the client sent."""
+    return value.strip().lower()
+
+
+NormalizedEmail = Annotated[EmailStr, AfterValidator(normalize_email)]
 
 
 class UserCreate(BaseModel):
-    email: EmailStr
+    email: NormalizedEmail
     username: str
     password: str
 
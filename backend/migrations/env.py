@@ -2,9 +2,11 @@ import os
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
+from alembic.operations import Operations, ops, toimpl
+from sqlalchemy import engine_from_config, pool, text
 
 from app.core.database import Base
+from app.models.partitioning import is_board_partition
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -58,6 +60,12 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    # Set by app.commands.migrate, which runs on its own connection.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
     configuration = config.get_section(config.config_ini_section) or {}
     configuration["sqlalchemy.url"] = os.getenv("DATABASE_URL") or configuration.get(
         "sqlalchemy.url"
@@ -70,10 +78,122 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        do_run_migrations(connection)
+
+
+def include_name(name, type_, parent_names) -> bool:
+    # Partitions are created by the migrations, not mapped.
+    return not (type_ == "table" and is_board_partition(name))
+
+
+def include_object(object_, name, type_, reflected, compare_to) -> bool:
+    # Postgres clones a foreign key to a partitioned table once per partition.
+    return not (
+        type_ == "foreign_key_constraint"
+        and is_board_partition(object_.referred_table.name)
+    )
+
+
+def _existing_relkind(operations, table_name: str) -> str | None:
+    """The relkind of ``table_name`` if it was there before the current
+    transaction, None if it is missing or this transaction created or
+    altered it."""
+    return (
+        operations.get_bind()
+        .execute(
+            text(
+                "SELECT relkind FROM pg_class "
+                "WHERE oid = to_regclass(:table) "
+                "AND xmin <> pg_current_xact_id()::xid"
+            ),
+            {"table": table_name},
+        )
+        .scalar()
+    )
+
+
+def _partitions(operations, table_name: str) -> list[str]:
+    return list(
+        operations.get_bind()
+        .execute(
+            text(
+                "SELECT inhrelid::regclass::text FROM pg_inherits "
+                "WHERE inhparent = to_regclass(:table) ORDER BY 1"
+            ),
+            {"table": table_name},
+        )
+        .scalars()
+    )
+
+
+@Operations.implementation_for(ops.CreateIndexOp, replace=True)
+def create_index(operations, operation) -> None:
+    """Build Postgres indexes with ``CREATE INDEX CONCURRENTLY``, outside the
+    migration's transaction, so the table stays writable during the build.
 
-        with context.begin_transaction():
-            context.run_migrations()
+    Tables this migration created or altered are already locked by it, and
+    committing half of it would break its atomicity: they get a plain
+    ``CREATE INDEX``. A partitioned table cannot be indexed concurrently, so
+    each partition is, after which indexing the parent only attaches them.
+    """
+    migration_context = operations.get_context()
+    online_postgres = (
+        migration_context.dialect.name == "postgresql" and not migration_context.as_sql
+    )
+    relkind = None
+    if online_postgres:
+        relkind = _existing_relkind(operations, operation.table_name)
+    if relkind == "p":
+        for partition in _partitions(operations, operation.table_name):
+            suffix = partition.rsplit("_", 1)[-1]
+            operations.invoke(
+                ops.CreateIndexOp(
+                    f"{operation.index_name}_{suffix}"[:63],
+                    partition,
+                    operation.columns,
+                    schema=operation.schema,
+                    unique=operation.unique,
+                    **operation.kw,
+                )
+            )
+    elif relkind is not None:
+        with migration_context.autocommit_block():
+            # What an interrupted build leaves behind: an invalid index.
+            invalid = (
+                operations.get_bind()
+                .execute(
+                    text(
+                        "SELECT 1 FROM pg_index "
+                        "WHERE indexrelid = to_regclass(:index) AND NOT indisvalid"
+                    ),
+                    {"index": operation.index_name},
+                )
+                .scalar()
+            )
+            if invalid:
+                operations.execute(f'DROP INDEX CONCURRENTLY "{operation.index_name}"')
+            # A rerun after a failure later in the migration finds it built.
+            operation.if_not_exists = True
+            operation.kw["postgresql_concurrently"] = True
+            return toimpl.create_index(operations, operation)
+    return toimpl.create_index(operations, operation)
+
+
+def do_run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_name=include_name,
+        include_object=include_object,
+        # SQLite cannot ALTER constraints; batch mode rebuilds the table.
+        render_as_batch=connection.dialect.name == "sqlite",
+        # Concurrent index builds commit the migration running them; the
+        # ones before it must not be committed along with it half-done.
+        transaction_per_migration=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
 
 
 if context.is_offline_mode():
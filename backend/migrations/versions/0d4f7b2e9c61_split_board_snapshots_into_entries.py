@@ -0,0 +1,50 @@
+"""split board snapshots into per-list and per-card entries
+
+Revision ID: 0d4f7b2e9c61
+Revises: 3b8e6d0f4a15
+Create Date: 2026-10-19 17:48:30.271946
+
+A write no longer locks and rewrites its board's whole document, only the
+entries of what it changed. Starts empty, like board_snapshots did: boards
+are built from their rows on read until app.commands.rebuild_snapshots
+stores their entries.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0d4f7b2e9c61"
+down_revision: str | Sequence[str] | None = "3b8e6d0f4a15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_table("board_snapshots")
+    op.create_table(
+        "board_snapshot_entries",
+        sa.Column("board_id", sa.UUID(), nullable=False),
+        sa.Column("entry_id", sa.UUID(), nullable=False),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("list_id", sa.UUID(), nullable=True),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("document", sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("board_id", "entry_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("board_snapshot_entries")
+    op.create_table(
+        "board_snapshots",
+        sa.Column("board_id", sa.UUID(), nullable=False),
+        sa.Column("document", sa.JSON(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("board_id"),
+    )
@@ -0,0 +1,50 @@
+"""store boards and cards created_at with time zone
+
+Revision ID: 3b8e6d0f4a15
+Revises: c92d7e14b385
+Create Date: 2026-10-19 17:02:11.804117
+
+The values were written as naive UTC, and are read back as such. SQLite
+keeps the same text either way.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b8e6d0f4a15"
+down_revision: str | Sequence[str] | None = "c92d7e14b385"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("boards", "cards")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            postgresql_using="created_at AT TIME ZONE 'UTC'",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        return
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "created_at",
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            postgresql_using="created_at AT TIME ZONE 'UTC'",
+        )
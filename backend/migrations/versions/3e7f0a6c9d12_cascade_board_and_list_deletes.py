@@ -0,0 +1,51 @@
+"""cascade board and list deletes
+
+Revision ID: 3e7f0a6c9d12
+Revises: 5c1e9b7d2a40
+Create Date: 2026-10-18 15:40:12.604118
+
+lists.board_id and cards.list_id get ON DELETE CASCADE, so deleting a board
+or a list is one statement; card_members already cascade from cards.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3e7f0a6c9d12"
+down_revision: str | Sequence[str] | None = "5c1e9b7d2a40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint("lists_board_id_fkey", "lists", type_="foreignkey")
+    op.create_foreign_key(
+        "lists_board_id_fkey",
+        "lists",
+        "boards",
+        ["board_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.drop_constraint("cards_list_id_fkey", "cards", type_="foreignkey")
+    op.create_foreign_key(
+        "cards_list_id_fkey",
+        "cards",
+        "lists",
+        ["list_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("cards_list_id_fkey", "cards", type_="foreignkey")
+    op.create_foreign_key("cards_list_id_fkey", "cards", "lists", ["list_id"], ["id"])
+    op.drop_constraint("lists_board_id_fkey", "lists", type_="foreignkey")
+    op.create_foreign_key(
+        "lists_board_id_fkey", "lists", "boards", ["board_id"], ["id"]
+    )
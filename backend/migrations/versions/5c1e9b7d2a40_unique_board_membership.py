@@ -0,0 +1,54 @@
+"""unique board membership
+
+Revision ID: 5c1e9b7d2a40
+Revises: adbd2cd21990
+Create Date: 2026-10-18 14:02:31.118270
+
+Removes duplicate (board_id, user_id) rows, keeping the owner row if there is
+one, then replaces the plain membership index with a unique constraint so
+member writes can use INSERT ... ON CONFLICT DO NOTHING.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e9b7d2a40"
+down_revision: str | Sequence[str] | None = "adbd2cd21990"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        DELETE FROM board_members
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY board_id, user_id
+                    ORDER BY (role = 'owner') DESC, id
+                ) AS rank
+                FROM board_members
+            ) ranked
+            WHERE rank > 1
+        )
+        """
+    )
+    op.drop_index("ix_board_members_board_id_user_id", table_name="board_members")
+    op.create_unique_constraint(
+        "uq_board_members_board_user", "board_members", ["board_id", "user_id"]
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("uq_board_members_board_user", "board_members", type_="unique")
+    op.create_index(
+        "ix_board_members_board_id_user_id",
+        "board_members",
+        ["board_id", "user_id"],
+        unique=False,
+    )
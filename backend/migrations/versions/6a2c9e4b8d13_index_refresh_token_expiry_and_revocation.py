@@ -0,0 +1,45 @@
+"""index refresh_tokens expires_at and revoked_at
+
+Revision ID: 6a2c9e4b8d13
+Revises: 0d4f7b2e9c61
+Create Date: 2026-10-19 18:31:05.662418
+
+revoked_at is read by every worker's revocation list reload, expires_at by
+the purge of expired tokens. The index on revoked_at only covers revoked
+tokens.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6a2c9e4b8d13"
+down_revision: str | Sequence[str] | None = "0d4f7b2e9c61"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_refresh_tokens_revoked_at",
+        "refresh_tokens",
+        ["revoked_at"],
+        unique=False,
+        postgresql_where=sa.text("revoked_at IS NOT NULL"),
+        sqlite_where=sa.text("revoked_at IS NOT NULL"),
+    )
+    op.create_index(
+        op.f("ix_refresh_tokens_expires_at"),
+        "refresh_tokens",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_refresh_tokens_expires_at"), table_name="refresh_tokens")
+    op.drop_index("ix_refresh_tokens_revoked_at", table_name="refresh_tokens")
@@ -0,0 +1,254 @@
+"""partition cards by board
+
+Revision ID: 7f3a91c5e0b4
+Revises: d27c5e8a1f34
+Create Date: 2026-10-19 10:02:51.117420
+
+On Postgres, cards and card_members become tables partitioned by
+HASH (board_id), into 16 partitions each. Postgres requires a partitioned
+table's primary and unique keys to include the partition key, so they gain
+board_id; card_members gets a board_id column and now references
+cards (id, board_id), following moves with ON UPDATE CASCADE.
+
+Rows are copied into the new tables, so the upgrade rewrites both tables
+under an exclusive lock: run it in a maintenance window. On SQLite the
+tables are rebuilt with the same keys, unpartitioned.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3a91c5e0b4"
+down_revision: str | Sequence[str] | None = "d27c5e8a1f34"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTITIONS = 16
+
+CARD_COLUMNS = (
+    "id, title, description, position, list_id, creator_id, label_ids, "
+    "created_at, deleted_at, board_id"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild_sqlite(partitioned=True)
+        return
+
+    op.execute(
+        "CREATE TABLE cards_partitioned (LIKE cards INCLUDING DEFAULTS) "
+        "PARTITION BY HASH (board_id)"
+    )
+    _create_partitions("cards")
+    op.execute(
+        f"INSERT INTO cards_partitioned ({CARD_COLUMNS}) "
+        f"SELECT {CARD_COLUMNS} FROM cards"
+    )
+    op.execute(
+        "CREATE TABLE card_members_partitioned ("
+        "id uuid NOT NULL, card_id uuid NOT NULL, user_id uuid NOT NULL, "
+        "board_id uuid NOT NULL) PARTITION BY HASH (board_id)"
+    )
+    _create_partitions("card_members")
+    op.execute(
+        "INSERT INTO card_members_partitioned (id, card_id, user_id, board_id) "
+        "SELECT card_members.id, card_members.card_id, card_members.user_id, "
+        "cards.board_id FROM card_members "
+        "JOIN cards ON cards.id = card_members.card_id"
+    )
+
+    op.drop_table("card_members")
+    op.drop_table("cards")
+    op.rename_table("cards_partitioned", "cards")
+    op.rename_table("card_members_partitioned", "card_members")
+
+    _create_card_keys(["id", "board_id"])
+    op.create_primary_key("card_members_pkey", "card_members", ["id", "board_id"])
+    op.create_unique_constraint(
+        "uq_card_members_card_user", "card_members", ["card_id", "user_id", "board_id"]
+    )
+    op.create_foreign_key(
+        "card_members_card_id_board_id_fkey",
+        "card_members",
+        "cards",
+        ["card_id", "board_id"],
+        ["id", "board_id"],
+        ondelete="CASCADE",
+        onupdate="CASCADE",
+    )
+    _create_card_member_user_key()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "sqlite":
+        _rebuild_sqlite(partitioned=False)
+        return
+
+    op.execute("CREATE TABLE cards_unpartitioned (LIKE cards INCLUDING DEFAULTS)")
+    op.execute(
+        f"INSERT INTO cards_unpartitioned ({CARD_COLUMNS}) "
+        f"SELECT {CARD_COLUMNS} FROM cards"
+    )
+    op.execute(
+        "CREATE TABLE card_members_unpartitioned ("
+        "id uuid NOT NULL, card_id uuid NOT NULL, user_id uuid NOT NULL)"
+    )
+    op.execute(
+        "INSERT INTO card_members_unpartitioned (id, card_id, user_id) "
+        "SELECT id, card_id, user_id FROM card_members"
+    )
+
+    op.drop_table("card_members")
+    op.drop_table("cards")
+    op.rename_table("cards_unpartitioned", "cards")
+    op.rename_table("card_members_unpartitioned", "card_members")
+
+    _create_card_keys(["id"])
+    op.create_primary_key("card_members_pkey", "card_members", ["id"])
+    op.create_unique_constraint(
+        "uq_card_members_card_user", "card_members", ["card_id", "user_id"]
+    )
+    op.create_foreign_key(
+        "card_members_card_id_fkey",
+        "card_members",
+        "cards",
+        ["card_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    _create_card_member_user_key()
+
+
+def _create_partitions(table: str) -> None:
+    for remainder in range(PARTITIONS):
+        op.execute(
+            f"CREATE TABLE {table}_p{remainder} PARTITION OF {table}_partitioned "
+            f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+        )
+
+
+def _create_card_keys(primary_key: list[str]) -> None:
+    op.create_primary_key("cards_pkey", "cards", primary_key)
+    op.create_index(
+        "ix_cards_list_id_position", "cards", ["list_id", "position"], unique=False
+    )
+    op.create_index(op.f("ix_cards_board_id"), "cards", ["board_id"], unique=False)
+    op.create_index(op.f("ix_cards_deleted_at"), "cards", ["deleted_at"], unique=False)
+    op.create_foreign_key(
+        "cards_list_id_fkey", "cards", "lists", ["list_id"], ["id"], ondelete="CASCADE"
+    )
+    op.create_foreign_key(
+        "cards_creator_id_fkey", "cards", "users", ["creator_id"], ["id"]
+    )
+    op.create_foreign_key(
+        "cards_board_id_fkey",
+        "cards",
+        "boards",
+        ["board_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def _create_card_member_user_key() -> None:
+    op.create_foreign_key(
+        "card_members_user_id_fkey",
+        "card_members",
+        "users",
+        ["user_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_index(
+        "ix_card_members_user_id", "card_members", ["user_id"], unique=False
+    )
+
+
+def _rebuild_sqlite(partitioned: bool) -> None:
+    """Recreate both tables with or without board_id in their keys. Foreign
+    keys must be off (``app.commands.migrate`` does so), or dropping the old
+    tables would cascade."""
+    uuid = sa.String(32)
+    card_key = ["id", "board_id"] if partitioned else ["id"]
+    op.create_table(
+        "cards_new",
+        sa.Column("id", uuid, nullable=False),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("list_id", uuid, nullable=False),
+        sa.Column("creator_id", uuid, nullable=False),
+        sa.Column("board_id", uuid, nullable=False),
+        sa.Column("label_ids", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["list_id"], ["lists.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["creator_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(*card_key),
+    )
+    member_columns = ["id", "card_id", "user_id"]
+    if partitioned:
+        member_columns.append("board_id")
+        member_keys = [
+            sa.Column("board_id", uuid, nullable=False),
+            sa.PrimaryKeyConstraint("id", "board_id"),
+            sa.UniqueConstraint(
+                "card_id", "user_id", "board_id", name="uq_card_members_card_user"
+            ),
+            sa.ForeignKeyConstraint(
+                ["card_id", "board_id"],
+                ["cards.id", "cards.board_id"],
+                ondelete="CASCADE",
+                onupdate="CASCADE",
+            ),
+        ]
+    else:
+        member_keys = [
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("card_id", "user_id", name="uq_card_members_card_user"),
+            sa.ForeignKeyConstraint(["card_id"], ["cards.id"], ondelete="CASCADE"),
+        ]
+    op.create_table(
+        "card_members_new",
+        sa.Column("id", uuid, nullable=False),
+        sa.Column("card_id", uuid, nullable=False),
+        sa.Column("user_id", uuid, nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        *member_keys,
+    )
+
+    op.execute(
+        f"INSERT INTO cards_new ({CARD_COLUMNS}) SELECT {CARD_COLUMNS} FROM cards"
+    )
+    if partitioned:
+        op.execute(
+            "INSERT INTO card_members_new (id, card_id, user_id, board_id) "
+            "SELECT card_members.id, card_members.card_id, card_members.user_id, "
+            "cards.board_id FROM card_members "
+            "JOIN cards ON cards.id = card_members.card_id"
+        )
+    else:
+        op.execute(
+            "INSERT INTO card_members_new (id, card_id, user_id) "
+            "SELECT id, card_id, user_id FROM card_members"
+        )
+
+    op.drop_table("card_members")
+    op.drop_table("cards")
+    op.rename_table("cards_new", "cards")
+    op.rename_table("card_members_new", "card_members")
+    op.create_index(
+        "ix_cards_list_id_position", "cards", ["list_id", "position"], unique=False
+    )
+    op.create_index(op.f("ix_cards_board_id"), "cards", ["board_id"], unique=False)
+    op.create_index(op.f("ix_cards_deleted_at"), "cards", ["deleted_at"], unique=False)
+    op.create_index(
+        "ix_card_members_user_id", "card_members", ["user_id"], unique=False
+    )
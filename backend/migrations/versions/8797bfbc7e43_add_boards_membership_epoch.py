@@ -0,0 +1,31 @@
+"""add boards.membership_epoch
+
+Revision ID: 8797bfbc7e43
+Revises: ea24e4538c0e
+Create Date: 2026-10-18 10:41:52.510367
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8797bfbc7e43"
+down_revision: str | Sequence[str] | None = "ea24e4538c0e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "boards",
+        sa.Column("membership_epoch", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("boards", "membership_epoch")
@@ -0,0 +1,39 @@
+"""add soft delete columns
+
+Revision ID: 9b4d2f61c8e7
+Revises: 3e7f0a6c9d12
+Create Date: 2026-10-18 17:05:48.220913
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4d2f61c8e7"
+down_revision: str | Sequence[str] | None = "3e7f0a6c9d12"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("boards", "lists", "cards")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        )
+        op.create_index(
+            op.f(f"ix_{table}_deleted_at"), table, ["deleted_at"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_index(op.f(f"ix_{table}_deleted_at"), table_name=table)
+        op.drop_column(table, "deleted_at")
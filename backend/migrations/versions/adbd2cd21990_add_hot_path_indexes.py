@@ -0,0 +1,60 @@
+"""add hot path indexes
+
+Revision ID: adbd2cd21990
+Revises: 8797bfbc7e43
+Create Date: 2026-10-18 11:20:05.731904
+
+Each index matches the filter (and ordering) of a request-path query:
+
+- cards (list_id, position): list_cards, create_card's last position lookup
+- lists (board_id, position): get_lists, create_list's max position lookup
+- board_members (board_id, user_id): every membership check
+- board_members (user_id, board_id): list_boards
+- card_members (user_id): assignments by user, user deletion cascade
+
+See benchmarks/query_plans.py for the plans before and after.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "adbd2cd21990"
+down_revision: str | Sequence[str] | None = "8797bfbc7e43"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_cards_list_id_position", "cards", ["list_id", "position"], unique=False
+    )
+    op.create_index(
+        "ix_lists_board_id_position", "lists", ["board_id", "position"], unique=False
+    )
+    op.create_index(
+        "ix_board_members_board_id_user_id",
+        "board_members",
+        ["board_id", "user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_board_members_user_id_board_id",
+        "board_members",
+        ["user_id", "board_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_card_members_user_id", "card_members", ["user_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_card_members_user_id", table_name="card_members")
+    op.drop_index("ix_board_members_user_id_board_id", table_name="board_members")
+    op.drop_index("ix_board_members_board_id_user_id", table_name="board_members")
+    op.drop_index("ix_lists_board_id_position", table_name="lists")
+    op.drop_index("ix_cards_list_id_position", table_name="cards")
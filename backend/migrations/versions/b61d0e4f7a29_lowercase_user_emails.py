@@ -0,0 +1,51 @@
+"""lowercase user emails
+
+Revision ID: b61d0e4f7a29
+Revises: 7f3a91c5e0b4
+Create Date: 2026-10-19 09:42:18.530417
+
+Emails are now stored lower-cased. Existing rows are normalized, and a
+unique index on lower(email) rejects duplicates that differ only in case.
+Accounts that already collide that way have to be merged by hand first;
+the upgrade refuses to run and lists them.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b61d0e4f7a29"
+down_revision: str | Sequence[str] | None = "7f3a91c5e0b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    duplicates = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT lower(email) FROM users "
+                "GROUP BY lower(email) HAVING count(*) > 1"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if duplicates:
+        raise RuntimeError(
+            "Users share an email up to case, merge them first: "
+            + ", ".join(sorted(duplicates))
+        )
+    op.execute("UPDATE users SET email = lower(email) WHERE email <> lower(email)")
+    op.create_index(
+        "ix_users_email_lower", "users", [sa.text("lower(email)")], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_email_lower", table_name="users")
@@ -0,0 +1,36 @@
+"""add board_snapshots table
+
+Revision ID: c92d7e14b385
+Revises: e5a8c3f1b027
+Create Date: 2026-10-19 14:12:40.518302
+
+Starts empty: each board's snapshot is built on its next write, or ahead of
+time by app.commands.rebuild_snapshots.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c92d7e14b385"
+down_revision: str | Sequence[str] | None = "e5a8c3f1b027"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "board_snapshots",
+        sa.Column("board_id", sa.UUID(), nullable=False),
+        sa.Column("document", sa.JSON(), nullable=False),
+        sa.ForeignKeyConstraint(["board_id"], ["boards.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("board_id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("board_snapshots")
@@ -0,0 +1,52 @@
+"""add board_id to cards
+
+Revision ID: d27c5e8a1f34
+Revises: 9b4d2f61c8e7
+Create Date: 2026-10-18 19:31:07.482615
+
+cards.board_id duplicates lists.board_id so card authorization and
+board-wide card queries are single-table lookups. Cards of lists that are
+already soft-deleted get the list's deleted_at, as delete_list now does.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d27c5e8a1f34"
+down_revision: str | Sequence[str] | None = "9b4d2f61c8e7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("cards", sa.Column("board_id", sa.UUID(), nullable=True))
+    op.execute(
+        "UPDATE cards SET board_id = lists.board_id "
+        "FROM lists WHERE lists.id = cards.list_id"
+    )
+    op.execute(
+        "UPDATE cards SET deleted_at = lists.deleted_at "
+        "FROM lists WHERE lists.id = cards.list_id "
+        "AND lists.deleted_at IS NOT NULL AND cards.deleted_at IS NULL"
+    )
+    op.alter_column("cards", "board_id", nullable=False)
+    op.create_index(op.f("ix_cards_board_id"), "cards", ["board_id"], unique=False)
+    op.create_foreign_key(
+        "cards_board_id_fkey",
+        "cards",
+        "boards",
+        ["board_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("cards_board_id_fkey", "cards", type_="foreignkey")
+    op.drop_index(op.f("ix_cards_board_id"), table_name="cards")
+    op.drop_column("cards", "board_id")
@@ -0,0 +1,39 @@
+"""add lists.card_count
+
+Revision ID: e5a8c3f1b027
+Revises: b61d0e4f7a29
+Create Date: 2026-10-19 11:06:52.194630
+
+Number of live cards in each list, maintained by the card and list routes.
+Filled here from the cards table, the same way app.commands.recount_cards
+repairs it.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a8c3f1b027"
+down_revision: str | Sequence[str] | None = "b61d0e4f7a29"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "lists",
+        sa.Column("card_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE lists SET card_count = ("
+        "SELECT count(*) FROM cards WHERE cards.board_id = lists.board_id "
+        "AND cards.list_id = lists.id AND cards.deleted_at IS NULL)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("lists", "card_count")
@@ -0,0 +1,58 @@
+"""add personal_access_tokens table
+
+Revision ID: ea24e4538c0e
+Revises: f8096af8a2c8
+Create Date: 2026-10-18 10:03:17.884210
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ea24e4538c0e"
+down_revision: str | Sequence[str] | None = "f8096af8a2c8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "personal_access_tokens",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("token_hash", sa.String(length=64), nullable=False),
+        sa.Column("scopes", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_personal_access_tokens_user_id"),
+        "personal_access_tokens",
+        ["user_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_personal_access_tokens_token_hash"),
+        "personal_access_tokens",
+        ["token_hash"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_personal_access_tokens_token_hash"),
+        table_name="personal_access_tokens",
+    )
+    op.drop_index(
+        op.f("ix_personal_access_tokens_user_id"), table_name="personal_access_tokens"
+    )
+    op.drop_table("personal_access_tokens")
@@ -5,80 +5,23 @@ Uses an in-memory SQLite database so no external Postgres is required.
 Every test function gets a fresh DB and a fresh FastAPI TestClient.
 """
 
-import json
 import uuid
 from datetime import UTC, datetime
 
 import pytest
-from sqlalchemy import String, Text, create_engine, event
-from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.ext.compiler import compiles
+from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
-from sqlalchemy.types import TypeDecorator
 
 from app.core.database import Base
 from app.core.security import hash_password
+from app.core.sqlite import configure_sqlite_engine
 from app.models.board import Board
 from app.models.board_member import BoardMember
 from app.models.card import Card
 from app.models.list import List as ListModel
 from app.models.user import User
 
-
-class JSONEncodedList(TypeDecorator):
-    """Stores a Python list as a JSON-encoded TEXT column (SQLite compat)."""
-
-    impl = Text
-    cache_ok = True
-
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return None
-        return json.dumps(value)
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return []
-        return json.loads(value)
-
-
-class SQLiteUUID(TypeDecorator):
-    """Stores UUID as a 32-char hex string in SQLite, returns uuid.UUID."""
-
-    impl = String(32)
-    cache_ok = True
-
-    def process_bind_param(self, value, dialect):
-        if value is None:
-            return None
-        if isinstance(value, uuid.UUID):
-            return value.hex
-        # Accept string representations too
-        return uuid.UUID(str(value)).hex
-
-    def process_result_value(self, value, dialect):
-        if value is None:
-            return None
-        if isinstance(value, uuid.UUID):
-            return value
-        return uuid.UUID(value)
-
-
-@compiles(ARRAY, "sqlite")
-def _compile_array_sqlite(type_, compiler, **kw):
-    return "TEXT"
-
-
-_orig_label_ids = Card.__table__.c.label_ids
-_orig_label_ids.type = JSONEncodedList()
-
-for table in Base.metadata.tables.values():
-    for col in table.columns:
-        if isinstance(col.type, PG_UUID):
-            col.type = SQLiteUUID()
-
 SQLALCHEMY_DATABASE_URL = "sqlite://"
 
 engine = create_engine(
@@ -86,16 +29,11 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+configure_sqlite_engine(engine)
 
-
-@event.listens_for(engine, "connect")
-def _set_sqlite_pragma(dbapi_connection, _connection_record):
-    cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
-
-
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 
 @pytest.fixture(autouse=True)
@@ -233,6 +171,7 @@ def make_card(db):
             description=description,
             position=position,
             list_id=list_obj.id,
+            board_id=list_obj.board_id,
             creator_id=creator.id,
             label_ids=label_ids if label_ids is not None else [],
             created_at=datetime.now(UTC),
@@ -0,0 +1,169 @@
+"""Tests for the async read endpoints served in DATABASE_ASYNC mode."""
+
+import uuid
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app.api import auth as auth_module
+from app.api.deps import get_async_db, get_db
+from app.api.router import api_router, async_reads_router
+from app.core.database import Base, async_database_url
+from app.core.sqlite import configure_sqlite_engine
+from tests.conftest import auth_header, register_and_login
+
+
+@pytest.fixture()
+def async_client(tmp_path):
+    """Client for an app in async mode. Sync writes and async reads share one
+    SQLite file, as they would share Postgres."""
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    sync_engine = create_engine(url)
+    async_engine = create_async_engine(async_database_url(url), poolclass=NullPool)
+    configure_sqlite_engine(sync_engine)
+    configure_sqlite_engine(async_engine.sync_engine)
+    Base.metadata.create_all(bind=sync_engine)
+
+    make_sync_session = sessionmaker(bind=sync_engine, autoflush=False)
+    make_async_session = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    sync_sessions = []
+
+    def override_get_db():
+        db = make_sync_session()
+        sync_sessions.append(db)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async_sessions = []
+
+    async def override_get_async_db():
+        async with make_async_session() as db:
+            async_sessions.append(db)
+            yield db
+
+    app = FastAPI()
+    app.include_router(async_reads_router, prefix="/api")
+    app.include_router(api_router)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_module.get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(app) as c:
+        c.async_sessions = async_sessions
+        c.sync_sessions = sync_sessions
+        yield c
+    sync_engine.dispose()
+
+
+class TestAsyncDatabaseUrl:
+    def test_postgres_uses_asyncpg(self):
+        url = async_database_url("postgresql://u:p@db:5432/trello")
+        assert url.drivername == "postgresql+asyncpg"
+        assert url.password == "p"
+
+    def test_explicit_sync_driver_is_replaced(self):
+        url = async_database_url("postgresql+psycopg2://u@db/trello")
+        assert url.drivername == "postgresql+asyncpg"
+
+    def test_sqlite_uses_aiosqlite(self):
+        assert async_database_url("sqlite://").drivername == "sqlite+aiosqlite"
+
+
+class TestAsyncReads:
+    def test_async_routes_shadow_sync_ones(self, async_client):
+        _, _, headers = register_and_login(async_client)
+        assert async_client.async_sessions == []
+
+        async_client.get("/api/boards/", headers=headers)
+        assert len(async_client.async_sessions) == 1
+
+    def test_board_list_and_cards(self, async_client):
+        client = async_client
+        _, _, headers = register_and_login(client)
+        board_id = client.post(
+            "/api/boards/", json={"title": "Async"}, headers=headers
+        ).json()["id"]
+        list_id = client.post(
+            f"/api/lists/?board_id={board_id}", json={"title": "L"}, headers=headers
+        ).json()["id"]
+        for title in ("first", "second"):
+            client.post(
+                f"/api/cards/?list_id={list_id}", json={"title": title}, headers=headers
+            )
+
+        boards = client.get("/api/boards/", headers=headers).json()
+        assert [b["id"] for b in boards] == [board_id]
+        resp = client.get(f"/api/boards/{board_id}", headers=headers)
+        assert resp.json()["title"] == "Async"
+        lists = client.get(f"/api/lists/board/{board_id}", headers=headers).json()
+        assert [lst["id"] for lst in lists] == [list_id]
+        cards = client.get(f"/api/cards/?list_id={list_id}", headers=headers).json()
+        assert [c["title"] for c in cards] == ["first", "second"]
+        streamed = client.get(
+            f"/api/cards/?list_id={list_id}&stream=true", headers=headers
+        )
+        assert streamed.json() == cards
+
+    def test_non_member_is_rejected(self, async_client):
+        client = async_client
+        _, _, headers_alice = register_and_login(
+            client, email="alice@example.com", username="alice"
+        )
+        board_id = client.post(
+            "/api/boards/", json={"title": "Private"}, headers=headers_alice
+        ).json()["id"]
+        _, _, headers_bob = register_and_login(
+            client, email="bob@example.com", username="bob"
+        )
+
+        resp = client.get(f"/api/boards/{board_id}", headers=headers_bob)
+        assert resp.status_code == 403
+        resp = client.get(f"/api/lists/board/{board_id}", headers=headers_bob)
+        assert resp.status_code == 403
+
+    def test_deleted_board_is_hidden(self, async_client):
+        client = async_client
+        _, _, headers = register_and_login(client)
+        board_id = client.post(
+            "/api/boards/", json={"title": "Gone"}, headers=headers
+        ).json()["id"]
+        client.delete(f"/api/boards/{board_id}", headers=headers)
+
+        assert client.get("/api/boards/", headers=headers).json() == []
+        resp = client.get(f"/api/boards/{board_id}", headers=headers)
+        assert resp.status_code == 404
+
+    def test_unknown_list(self, async_client):
+        _, _, headers = register_and_login(async_client)
+        resp = async_client.get(f"/api/cards/?list_id={uuid.uuid4()}", headers=headers)
+        assert resp.status_code == 404
+
+    def test_invalid_token(self, async_client):
+        resp = async_client.get(
+            "/api/boards/", headers={"Authorization": "Bearer nope"}
+        )
+        assert resp.status_code == 401
+
+    def test_token_scope_checked_on_the_async_session(self, async_client):
+        client = async_client
+        _, _, headers = register_and_login(client)
+        token = client.post(
+            "/api/users/me/tokens/",
+            json={"name": "ci", "scopes": ["write"]},
+            headers=headers,
+        ).json()["token"]
+        opened = len(client.sync_sessions)
+
+        resp = client.get("/api/boards/", headers=auth_header(token))
+        assert resp.status_code == 403
+        assert resp.json()["detail"] == "Token lacks the 'read' scope"
+        assert len(client.sync_sessions) == opened
+        assert len(client.async_sessions) == 1
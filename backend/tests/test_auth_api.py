@@ -31,6 +31,44 @@ class TestRegister:
         assert resp.status_code == 400
         assert "already used" in resp.json()["detail"].lower()
 
+    def test_register_stores_lowercased_email(self, client):
+        resp = client.post(
+            "/api/auth/register",
+            json={"email": "Mixed@Example.COM", "username": "mx", "password": "pass"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["email"] == "mixed@example.com"
+
+        resp = client.post(
+            "/api/auth/register",
+            json={"email": "mixed@example.com", "username": "mx2", "password": "pass"},
+        )
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "Email already used"
+
+    def test_register_duplicate_username(self, client):
+        client.post(
+            "/api/auth/register",
+            json={"email": "one@example.com", "username": "same", "password": "pass"},
+        )
+        resp = client.post(
+            "/api/auth/register",
+            json={"email": "two@example.com", "username": "same", "password": "pass"},
+        )
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "Username already used"
+
+        # The failed insert must not poison the session for later requests.
+        resp = client.post(
+            "/api/auth/register",
+            json={
+                "email": "three@example.com",
+                "username": "other",
+                "password": "pass",
+            },
+        )
+        assert resp.status_code == 200
+
     def test_register_invalid_email(self, client):
         resp = client.post(
             "/api/auth/register",
@@ -56,8 +94,20 @@ class TestLogin:
         assert resp.status_code == 200
         data = resp.json()
         assert "access_token" in data
+        assert "refresh_token" in data
         assert data["token_type"] == "bearer"
 
+    def test_login_ignores_email_case(self, client):
+        client.post(
+            "/api/auth/register",
+            json={"email": "case@example.com", "username": "case", "password": "pass"},
+        )
+        resp = client.post(
+            "/api/auth/login",
+            json={"email": " Case@Example.com", "password": "pass"},
+        )
+        assert resp.status_code == 200
+
     def test_login_wrong_password(self, client):
         client.post(
             "/api/auth/register",
@@ -79,3 +129,120 @@ class TestLogin:
     def test_login_missing_fields(self, client):
         resp = client.post("/api/auth/login", json={})
         assert resp.status_code == 422
+
+    def test_login_rehashes_outdated_password(self, client, db, monkeypatch):
+        from app.core import security
+        from app.models.user import User
+
+        monkeypatch.setattr(
+            security, "pwd_context", security.build_pwd_context("bcrypt", 4)
+        )
+        client.post(
+            "/api/auth/register",
+            json={"email": "rh@example.com", "username": "rh", "password": "pass"},
+        )
+        user = db.query(User).filter(User.email == "rh@example.com").first()
+        assert user.password_hash.startswith("$2b$04$")
+
+        monkeypatch.setattr(
+            security, "pwd_context", security.build_pwd_context("bcrypt", 5)
+        )
+        resp = client.post(
+            "/api/auth/login",
+            json={"email": "rh@example.com", "password": "pass"},
+        )
+        assert resp.status_code == 200
+        db.refresh(user)
+        assert user.password_hash.startswith("$2b$05$")
+
+
+def _login(client, email="rt@example.com", password="pass"):
+    client.post(
+        "/api/auth/register",
+        json={"email": email, "username": email.split("@")[0], "password": password},
+    )
+    resp = client.post("/api/auth/login", json={"email": email, "password": password})
+    assert resp.status_code == 200
+    return resp.json()
+
+
+class TestRefresh:
+    def test_refresh_rotates_tokens(self, client):
+        tokens = _login(client)
+        resp = client.post(
+            "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["refresh_token"] != tokens["refresh_token"]
+
+        me = client.get(
+            "/api/users/me",
+            headers={"Authorization": f"Bearer {data['access_token']}"},
+        )
+        assert me.status_code == 200
+
+    def test_refresh_unknown_token(self, client):
+        resp = client.post("/api/auth/refresh", json={"refresh_token": "nope"})
+        assert resp.status_code == 401
+
+    def test_reused_refresh_token_revokes_session(self, client):
+        tokens = _login(client)
+        rotated = client.post(
+            "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        ).json()
+
+        replay = client.post(
+            "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert replay.status_code == 401
+
+        # The legitimate successor is revoked along with the access tokens.
+        resp = client.post(
+            "/api/auth/refresh", json={"refresh_token": rotated["refresh_token"]}
+        )
+        assert resp.status_code == 401
+        me = client.get(
+            "/api/users/me",
+            headers={"Authorization": f"Bearer {rotated['access_token']}"},
+        )
+        assert me.status_code == 401
+
+    def test_expired_refresh_token(self, client, db):
+        from datetime import UTC, datetime, timedelta
+
+        from app.models.refresh_token import RefreshToken
+
+        tokens = _login(client)
+        db.query(RefreshToken).update(
+            {RefreshToken.expires_at: datetime.now(UTC) - timedelta(seconds=1)}
+        )
+        db.commit()
+
+        resp = client.post(
+            "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert resp.status_code == 401
+        assert resp.json()["detail"] == "Refresh token expired"
+
+
+class TestLogout:
+    def test_logout_revokes_access_and_refresh(self, client):
+        tokens = _login(client)
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert client.get("/api/users/me", headers=headers).status_code == 200
+
+        resp = client.post(
+            "/api/auth/logout", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert resp.status_code == 204
+
+        assert client.get("/api/users/me", headers=headers).status_code == 401
+        resp = client.post(
+            "/api/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        )
+        assert resp.status_code == 401
+
+    def test_logout_unknown_token_is_noop(self, client):
+        resp = client.post("/api/auth/logout", json={"refresh_token": "nope"})
+        assert resp.status_code == 204
@@ -25,6 +25,18 @@ class TestAddBoardMember:
         assert resp.status_code == 201
         assert resp.json()["detail"] == "Member added"
 
+    def test_add_member_email_case_insensitive(self, client):
+        _, _, headers_alice = register_and_login(client)
+        board_id = _setup_board(client, headers_alice)
+        register_and_login(client, email="bob@example.com", username="bob")
+
+        resp = client.post(
+            f"/api/boards/{board_id}/members/",
+            json={"email": "BOB@example.com"},
+            headers=headers_alice,
+        )
+        assert resp.status_code == 201
+
     def test_add_member_user_not_found(self, client):
         _, _, headers = register_and_login(client)
         board_id = _setup_board(client, headers)
@@ -0,0 +1,205 @@
+"""Tests for the board snapshot read model."""
+
+import json
+import uuid
+
+from app.commands.rebuild_snapshots import rebuild_snapshots
+from app.core.board_snapshots import build_document, read_document
+from app.models.board_snapshot import BoardSnapshotEntry
+from tests.conftest import register_and_login
+
+
+def _board(client, headers, title="Board"):
+    return client.post("/api/boards/", json={"title": title}, headers=headers).json()
+
+
+def _list(client, headers, board_id, title):
+    return client.post(
+        f"/api/lists/?board_id={board_id}", json={"title": title}, headers=headers
+    ).json()
+
+
+def _card(client, headers, list_id, title):
+    return client.post(
+        f"/api/cards/?list_id={list_id}", json={"title": title}, headers=headers
+    ).json()
+
+
+def _snapshot(client, headers, board_id):
+    resp = client.get(f"/api/boards/{board_id}/snapshot", headers=headers)
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def _titles(snapshot):
+    return {
+        lst["title"]: [c["title"] for c in lst["cards"]] for lst in snapshot["lists"]
+    }
+
+
+def _matches_rows(db, snapshot):
+    """The snapshot holds what building it from the rows gives."""
+    return snapshot == json.loads(build_document(db, uuid.UUID(snapshot["id"])))
+
+
+class TestBoardSnapshot:
+    def test_new_board(self, client):
+        _, _, headers = register_and_login(client)
+        board = _board(client, headers, title="Fresh")
+
+        snapshot = _snapshot(client, headers, board["id"])
+        assert snapshot["id"] == board["id"]
+        assert snapshot["title"] == "Fresh"
+        assert snapshot["lists"] == []
+
+    def test_follows_list_and_card_writes(self, client, db):
+        _, _, headers = register_and_login(client)
+        board_id = _board(client, headers)["id"]
+        todo = _list(client, headers, board_id, "Todo")
+        done = _list(client, headers, board_id, "Done")
+        first = _card(client, headers, todo["id"], "first")
+        second = _card(client, headers, todo["id"], "second")
+        _card(client, headers, todo["id"], "third")
+
+        client.put(
+            f"/api/cards/{second['id']}",
+            json={"list_id": done["id"], "title": "second!"},
+            headers=headers,
+        )
+        client.delete(f"/api/cards/{first['id']}", headers=headers)
+        client.put(f"/api/lists/{done['id']}", json={"position": -1}, headers=headers)
+
+        snapshot = _snapshot(client, headers, board_id)
+        assert _titles(snapshot) == {"Done": ["second!"], "Todo": ["third"]}
+        assert [lst["title"] for lst in snapshot["lists"]] == ["Done", "Todo"]
+        assert [lst["card_count"] for lst in snapshot["lists"]] == [1, 1]
+        assert _matches_rows(db, snapshot)
+
+        client.post(f"/api/cards/{first['id']}/restore", headers=headers)
+        client.delete(f"/api/lists/{todo['id']}", headers=headers)
+        assert _titles(_snapshot(client, headers, board_id)) == {"Done": ["second!"]}
+
+        client.post(f"/api/lists/{todo['id']}/restore", headers=headers)
+        snapshot = _snapshot(client, headers, board_id)
+        assert _titles(snapshot) == {"Done": ["second!"], "Todo": ["first", "third"]}
+        assert _matches_rows(db, snapshot)
+
+    def test_follows_assignees_and_board_edits(self, client):
+        alice, _, headers = register_and_login(client)
+        board_id = _board(client, headers)["id"]
+        list_id = _list(client, headers, board_id, "Todo")["id"]
+        card_id = _card(client, headers, list_id, "task")["id"]
+
+        client.post(
+            f"/api/cards/{card_id}/members/",
+            json={"email": "alice@example.com"},
+            headers=headers,
+        )
+        client.put(
+            f"/api/boards/{board_id}", json={"title": "Renamed"}, headers=headers
+        )
+        snapshot = _snapshot(client, headers, board_id)
+        assert snapshot["title"] == "Renamed"
+        assert snapshot["lists"][0]["cards"][0]["assignee_ids"] == [alice["id"]]
+
+        client.request(
+            "DELETE",
+            f"/api/cards/{card_id}/members/",
+            json={"email": "alice@example.com"},
+            headers=headers,
+        )
+        snapshot = _snapshot(client, headers, board_id)
+        assert snapshot["lists"][0]["cards"][0]["assignee_ids"] == []
+
+    def test_card_moved_to_another_board(self, client, db):
+        _, _, headers = register_and_login(client)
+        source = _board(client, headers, title="Source")["id"]
+        target = _board(client, headers, title="Target")["id"]
+        source_list = _list(client, headers, source, "From")["id"]
+        target_list = _list(client, headers, target, "To")["id"]
+        card_id = _card(client, headers, source_list, "traveller")["id"]
+
+        client.put(
+            f"/api/cards/{card_id}", json={"list_id": target_list}, headers=headers
+        )
+
+        assert _titles(_snapshot(client, headers, source)) == {"From": []}
+        snapshot = _snapshot(client, headers, target)
+        assert _titles(snapshot) == {"To": ["traveller"]}
+        assert _matches_rows(db, snapshot)
+
+    def test_not_member(self, client):
+        _, _, headers_alice = register_and_login(client)
+        board_id = _board(client, headers_alice)["id"]
+        _, _, headers_bob = register_and_login(
+            client, email="bob@example.com", username="bob"
+        )
+
+        resp = client.get(f"/api/boards/{board_id}/snapshot", headers=headers_bob)
+        assert resp.status_code == 403
+
+    def test_board_without_snapshot(self, client, db):
+        _, _, headers = register_and_login(client)
+        board_id = _board(client, headers)["id"]
+        list_id = _list(client, headers, board_id, "Todo")["id"]
+        db.query(BoardSnapshotEntry).delete()
+        db.commit()
+
+        # Built from the rows on read until the board entry is stored.
+        assert _titles(_snapshot(client, headers, board_id)) == {"Todo": []}
+        _card(client, headers, list_id, "task")
+        assert db.query(BoardSnapshotEntry).count() == 1
+        assert _titles(_snapshot(client, headers, board_id)) == {"Todo": ["task"]}
+
+    def test_card_write_touches_only_its_entry(self, client, db):
+        _, _, headers = register_and_login(client)
+        board_id = _board(client, headers)["id"]
+        list_id = _list(client, headers, board_id, "Todo")["id"]
+        card_id = _card(client, headers, list_id, "task")["id"]
+        _card(client, headers, list_id, "other")
+        before = {
+            entry.entry_id: entry.document for entry in db.query(BoardSnapshotEntry)
+        }
+
+        client.put(f"/api/cards/{card_id}", json={"title": "renamed"}, headers=headers)
+
+        db.expire_all()
+        after = {
+            entry.entry_id: entry.document for entry in db.query(BoardSnapshotEntry)
+        }
+        changed = {
+            entry_id for entry_id in after if after[entry_id] != before[entry_id]
+        }
+        assert changed == {uuid.UUID(card_id)}
+
+
+class TestRebuildSnapshots:
+    def test_builds_missing_and_repairs_drifted(
+        self, db, user_alice, make_board, make_list, make_card
+    ):
+        built = make_board(owner=user_alice, title="built")
+        drifted = make_board(owner=user_alice, title="drifted")
+        for board in (built, drifted):
+            make_card(list_obj=make_list(board=board), creator=user_alice)
+
+        assert rebuild_snapshots(db, batch_size=1) == 2
+        entries = db.query(BoardSnapshotEntry).filter(
+            BoardSnapshotEntry.board_id == drifted.id
+        )
+        entries.filter(BoardSnapshotEntry.kind == "card").update(
+            {BoardSnapshotEntry.document: '{"title": "stale"}'}
+        )
+        db.add(
+            BoardSnapshotEntry(
+                board_id=drifted.id,
+                entry_id=uuid.uuid4(),
+                kind="list",
+                document="{}",
+            )
+        )
+        db.commit()
+
+        assert rebuild_snapshots(db) == 1
+        assert read_document(db, drifted.id) == build_document(db, drifted.id)
+        assert entries.count() == 3
+        assert rebuild_snapshots(db) == 0
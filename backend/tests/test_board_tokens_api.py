@@ -0,0 +1,95 @@
+"""Tests for board-scoped read tokens."""
+
+from tests.conftest import auth_header, register_and_login
+
+
+def _setup(client):
+    _, _, alice = register_and_login(client)
+    board_id = client.post("/api/boards/", json={"title": "B"}, headers=alice).json()[
+        "id"
+    ]
+    list_id = client.post(
+        "/api/lists/", json={"title": "L"}, params={"board_id": board_id}, headers=alice
+    ).json()["id"]
+    client.post(
+        "/api/cards/", json={"title": "C"}, params={"list_id": list_id}, headers=alice
+    )
+    return alice, board_id, list_id
+
+
+def _scoped_token(client, headers, board_id):
+    resp = client.post(f"/api/boards/{board_id}/scoped-tokens", headers=headers)
+    assert resp.status_code == 201, resp.text
+    return resp.json()["access_token"]
+
+
+class TestScopedTokens:
+    def test_reads_lists_and_cards(self, client):
+        alice, board_id, list_id = _setup(client)
+        token = _scoped_token(client, alice, board_id)
+
+        resp = client.get(f"/api/lists/board/{board_id}", headers=auth_header(token))
+        assert resp.status_code == 200
+        assert len(resp.json()) == 1
+
+        resp = client.get(
+            "/api/cards/", params={"list_id": list_id}, headers=auth_header(token)
+        )
+        assert resp.status_code == 200
+        assert len(resp.json()) == 1
+
+    def test_non_member_cannot_mint(self, client):
+        _, board_id, _ = _setup(client)
+        _, _, bob = register_and_login(client, email="bob@example.com", username="bob")
+
+        resp = client.post(f"/api/boards/{board_id}/scoped-tokens", headers=bob)
+        assert resp.status_code == 403
+
+    def test_not_accepted_as_user_token(self, client):
+        alice, board_id, _ = _setup(client)
+        token = _scoped_token(client, alice, board_id)
+
+        assert (
+            client.get("/api/users/me", headers=auth_header(token)).status_code == 401
+        )
+        resp = client.post(
+            "/api/lists/",
+            json={"title": "X"},
+            params={"board_id": board_id},
+            headers=auth_header(token),
+        )
+        assert resp.status_code == 401
+
+    def test_other_board_rejected(self, client):
+        alice, board_id, _ = _setup(client)
+        other_id = client.post(
+            "/api/boards/", json={"title": "Other"}, headers=alice
+        ).json()["id"]
+        token = _scoped_token(client, alice, board_id)
+
+        resp = client.get(f"/api/lists/board/{other_id}", headers=auth_header(token))
+        assert resp.status_code == 403
+
+    def test_removing_a_member_revokes_outstanding_tokens(self, client):
+        alice, board_id, _ = _setup(client)
+        _, _, bob = register_and_login(client, email="bob@example.com", username="bob")
+        client.post(
+            f"/api/boards/{board_id}/members/",
+            json={"email": "bob@example.com"},
+            headers=alice,
+        )
+        token = _scoped_token(client, bob, board_id)
+        url = f"/api/lists/board/{board_id}"
+        assert client.get(url, headers=auth_header(token)).status_code == 200
+
+        client.request(
+            "DELETE",
+            f"/api/boards/{board_id}/members/",
+            json={"email": "bob@example.com"},
+            headers=alice,
+        )
+        assert client.get(url, headers=auth_header(token)).status_code == 401
+
+        # Remaining members simply mint a new one.
+        fresh = _scoped_token(client, alice, board_id)
+        assert client.get(url, headers=auth_header(fresh)).status_code == 200
@@ -1,7 +1,12 @@
 """Tests for /api/boards endpoints."""
 
 import uuid
+from datetime import UTC, datetime, timedelta
 
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.models.board import Board
 from tests.conftest import register_and_login
 
 
@@ -53,6 +58,32 @@ class TestCreateBoard:
         assert data["background_kind"] == "unsplash"
         assert data["background_value"] == "https://images.unsplash.com/photo"
 
+    def test_create_board_created_at_reads_back_the_same(self, client):
+        _, _, headers = register_and_login(client)
+        created = client.post("/api/boards/", json={"title": "T"}, headers=headers)
+        board_id = created.json()["id"]
+
+        fetched = client.get(f"/api/boards/{board_id}", headers=headers).json()
+        assert fetched["created_at"] == created.json()["created_at"]
+        assert created.json()["created_at"].endswith("Z")
+
+    def test_create_board_does_not_reload_the_row(self, client, db):
+        _, _, headers = register_and_login(client)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.get_bind(), "before_cursor_execute", record)
+        try:
+            resp = client.post("/api/boards/", json={"title": "T"}, headers=headers)
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", record)
+
+        assert resp.status_code == 201
+        assert resp.json()["title"] == "T"
+        assert not [s for s in statements if s.startswith("SELECT boards")]
+
     def test_create_board_no_title(self, client):
         _, _, headers = register_and_login(client)
         resp = client.post("/api/boards/", json={}, headers=headers)
@@ -184,3 +215,79 @@ class TestDeleteBoard:
         fake_id = str(uuid.uuid4())
         resp = client.delete(f"/api/boards/{fake_id}", headers=headers)
         assert resp.status_code == 404
+
+    def test_delete_board_hides_content(self, client):
+        _, _, headers = register_and_login(client)
+        board_id = client.post(
+            "/api/boards/", json={"title": "Bye"}, headers=headers
+        ).json()["id"]
+        list_id = client.post(
+            f"/api/lists/?board_id={board_id}", json={"title": "L"}, headers=headers
+        ).json()["id"]
+
+        client.delete(f"/api/boards/{board_id}", headers=headers)
+
+        assert client.get("/api/boards/", headers=headers).json() == []
+        resp = client.get(f"/api/lists/board/{board_id}", headers=headers)
+        assert resp.status_code == 403
+        resp = client.get(f"/api/cards/?list_id={list_id}", headers=headers)
+        assert resp.status_code == 403
+
+
+class TestRestoreBoard:
+    def test_restore_board(self, client):
+        _, _, headers = register_and_login(client)
+        board_id = client.post(
+            "/api/boards/", json={"title": "Oops"}, headers=headers
+        ).json()["id"]
+        client.delete(f"/api/boards/{board_id}", headers=headers)
+
+        resp = client.post(f"/api/boards/{board_id}/restore", headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["title"] == "Oops"
+
+        resp = client.get(f"/api/boards/{board_id}", headers=headers)
+        assert resp.status_code == 200
+
+    def test_restore_board_not_owner(self, client):
+        _, _, headers_alice = register_and_login(
+            client, email="alice@example.com", username="alice"
+        )
+        board_id = client.post(
+            "/api/boards/", json={"title": "Alice's"}, headers=headers_alice
+        ).json()["id"]
+        client.delete(f"/api/boards/{board_id}", headers=headers_alice)
+
+        _, _, headers_bob = register_and_login(
+            client, email="bob@example.com", username="bob"
+        )
+        resp = client.post(f"/api/boards/{board_id}/restore", headers=headers_bob)
+        assert resp.status_code == 403
+
+    def test_restore_board_not_deleted(self, client):
+        _, _, headers = register_and_login(client)
+        board_id = client.post(
+            "/api/boards/", json={"title": "Live"}, headers=headers
+        ).json()["id"]
+        resp = client.post(f"/api/boards/{board_id}/restore", headers=headers)
+        assert resp.status_code == 404
+
+    def test_restore_board_after_retention(self, client, db):
+        _, _, headers = register_and_login(client)
+        board_id = client.post(
+            "/api/boards/", json={"title": "Old"}, headers=headers
+        ).json()["id"]
+        client.delete(f"/api/boards/{board_id}", headers=headers)
+        board = (
+            db.query(Board)
+            .execution_options(include_deleted=True)
+            .filter(Board.id == uuid.UUID(board_id))
+            .one()
+        )
+        board.deleted_at = datetime.now(UTC) - timedelta(
+            days=settings.SOFT_DELETE_RETENTION_DAYS + 1
+        )
+        db.commit()
+
+        resp = client.post(f"/api/boards/{board_id}/restore", headers=headers)
+        assert resp.status_code == 404
@@ -0,0 +1,42 @@
+"""Tests for the in-process TTL/LRU cache."""
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
+
+
+class TestTTLCache:
+    def test_get_missing(self):
+        assert TTLCache(maxsize=2, ttl=60).get("x") is None
+
+    def test_set_and_get(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert len(cache) == 2
+
+    def test_entries_expire(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        now[0] += 10
+        assert cache.get("a") is None
+
+    def test_pop_and_clear(self):
+        cache = TTLCache(maxsize=4, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,34 @@
+"""Tests for the password hashing calibration command."""
+
+from app.commands.calibrate_hashing import main, measure_hash_ms, recommend_rounds
+
+
+class TestRecommendRounds:
+    def test_bcrypt_picks_highest_cost_under_target(self):
+        timings = {4: 1.0, 5: 2.0, 6: 4.0, 7: 8.0, 8: 16.0}
+        rounds, samples = recommend_rounds(
+            "bcrypt", 10.0, measure=lambda _scheme, r: timings[r]
+        )
+        assert rounds == 7
+        assert samples[-1] == (8, 16.0)
+
+    def test_bcrypt_never_goes_below_minimum(self):
+        rounds, _ = recommend_rounds("bcrypt", 0.1, measure=lambda _s, _r: 50.0)
+        assert rounds == 4
+
+    def test_linear_scheme_is_extrapolated(self):
+        rounds, samples = recommend_rounds(
+            "pbkdf2_sha256", 100.0, measure=lambda _s, r: r / 1000
+        )
+        assert rounds == 100_000
+        assert len(samples) == 1
+
+    def test_measure_hash_ms_returns_positive_duration(self):
+        assert measure_hash_ms("bcrypt", 4, samples=1) > 0
+
+
+class TestMain:
+    def test_prints_recommendation(self, capsys):
+        assert main(["--scheme", "bcrypt", "--target-ms", "0.01"]) == 0
+        out = capsys.readouterr().out
+        assert "PASSWORD_HASH_ROUNDS=4" in out
@@ -145,6 +145,25 @@ class TestAddCardMember:
         )
         assert resp.status_code == 403
 
+    def test_add_card_member_scoped_to_board(self, client):
+        _, _, headers = register_and_login(client)
+        board_id, _, card_id = _setup_board_list_card(client, headers)
+        other_board_id, _, _ = _setup_board_list_card(client, headers)
+
+        resp = client.post(
+            f"/api/cards/{card_id}/members/?board_id={other_board_id}",
+            json={"email": "alice@example.com"},
+            headers=headers,
+        )
+        assert resp.status_code == 404
+
+        resp = client.post(
+            f"/api/cards/{card_id}/members/?board_id={board_id}",
+            json={"email": "alice@example.com"},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+
 
 class TestRemoveCardMember:
     def test_remove_card_member_success(self, client):
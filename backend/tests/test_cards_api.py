@@ -2,6 +2,9 @@
 
 import uuid
 
+from app.api import cards as cards_module
+from app.core.sharding import bucket_of
+from app.models.card import Card
 from tests.conftest import register_and_login
 
 
@@ -32,6 +35,16 @@ class TestCreateCard:
         assert data["position"] == 0
         assert data["list_id"] == list_id
 
+    def test_create_card_created_at_reads_back_the_same(self, client):
+        _, _, headers = register_and_login(client)
+        _, list_id = _setup_board_and_list(client, headers)
+
+        created = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers
+        ).json()
+        listed = client.get(f"/api/cards/?list_id={list_id}", headers=headers).json()
+        assert listed[0]["created_at"] == created["created_at"]
+
     def test_create_card_with_description(self, client):
         _, _, headers = register_and_login(client)
         _, list_id = _setup_board_and_list(client, headers)
@@ -124,6 +137,45 @@ class TestListCards:
         resp = client.get(f"/api/cards/?list_id={list_id}", headers=headers_bob)
         assert resp.status_code == 403
 
+    def test_stream_matches_list(self, client, monkeypatch):
+        monkeypatch.setattr(cards_module, "STREAM_OPTIONS", {"yield_per": 2})
+        _, _, headers = register_and_login(client)
+        _, list_id = _setup_board_and_list(client, headers)
+        card_ids = [
+            client.post(
+                f"/api/cards/?list_id={list_id}", json={"title": t}, headers=headers
+            ).json()["id"]
+            for t in ("a", "b", "c", "d", "e")
+        ]
+        client.delete(f"/api/cards/{card_ids[1]}", headers=headers)
+
+        listed = client.get(f"/api/cards/?list_id={list_id}", headers=headers)
+        streamed = client.get(
+            f"/api/cards/?list_id={list_id}&stream=true", headers=headers
+        )
+        assert streamed.status_code == 200
+        assert streamed.headers["content-type"] == "application/json"
+        assert streamed.json() == listed.json()
+        assert [c["title"] for c in streamed.json()] == ["a", "c", "d", "e"]
+
+    def test_stream_empty_list(self, client):
+        _, _, headers = register_and_login(client)
+        _, list_id = _setup_board_and_list(client, headers)
+
+        resp = client.get(f"/api/cards/?list_id={list_id}&stream=true", headers=headers)
+        assert resp.json() == []
+
+    def test_stream_not_member(self, client):
+        _, _, headers_alice = register_and_login(client)
+        _, list_id = _setup_board_and_list(client, headers_alice)
+        _, _, headers_bob = register_and_login(
+            client, email="bob@example.com", username="bob"
+        )
+        resp = client.get(
+            f"/api/cards/?list_id={list_id}&stream=true", headers=headers_bob
+        )
+        assert resp.status_code == 403
+
 
 class TestUpdateCard:
     def test_update_card_title(self, client):
@@ -192,6 +244,109 @@ class TestUpdateCard:
         )
         assert resp.status_code == 403
 
+    def test_move_card_to_another_board(self, client, db):
+        _, _, headers = register_and_login(client)
+        _, list_id = _setup_board_and_list(client, headers)
+        other_board_id, other_list_id = _setup_board_and_list(client, headers)
+        card_id = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers
+        ).json()["id"]
+
+        resp = client.put(
+            f"/api/cards/{card_id}", json={"list_id": other_list_id}, headers=headers
+        )
+        assert resp.status_code == 200
+        assert resp.json()["list_id"] == other_list_id
+        # A new id, in the new board's bucket, so it still routes to its board.
+        moved_id = resp.json()["id"]
+        assert moved_id != card_id
+        assert bucket_of(moved_id) == bucket_of(other_board_id)
+
+        card = db.get(Card, (uuid.UUID(moved_id), uuid.UUID(other_board_id)))
+        assert card.board_id == uuid.UUID(other_board_id)
+        resp = client.get(f"/api/cards/?list_id={other_list_id}", headers=headers)
+        assert [c["id"] for c in resp.json()] == [moved_id]
+
+    def test_move_card_keeps_its_members(self, client):
+        _, _, headers = register_and_login(client)
+        board_id, list_id = _setup_board_and_list(client, headers)
+        _, other_list_id = _setup_board_and_list(client, headers)
+        card_id = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers
+        ).json()["id"]
+        client.post(
+            f"/api/cards/{card_id}/members/",
+            json={"email": "alice@example.com"},
+            headers=headers,
+        )
+
+        resp = client.put(
+            f"/api/cards/{card_id}?board_id={board_id}",
+            json={"list_id": other_list_id},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+
+        moved_id = resp.json()["id"]
+        members = client.get(f"/api/cards/{moved_id}/members/", headers=headers)
+        assert [m["email"] for m in members.json()] == ["alice@example.com"]
+
+    def test_update_card_scoped_to_board(self, client):
+        _, _, headers = register_and_login(client)
+        board_id, list_id = _setup_board_and_list(client, headers)
+        other_board_id, _ = _setup_board_and_list(client, headers)
+        card_id = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers
+        ).json()["id"]
+
+        resp = client.put(
+            f"/api/cards/{card_id}?board_id={other_board_id}",
+            json={"title": "X"},
+            headers=headers,
+        )
+        assert resp.status_code == 404
+
+        resp = client.put(
+            f"/api/cards/{card_id}?board_id={board_id}",
+            json={"title": "X"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+
+    def test_move_card_to_unknown_list(self, client):
+        _, _, headers = register_and_login(client)
+        _, list_id = _setup_board_and_list(client, headers)
+        card_id = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers
+        ).json()["id"]
+
+        resp = client.put(
+            f"/api/cards/{card_id}",
+            json={"list_id": str(uuid.uuid4())},
+            headers=headers,
+        )
+        assert resp.status_code == 404
+
+    def test_move_card_to_foreign_board(self, client):
+        _, _, headers_alice = register_and_login(
+            client, email="alice@example.com", username="alice"
+        )
+        _, list_id = _setup_board_and_list(client, headers_alice)
+        card_id = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers_alice
+        ).json()["id"]
+        _, _, headers_bob = register_and_login(
+            client, email="bob@example.com", username="bob"
+        )
+        _, bob_list_id = _setup_board_and_list(client, headers_bob)
+
+        resp = client.put(
+            f"/api/cards/{card_id}",
+            json={"list_id": bob_list_id},
+            headers=headers_alice,
+        )
+        assert resp.status_code == 403
+
 
 class TestDeleteCard:
     def test_delete_card_success(self, client):
@@ -226,3 +381,93 @@ class TestDeleteCard:
         )
         resp = client.delete(f"/api/cards/{card_id}", headers=headers_bob)
         assert resp.status_code == 403
+
+    def test_delete_list_hides_its_cards(self, client):
+        _, _, headers = register_and_login(client)
+        _, list_id = _setup_board_and_list(client, headers)
+        card_id = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers
+        ).json()["id"]
+
+        client.delete(f"/api/lists/{list_id}", headers=headers)
+
+        resp = client.put(
+            f"/api/cards/{card_id}", json={"title": "Ghost"}, headers=headers
+        )
+        assert resp.status_code == 404
+
+
+class TestRestoreCard:
+    def test_restore_card(self, client):
+        _, _, headers = register_and_login(client)
+        _, list_id = _setup_board_and_list(client, headers)
+        card_id = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "Oops"}, headers=headers
+        ).json()["id"]
+        client.delete(f"/api/cards/{card_id}", headers=headers)
+        assert (
+            client.get(f"/api/cards/?list_id={list_id}", headers=headers).json() == []
+        )
+
+        resp = client.post(f"/api/cards/{card_id}/restore", headers=headers)
+        assert resp.status_code == 200
+
+        cards = client.get(f"/api/cards/?list_id={list_id}", headers=headers).json()
+        assert [card["id"] for card in cards] == [card_id]
+
+    def test_restore_card_of_deleted_list(self, client):
+        _, _, headers = register_and_login(client)
+        _, list_id = _setup_board_and_list(client, headers)
+        card_id = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers
+        ).json()["id"]
+        client.delete(f"/api/cards/{card_id}", headers=headers)
+        client.delete(f"/api/lists/{list_id}", headers=headers)
+
+        resp = client.post(f"/api/cards/{card_id}/restore", headers=headers)
+        assert resp.status_code == 404
+
+
+def _card_counts(client, headers, board_id):
+    lists = client.get(f"/api/lists/board/{board_id}", headers=headers).json()
+    return [lst["card_count"] for lst in lists]
+
+
+class TestCardCount:
+    def test_follows_create_delete_and_restore(self, client):
+        _, _, headers = register_and_login(client)
+        board_id, list_id = _setup_board_and_list(client, headers)
+        card_ids = [
+            client.post(
+                f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers
+            ).json()["id"]
+            for _ in range(3)
+        ]
+        assert _card_counts(client, headers, board_id) == [3]
+
+        client.delete(f"/api/cards/{card_ids[0]}", headers=headers)
+        assert _card_counts(client, headers, board_id) == [2]
+
+        client.post(f"/api/cards/{card_ids[0]}/restore", headers=headers)
+        assert _card_counts(client, headers, board_id) == [3]
+
+    def test_follows_moves(self, client):
+        _, _, headers = register_and_login(client)
+        board_id, list_id = _setup_board_and_list(client, headers)
+        other_id = client.post(
+            f"/api/lists/?board_id={board_id}", json={"title": "Done"}, headers=headers
+        ).json()["id"]
+        card_id = client.post(
+            f"/api/cards/?list_id={list_id}", json={"title": "C"}, headers=headers
+        ).json()["id"]
+
+        client.put(f"/api/cards/{card_id}", json={"list_id": other_id}, headers=headers)
+        assert _card_counts(client, headers, board_id) == [0, 1]
+
+        # Moving within the same list changes nothing.
+        client.put(
+            f"/api/cards/{card_id}",
+            json={"list_id": other_id, "position": 3},
+            headers=headers,
+        )
+        assert _card_counts(client, headers, board_id) == [0, 1]
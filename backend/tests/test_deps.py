@@ -42,6 +42,18 @@ class TestGetCurrentUser:
             get_current_user(credentials=credentials, db=db)
         assert exc_info.value.status_code == 401
 
+    def test_revoked_session(self, db, user_alice):
+        from app.core.revocation import revoked_sessions
+
+        session_id = str(uuid.uuid4())
+        revoked_sessions.revoke(session_id)
+        token = create_access_token(str(user_alice.id), session_id=session_id)
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with pytest.raises(HTTPException) as exc_info:
+            get_current_user(credentials=credentials, db=db)
+        assert exc_info.value.status_code == 401
+
     def test_token_user_not_found(self, db):
         fake_id = str(uuid.uuid4())
         token = create_access_token(fake_id)
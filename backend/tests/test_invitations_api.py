@@ -0,0 +1,139 @@
+"""Tests for board invitation links."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.core.security import create_invitation_token
+from app.models.board_member import BoardMember
+from tests.conftest import register_and_login
+
+
+def _setup_board(client, headers):
+    resp = client.post("/api/boards/", json={"title": "Board"}, headers=headers)
+    return resp.json()["id"]
+
+
+def _invite(client, headers, board_id, **body):
+    resp = client.post(
+        f"/api/boards/{board_id}/invitations", json=body, headers=headers
+    )
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+class TestCreateInvitation:
+    def test_owner_creates_invitation(self, client):
+        _, _, headers = register_and_login(client)
+        board_id = _setup_board(client, headers)
+
+        data = _invite(client, headers, board_id, expires_in_hours=1)
+        assert data["board_id"] == board_id
+        assert data["role"] == "member"
+        assert "." in data["token"]
+
+    def test_non_owner_cannot_invite(self, client):
+        _, _, alice = register_and_login(client)
+        board_id = _setup_board(client, alice)
+        _, _, bob = register_and_login(client, email="bob@example.com", username="bob")
+
+        resp = client.post(f"/api/boards/{board_id}/invitations", json={}, headers=bob)
+        assert resp.status_code == 403
+
+    def test_owner_role_cannot_be_granted(self, client):
+        _, _, headers = register_and_login(client)
+        board_id = _setup_board(client, headers)
+
+        resp = client.post(
+            f"/api/boards/{board_id}/invitations",
+            json={"role": "owner"},
+            headers=headers,
+        )
+        assert resp.status_code == 422
+
+
+class TestAcceptInvitation:
+    def test_accept_adds_member(self, client):
+        _, _, alice = register_and_login(client)
+        board_id = _setup_board(client, alice)
+        token = _invite(client, alice, board_id)["token"]
+        _, _, bob = register_and_login(client, email="bob@example.com", username="bob")
+
+        resp = client.post(f"/api/invitations/{token}/accept", headers=bob)
+        assert resp.status_code == 200
+        assert resp.json()["board_id"] == board_id
+
+        members = client.get(f"/api/boards/{board_id}/members/", headers=bob).json()
+        assert {m["email"]: m["role"] for m in members} == {
+            "alice@example.com": "owner",
+            "bob@example.com": "member",
+        }
+
+    def test_accept_twice_is_idempotent(self, client, db):
+        _, _, alice = register_and_login(client)
+        board_id = _setup_board(client, alice)
+        token = _invite(client, alice, board_id)["token"]
+        _, _, bob = register_and_login(client, email="bob@example.com", username="bob")
+
+        client.post(f"/api/invitations/{token}/accept", headers=bob)
+        resp = client.post(f"/api/invitations/{token}/accept", headers=bob)
+        assert resp.status_code == 200
+        assert db.query(BoardMember).count() == 2
+
+    def test_owner_accepting_keeps_owner_role(self, client):
+        _, _, alice = register_and_login(client)
+        board_id = _setup_board(client, alice)
+        token = _invite(client, alice, board_id)["token"]
+
+        client.post(f"/api/invitations/{token}/accept", headers=alice)
+        members = client.get(f"/api/boards/{board_id}/members/", headers=alice).json()
+        assert [m["role"] for m in members] == ["owner"]
+
+    def test_tampered_token(self, client):
+        _, _, alice = register_and_login(client)
+        board_id = _setup_board(client, alice)
+        token = _invite(client, alice, board_id)["token"]
+        payload, signature = token.split(".")
+
+        resp = client.post(
+            f"/api/invitations/{payload}.{signature[::-1]}/accept", headers=alice
+        )
+        assert resp.status_code == 400
+
+    def test_garbage_token(self, client):
+        _, _, alice = register_and_login(client)
+        resp = client.post("/api/invitations/not-a-token/accept", headers=alice)
+        assert resp.status_code == 400
+
+    def test_expired_token(self, client):
+        _, _, alice = register_and_login(client)
+        board_id = _setup_board(client, alice)
+        token = create_invitation_token(
+            uuid.UUID(board_id), "member", datetime.now(UTC) - timedelta(seconds=1)
+        )
+
+        resp = client.post(f"/api/invitations/{token}/accept", headers=alice)
+        assert resp.status_code == 400
+
+    def test_deleted_board(self, client):
+        _, _, alice = register_and_login(client)
+        token = create_invitation_token(
+            uuid.uuid4(), "member", datetime.now(UTC) + timedelta(hours=1)
+        )
+
+        resp = client.post(f"/api/invitations/{token}/accept", headers=alice)
+        assert resp.status_code == 404
+
+    def test_board_in_trash(self, client, db):
+        _, _, alice = register_and_login(client)
+        board_id = _setup_board(client, alice)
+        token = _invite(client, alice, board_id)["token"]
+        client.delete(f"/api/boards/{board_id}", headers=alice)
+        _, _, bob = register_and_login(client, email="bob@example.com", username="bob")
+
+        resp = client.post(f"/api/invitations/{token}/accept", headers=bob)
+        assert resp.status_code == 404
+        assert db.query(BoardMember).filter_by(role="member").count() == 0
+
+    def test_requires_authentication(self, client):
+        resp = client.post("/api/invitations/whatever/accept")
+        assert resp.status_code in (401, 403)
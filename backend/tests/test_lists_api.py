@@ -192,3 +192,61 @@ class TestDeleteList:
         )
         resp = client.delete(f"/api/lists/{list_id}", headers=headers_bob)
         assert resp.status_code == 403
+
+
+class TestRestoreList:
+    def test_restore_list(self, client):
+        _, _, headers = register_and_login(client)
+        board_id = _create_board(client, headers)
+        list_id = client.post(
+            f"/api/lists/?board_id={board_id}", json={"title": "Oops"}, headers=headers
+        ).json()["id"]
+        client.delete(f"/api/lists/{list_id}", headers=headers)
+        assert client.get(f"/api/lists/board/{board_id}", headers=headers).json() == []
+
+        resp = client.post(f"/api/lists/{list_id}/restore", headers=headers)
+        assert resp.status_code == 200
+
+        lists = client.get(f"/api/lists/board/{board_id}", headers=headers).json()
+        assert [lst["id"] for lst in lists] == [list_id]
+
+    def test_restore_list_brings_back_its_cards(self, client):
+        _, _, headers = register_and_login(client)
+        board_id = _create_board(client, headers)
+        list_id = client.post(
+            f"/api/lists/?board_id={board_id}", json={"title": "L"}, headers=headers
+        ).json()["id"]
+        kept, gone = (
+            client.post(
+                f"/api/cards/?list_id={list_id}", json={"title": title}, headers=headers
+            ).json()["id"]
+            for title in ("kept", "gone")
+        )
+        client.delete(f"/api/cards/{gone}", headers=headers)
+        client.delete(f"/api/lists/{list_id}", headers=headers)
+
+        resp = client.post(f"/api/lists/{list_id}/restore", headers=headers)
+        assert resp.json()["card_count"] == 1
+        lists = client.get(f"/api/lists/board/{board_id}", headers=headers).json()
+        assert [lst["card_count"] for lst in lists] == [1]
+
+        cards = client.get(f"/api/cards/?list_id={list_id}", headers=headers).json()
+        assert [card["id"] for card in cards] == [kept]
+
+    def test_restore_list_not_member(self, client):
+        _, _, headers_alice = register_and_login(
+            client, email="alice@example.com", username="alice"
+        )
+        board_id = _create_board(client, headers_alice)
+        list_id = client.post(
+            f"/api/lists/?board_id={board_id}",
+            json={"title": "L"},
+            headers=headers_alice,
+        ).json()["id"]
+        client.delete(f"/api/lists/{list_id}", headers=headers_alice)
+
+        _, _, headers_bob = register_and_login(
+            client, email="bob@example.com", username="bob"
+        )
+        resp = client.post(f"/api/lists/{list_id}/restore", headers=headers_bob)
+        assert resp.status_code == 403
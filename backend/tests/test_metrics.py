@@ -0,0 +1,58 @@
+"""Tests for pool metrics and the /api/metrics endpoints."""
+
+import pytest
+
+from app.core.config import settings
+from app.core.metrics import Histogram
+from tests.conftest import auth_header, register_and_login
+
+
+class TestHistogram:
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        assert snapshot["buckets"] == {"0.1": 2, "1.0": 3, "+Inf": 4}
+        assert snapshot["count"] == 4
+        assert snapshot["sum"] == pytest.approx(2.65)
+
+    def test_empty(self):
+        snapshot = Histogram((1.0,)).snapshot()
+        assert snapshot == {"buckets": {"1.0": 0, "+Inf": 0}, "count": 0, "sum": 0.0}
+
+
+@pytest.fixture()
+def metrics_headers(monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-me")
+    return auth_header("scrape-me")
+
+
+class TestMetricsAccess:
+    def test_hidden_without_a_token_configured(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+        resp = client.get("/api/metrics/db-pool", headers=auth_header("anything"))
+        assert resp.status_code == 404
+
+    @pytest.mark.parametrize(
+        "path", ["/api/metrics/db-pool", "/api/metrics/transactions"]
+    )
+    def test_requires_the_metrics_token(self, client, metrics_headers, path):
+        assert client.get(path).status_code == 401
+        assert client.get(path, headers=auth_header("wrong")).status_code == 401
+        # Logging in is not enough.
+        _, _, headers = register_and_login(client)
+        assert client.get(path, headers=headers).status_code == 401
+        assert client.get(path, headers=metrics_headers).status_code == 200
+
+
+class TestDbPoolEndpoint:
+    def test_reports_sync_pool(self, client, metrics_headers):
+        resp = client.get("/api/metrics/db-pool", headers=metrics_headers)
+        assert resp.status_code == 200
+
+        pool = resp.json()["sync"]
+        assert pool["size"] == 5
+        assert {"checked_out", "overflow", "timeouts", "wait_seconds"} <= set(pool)
+        assert "+Inf" in pool["wait_seconds"]["buckets"]
@@ -0,0 +1,48 @@
+"""Tests for the migration lock of app.commands.migrate."""
+
+import pytest
+
+from app.commands import migrate as migrate_module
+
+
+class LockConnection:
+    """Answers pg_try_advisory_lock with ``answers``, in turn."""
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.tries = 0
+        self.commits = 0
+
+    def execute(self, statement, params):
+        assert "pg_try_advisory_lock" in str(statement)
+        assert params == {"key": migrate_module.MIGRATION_LOCK_KEY}
+        self.tries += 1
+        return self
+
+    def scalar(self):
+        return self.answers.pop(0)
+
+    def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(migrate_module.time, "sleep", lambda seconds: None)
+
+
+class TestMigrationLock:
+    def test_waits_for_the_lock(self):
+        connection = LockConnection(False, False, True)
+        assert migrate_module._lock(connection, wait=True)
+        assert connection.tries == 3
+        # No transaction stays open between tries.
+        assert connection.commits == 3
+
+    def test_skips_when_not_waiting(self):
+        connection = LockConnection(False)
+        assert not migrate_module._lock(connection, wait=False)
+        assert connection.tries == 1
+
+    def test_takes_a_free_lock_without_waiting(self):
+        assert migrate_module._lock(LockConnection(True), wait=False)
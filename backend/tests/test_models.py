@@ -4,6 +4,7 @@ import uuid
 from datetime import UTC, datetime
 
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from app.models.board import Board
@@ -39,6 +40,16 @@ class TestUserModel:
             db.commit()
         db.rollback()
 
+    def test_user_email_unique_ignoring_case(self, db):
+        uid1, uid2 = uuid.uuid4(), uuid.uuid4()
+        db.add(User(id=uid1, email="dup@example.com", username="u1", password_hash="h"))
+        db.commit()
+
+        db.add(User(id=uid2, email="Dup@Example.com", username="u2", password_hash="h"))
+        with pytest.raises(IntegrityError):
+            db.commit()
+        db.rollback()
+
     def test_user_username_unique(self, db):
         uid1, uid2 = uuid.uuid4(), uuid.uuid4()
         db.add(User(id=uid1, email="a@example.com", username="same", password_hash="h"))
@@ -103,6 +114,37 @@ class TestBoardModel:
             is None
         )
 
+    def test_board_delete_cascades_in_database(
+        self, db, user_alice, user_bob, make_board, make_list, make_card
+    ):
+        """Lists, cards and assignments go with the board in one DELETE."""
+        board = make_board(owner=user_alice)
+        lst = make_list(board=board)
+        card = make_card(list_obj=lst, creator=user_alice)
+        db.add(CardMember(card_id=card.id, board_id=card.board_id, user_id=user_bob.id))
+        db.commit()
+        board_id = board.id
+        db.expunge_all()
+
+        deletes = []
+
+        def record(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith("DELETE"):
+                deletes.append(statement)
+
+        board = db.get(Board, board_id)
+        event.listen(db.get_bind(), "before_cursor_execute", record)
+        try:
+            db.delete(board)
+            db.commit()
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", record)
+
+        assert len(deletes) == 1
+        assert db.query(ListModel).count() == 0
+        assert db.query(Card).count() == 0
+        assert db.query(CardMember).count() == 0
+
 
 class TestBoardMemberModel:
     def test_create_board_member(self, db, user_alice, user_bob, make_board):
@@ -131,6 +173,13 @@ class TestBoardMemberModel:
         db.refresh(bm)
         assert bm.role == "member"
 
+    def test_board_member_unique_per_board(self, db, user_alice, make_board):
+        board = make_board(owner=user_alice)
+        db.add(BoardMember(board_id=board.id, user_id=user_alice.id, role="member"))
+        with pytest.raises(IntegrityError):
+            db.commit()
+        db.rollback()
+
 
 class TestListModel:
     def test_create_list(self, db, user_alice, make_board):
@@ -170,6 +219,7 @@ class TestCardModel:
             title="My Card",
             position=0,
             list_id=lst.id,
+            board_id=board.id,
             creator_id=user_alice.id,
             label_ids=[],
             created_at=datetime.now(UTC),
@@ -209,7 +259,12 @@ class TestCardMemberModel:
         lst = make_list(board=board)
         card = make_card(list_obj=lst, creator=user_alice)
 
-        cm = CardMember(id=uuid.uuid4(), card_id=card.id, user_id=user_bob.id)
+        cm = CardMember(
+            id=uuid.uuid4(),
+            card_id=card.id,
+            board_id=card.board_id,
+            user_id=user_bob.id,
+        )
         db.add(cm)
         db.commit()
 
@@ -221,7 +276,12 @@ class TestCardMemberModel:
         board = make_board(owner=user_alice)
         lst = make_list(board=board)
         card = make_card(list_obj=lst, creator=user_alice)
-        cm = CardMember(id=uuid.uuid4(), card_id=card.id, user_id=user_bob.id)
+        cm = CardMember(
+            id=uuid.uuid4(),
+            card_id=card.id,
+            board_id=card.board_id,
+            user_id=user_bob.id,
+        )
         db.add(cm)
         db.commit()
 
@@ -236,7 +296,12 @@ class TestCardMemberModel:
         board = make_board(owner=user_alice)
         lst = make_list(board=board)
         card = make_card(list_obj=lst, creator=user_alice)
-        cm = CardMember(id=uuid.uuid4(), card_id=card.id, user_id=user_bob.id)
+        cm = CardMember(
+            id=uuid.uuid4(),
+            card_id=card.id,
+            board_id=card.board_id,
+            user_id=user_bob.id,
+        )
         db.add(cm)
         db.commit()
         db.refresh(card)
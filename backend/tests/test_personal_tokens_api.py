@@ -0,0 +1,126 @@
+"""Tests for /api/users/me/tokens (personal access tokens)."""
+
+from datetime import UTC, datetime, timedelta
+
+from app.api.deps import personal_token_cache
+from app.core.security import hash_token
+from app.models.personal_access_token import PersonalAccessToken
+from tests.conftest import auth_header, register_and_login
+
+BASE = "/api/users/me/tokens/"
+
+
+def _create(client, headers, **body):
+    body.setdefault("name", "ci")
+    resp = client.post(BASE, json=body, headers=headers)
+    assert resp.status_code == 201, resp.text
+    return resp.json()
+
+
+class TestCreateToken:
+    def test_create_returns_plaintext_once(self, client, db):
+        _, _, headers = register_and_login(client)
+        data = _create(client, headers, scopes=["read", "write"])
+
+        assert data["token"].startswith("etp_")
+        assert data["scopes"] == ["read", "write"]
+        assert data["expires_at"] is not None
+
+        stored = db.query(PersonalAccessToken).one()
+        assert stored.token_hash == hash_token(data["token"])
+
+        listed = client.get(BASE, headers=headers).json()
+        assert len(listed) == 1
+        assert "token" not in listed[0]
+
+    def test_create_without_expiry(self, client):
+        _, _, headers = register_and_login(client)
+        data = _create(client, headers, expires_in_days=None)
+        assert data["expires_at"] is None
+
+    def test_create_rejects_unknown_scope(self, client):
+        _, _, headers = register_and_login(client)
+        resp = client.post(
+            BASE, json={"name": "ci", "scopes": ["admin"]}, headers=headers
+        )
+        assert resp.status_code == 422
+
+
+class TestAuthenticateWithToken:
+    def test_token_authenticates(self, client):
+        user, _, headers = register_and_login(client)
+        token = _create(client, headers)["token"]
+
+        resp = client.get("/api/users/me", headers=auth_header(token))
+        assert resp.status_code == 200
+        assert resp.json()["id"] == user["id"]
+
+    def test_lookup_is_cached(self, client):
+        _, _, headers = register_and_login(client)
+        token = _create(client, headers)["token"]
+        personal_token_cache.clear()
+
+        client.get("/api/users/me", headers=auth_header(token))
+        assert personal_token_cache.get(hash_token(token)) is not None
+
+    def test_unknown_token(self, client):
+        resp = client.get("/api/users/me", headers=auth_header("etp_unknown"))
+        assert resp.status_code == 401
+
+    def test_expired_token(self, client, db):
+        _, _, headers = register_and_login(client)
+        token = _create(client, headers)["token"]
+        db.query(PersonalAccessToken).update(
+            {PersonalAccessToken.expires_at: datetime.now(UTC) - timedelta(seconds=1)}
+        )
+        db.commit()
+        personal_token_cache.clear()
+
+        resp = client.get("/api/users/me", headers=auth_header(token))
+        assert resp.status_code == 401
+
+    def test_read_scope_cannot_write(self, client):
+        _, _, headers = register_and_login(client)
+        token = _create(client, headers, scopes=["read"])["token"]
+
+        resp = client.get("/api/boards/", headers=auth_header(token))
+        assert resp.status_code == 200
+
+        resp = client.post(
+            "/api/boards/", json={"title": "Nope"}, headers=auth_header(token)
+        )
+        assert resp.status_code == 403
+
+    def test_write_scope_can_write(self, client):
+        _, _, headers = register_and_login(client)
+        token = _create(client, headers, scopes=["read", "write"])["token"]
+
+        resp = client.post(
+            "/api/boards/", json={"title": "Yes"}, headers=auth_header(token)
+        )
+        assert resp.status_code == 201
+
+
+class TestRevokeToken:
+    def test_revoke_token(self, client):
+        _, _, headers = register_and_login(client)
+        created = _create(client, headers)
+        token = created["token"]
+        assert (
+            client.get("/api/users/me", headers=auth_header(token)).status_code == 200
+        )
+
+        resp = client.delete(f"{BASE}{created['id']}", headers=headers)
+        assert resp.status_code == 204
+
+        assert (
+            client.get("/api/users/me", headers=auth_header(token)).status_code == 401
+        )
+
+    def test_cannot_revoke_other_users_token(self, client):
+        _, _, alice = register_and_login(client)
+        created = _create(client, alice)
+        _, _, bob = register_and_login(client, email="bob@example.com", username="bob")
+
+        resp = client.delete(f"{BASE}{created['id']}", headers=bob)
+        assert resp.status_code == 404
@@ -0,0 +1,64 @@
+"""Tests for the instrumented connection pool."""
+
+import pytest
+from sqlalchemy import create_engine, exc
+
+from app.core.config import settings
+from app.core.metrics import PoolMetrics
+from app.core.pool import InstrumentedQueuePool, pool_options
+
+
+class _Pool(InstrumentedQueuePool):
+    metrics = PoolMetrics()
+
+
+@pytest.fixture()
+def small_engine(tmp_path):
+    _Pool.metrics = PoolMetrics()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=_Pool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    yield engine
+    engine.dispose()
+
+
+class TestInstrumentedQueuePool:
+    def test_checkouts_are_timed(self, small_engine):
+        for _ in range(3):
+            with small_engine.connect():
+                pass
+
+        snapshot = _Pool.metrics.snapshot(small_engine.pool)
+        assert snapshot["wait_seconds"]["count"] == 3
+        assert snapshot["checked_out"] == 0
+        assert snapshot["timeouts"] == 0
+
+    def test_checkout_timeouts_are_counted(self, small_engine):
+        with small_engine.connect():
+            assert _Pool.metrics.snapshot(small_engine.pool)["checked_out"] == 1
+            with pytest.raises(exc.TimeoutError):
+                small_engine.connect()
+
+        assert _Pool.metrics.timeouts == 1
+
+    def test_metrics_survive_dispose(self, small_engine):
+        with small_engine.connect():
+            pass
+        small_engine.dispose()
+        with small_engine.connect():
+            pass
+
+        assert _Pool.metrics.wait_seconds.snapshot()["count"] == 2
+
+
+def test_pool_options_follow_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 20)
+    monkeypatch.setattr(settings, "DB_POOL_PRE_PING", False)
+
+    options = pool_options()
+    assert options["pool_size"] == 20
+    assert options["pool_pre_ping"] is False
@@ -0,0 +1,105 @@
+"""Tests for the soft-delete purge command."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.commands.purge_deleted import purge_deleted, purge_expired_tokens
+from app.core.soft_delete import INCLUDE_DELETED
+from app.models.board import Board
+from app.models.card import Card
+from app.models.card_member import CardMember
+from app.models.list import List as ListModel
+from app.models.refresh_token import RefreshToken
+
+LONG_AGO = datetime.now(UTC) - timedelta(days=365)
+
+
+def _count(db, model):
+    return db.query(model).execution_options(**{INCLUDE_DELETED: True}).count()
+
+
+class TestPurgeDeleted:
+    def test_purges_expired_board_and_content(
+        self, db, user_alice, make_board, make_list, make_card
+    ):
+        board = make_board(owner=user_alice)
+        lst = make_list(board=board)
+        for _ in range(3):
+            card = make_card(list_obj=lst, creator=user_alice)
+        db.add(
+            CardMember(card_id=card.id, board_id=card.board_id, user_id=user_alice.id)
+        )
+        board.deleted_at = LONG_AGO
+        db.commit()
+
+        pauses = []
+        counts = purge_deleted(db, batch_size=2, pause=0.5, sleep=pauses.append)
+
+        assert counts == {"cards": 3, "lists": 1, "boards": 1}
+        assert pauses == [0.5]  # one pause after the first full card batch
+        assert _count(db, Board) == 0
+        assert _count(db, ListModel) == 0
+        assert _count(db, Card) == 0
+        assert _count(db, CardMember) == 0
+
+    def test_purges_expired_list_and_card_only(
+        self, db, user_alice, make_board, make_list, make_card
+    ):
+        board = make_board(owner=user_alice)
+        doomed = make_list(board=board, title="Doomed")
+        make_card(list_obj=doomed, creator=user_alice)
+        kept = make_list(board=board, title="Kept", position=1)
+        expired_card = make_card(list_obj=kept, creator=user_alice)
+        make_card(list_obj=kept, creator=user_alice, title="Live")
+        doomed.deleted_at = LONG_AGO
+        expired_card.deleted_at = LONG_AGO
+        db.commit()
+
+        counts = purge_deleted(db, pause=0, sleep=lambda _s: None)
+
+        assert counts == {"cards": 2, "lists": 1, "boards": 0}
+        assert [c.title for c in db.query(Card).all()] == ["Live"]
+
+    def test_keeps_recent_deletes_restorable(
+        self, db, user_alice, make_board, make_list
+    ):
+        board = make_board(owner=user_alice)
+        make_list(board=board)
+        board.deleted_at = datetime.now(UTC)
+        db.commit()
+
+        counts = purge_deleted(db, pause=0, sleep=lambda _s: None)
+
+        assert counts == {"cards": 0, "lists": 0, "boards": 0}
+        assert _count(db, Board) == 1
+        assert _count(db, ListModel) == 1
+
+
+class TestPurgeExpiredTokens:
+    def test_deletes_expired_tokens_once_revocations_are_forgotten(
+        self, db, user_alice
+    ):
+        now = datetime.now(UTC)
+
+        def token(expires_in, revoked_ago=None):
+            db.add(
+                RefreshToken(
+                    user_id=user_alice.id,
+                    family_id=uuid.uuid4(),
+                    token_hash=uuid.uuid4().hex,
+                    expires_at=now + expires_in,
+                    revoked_at=None if revoked_ago is None else now - revoked_ago,
+                )
+            )
+
+        token(timedelta(days=-1))
+        token(timedelta(days=-1), revoked_ago=timedelta(days=2))
+        token(timedelta(days=1))
+        # Expired, but its revocation still hides live access tokens.
+        token(timedelta(minutes=-1), revoked_ago=timedelta(minutes=1))
+        db.commit()
+
+        deleted = purge_expired_tokens(db, batch_size=1, pause=0, sleep=lambda _s: None)
+
+        assert deleted == 2
+        assert db.query(RefreshToken).count() == 2
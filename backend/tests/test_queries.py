@@ -0,0 +1,114 @@
+"""Tests for the cached hot-path lookups."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import event
+
+from app.core import queries, soft_delete
+from app.models.list import List
+
+
+class TestQueries:
+    def test_lookups_return_rows(self, db, user_alice, make_board, make_list):
+        board = make_board(owner=user_alice)
+        lst = make_list(board=board)
+        db.expunge_all()
+
+        assert queries.get_user(db, user_alice.id).email == "alice@example.com"
+        assert queries.get_membership(db, board.id, user_alice.id).role == "owner"
+        assert queries.get_list(db, lst.id).board_id == board.id
+
+    def test_lookups_take_new_parameters_each_call(
+        self, db, user_alice, user_bob, make_board
+    ):
+        board = make_board(owner=user_alice)
+
+        assert queries.get_membership(db, board.id, user_alice.id) is not None
+        assert queries.get_membership(db, board.id, user_bob.id) is None
+        assert queries.get_user(db, user_bob.id).username == "bob"
+
+    def test_cards_in_list_are_ordered_and_skip_deleted(
+        self, db, user_alice, make_board, make_list, make_card
+    ):
+        lst = make_list(board=make_board(owner=user_alice))
+        for position, title in [(2, "c"), (0, "a"), (1, "b")]:
+            make_card(list_obj=lst, creator=user_alice, title=title, position=position)
+        deleted = make_card(list_obj=lst, creator=user_alice, title="x", position=3)
+        deleted.deleted_at = datetime.now(UTC)
+        db.commit()
+
+        titles = [
+            card.title for card in queries.get_cards_in_list(db, lst.board_id, lst.id)
+        ]
+
+        assert titles == ["a", "b", "c"]
+
+    def test_card_lookup_scoped_to_board(
+        self, db, user_alice, make_board, make_list, make_card
+    ):
+        lst = make_list(board=make_board(owner=user_alice))
+        card = make_card(list_obj=lst, creator=user_alice)
+        other_board = make_board(owner=user_alice)
+
+        assert queries.get_card(db, card.id).id == card.id
+        assert queries.get_card(db, card.id, card.board_id).id == card.id
+        assert queries.get_card(db, card.id, other_board.id) is None
+
+    def test_soft_deleted_rows_are_hidden(self, db, user_alice, make_board, make_list):
+        board = make_board(owner=user_alice)
+        lst = make_list(board=board)
+        board.deleted_at = lst.deleted_at = datetime.now(UTC)
+        db.commit()
+
+        assert queries.get_list(db, lst.id) is None
+        assert queries.get_membership(db, board.id, user_alice.id) is None
+
+    def test_statement_is_compiled_once(self, db, user_alice, user_bob):
+        cache_keys = set()
+
+        @event.listens_for(db.get_bind(), "before_cursor_execute")
+        def _collect(conn, cursor, statement, parameters, context, executemany):
+            cache_keys.add(context.compiled)
+
+        try:
+            queries.get_user(db, user_alice.id)
+            queries.get_user(db, user_bob.id)
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", _collect)
+
+        assert len(cache_keys) == 1
+
+    def test_lookups_skip_the_soft_delete_hook(
+        self, db, user_alice, make_board, make_list, make_card, monkeypatch
+    ):
+        lst = make_list(board=make_board(owner=user_alice))
+        card = make_card(list_obj=lst, creator=user_alice)
+        criteria = []
+        original = soft_delete.with_loader_criteria
+
+        def counting(*args, **kwargs):
+            criteria.append(args[0])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(soft_delete, "with_loader_criteria", counting)
+
+        queries.get_user(db, user_alice.id)
+        queries.get_membership(db, lst.board_id, user_alice.id)
+        queries.get_list(db, lst.id)
+        queries.get_card(db, card.id, lst.board_id)
+        queries.get_cards_in_list(db, lst.board_id, lst.id)
+        assert criteria == []
+
+        db.query(List).filter(List.id == lst.id).first()
+        assert criteria
+
+    def test_deleted_cards_are_hidden(
+        self, db, user_alice, make_board, make_list, make_card
+    ):
+        lst = make_list(board=make_board(owner=user_alice))
+        card = make_card(list_obj=lst, creator=user_alice)
+        card.deleted_at = datetime.now(UTC)
+        db.commit()
+
+        assert queries.get_card(db, card.id) is None
+        assert queries.get_cards_in_list(db, lst.board_id, lst.id) == []
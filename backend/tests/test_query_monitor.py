@@ -0,0 +1,130 @@
+"""Tests for statement timeouts and the slow-query log."""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.core.config import settings
+from app.core.query_monitor import (
+    _set_route_timeout,
+    current_route,
+    explainable,
+    timeout_connect_args,
+)
+from tests.conftest import register_and_login
+
+
+class TestTimeoutConnectArgs:
+    def test_psycopg2_sets_session_option(self, monkeypatch):
+        monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+        args = timeout_connect_args("postgresql://u@db/trello")
+        assert args == {"options": "-c statement_timeout=5000"}
+
+    def test_asyncpg_uses_server_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+        args = timeout_connect_args("postgresql+asyncpg://u@db/trello")
+        assert args == {"server_settings": {"statement_timeout": "5000"}}
+
+    def test_disabled_or_not_postgres(self, monkeypatch):
+        assert timeout_connect_args("sqlite://") == {}
+        monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 0)
+        assert timeout_connect_args("postgresql://u@db/trello") == {}
+
+
+class RecordingConnection:
+    """Records the statements run on it, as a Postgres connection."""
+
+    dialect = SimpleNamespace(name="postgresql")
+
+    def __init__(self):
+        self.statements = []
+
+    def exec_driver_sql(self, statement):
+        self.statements.append(statement)
+
+
+class TestRouteTimeouts:
+    def test_set_for_listed_routes(self, monkeypatch):
+        monkeypatch.setattr(
+            settings, "DB_ROUTE_STATEMENT_TIMEOUTS_MS", {"GET /api/boards/": 2000}
+        )
+        connection = RecordingConnection()
+        token = current_route.set("GET /api/boards/")
+        try:
+            _set_route_timeout(None, None, connection)
+        finally:
+            current_route.reset(token)
+        assert connection.statements == ["SET LOCAL statement_timeout = 2000"]
+
+    def test_other_routes_keep_the_default(self, monkeypatch):
+        monkeypatch.setattr(
+            settings, "DB_ROUTE_STATEMENT_TIMEOUTS_MS", {"GET /api/boards/": 2000}
+        )
+        connection = RecordingConnection()
+        _set_route_timeout(None, None, connection)
+        assert connection.statements == []
+
+
+class TestExplainable:
+    def test_plain_selects(self):
+        assert explainable("SELECT * FROM cards WHERE id = %(id)s")
+        assert explainable("  select count(*) from boards")
+
+    def test_writes_and_locks_are_not_run_again(self):
+        assert not explainable("UPDATE cards SET title = %(title)s")
+        assert not explainable("WITH gone AS (DELETE FROM cards) SELECT 1")
+        assert not explainable("SELECT * FROM boards FOR UPDATE")
+        assert not explainable("select * from lists for no key update skip locked")
+        assert not explainable("SELECT * FROM boards FOR SHARE")
+
+
+@pytest.fixture()
+def slow_log(monkeypatch, caplog):
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 0)
+    caplog.set_level(logging.WARNING, logger="app.slow_queries")
+    return caplog
+
+
+class TestSlowQueryLog:
+    def test_fast_queries_are_not_logged(self, db, caplog):
+        caplog.set_level(logging.WARNING, logger="app.slow_queries")
+        db.execute(text("SELECT 1"))
+        assert caplog.records == []
+
+    def test_logs_statement_and_parameters(self, db, slow_log):
+        db.connection()  # the SQLite BEGIN is a statement of its own
+        slow_log.clear()
+        db.execute(text("SELECT :value"), {"value": 42})
+
+        (record,) = slow_log.records
+        message = record.getMessage()
+        assert "SELECT ?" in message
+        assert "42" in message
+        assert "<no route>" in message
+
+    def test_logs_the_route_template(self, client, slow_log):
+        _, _, headers = register_and_login(client)
+        board_id = client.post(
+            "/api/boards/", json={"title": "B"}, headers=headers
+        ).json()["id"]
+        slow_log.clear()
+
+        client.get(f"/api/boards/{board_id}", headers=headers)
+
+        messages = [record.getMessage() for record in slow_log.records]
+        assert messages
+        assert all("GET /api/boards/{board_id}" in m for m in messages)
+
+    def test_failed_queries_are_logged(self, db, slow_log):
+        db.connection()
+        slow_log.clear()
+        with pytest.raises(OperationalError):
+            db.execute(text("SELECT * FROM no_such_table"))
+        db.rollback()
+
+        (record,) = slow_log.records
+        assert record.getMessage().startswith("Failed query")
+        assert "no_such_table" in record.getMessage()
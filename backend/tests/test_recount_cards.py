@@ -0,0 +1,44 @@
+"""Tests for the card counter repair command."""
+
+from datetime import UTC, datetime
+
+from app.commands.recount_cards import recount_cards
+from app.core.soft_delete import INCLUDE_DELETED
+from app.models.list import List as ListModel
+
+
+def _counts(db):
+    rows = (
+        db.query(ListModel.title, ListModel.card_count)
+        .execution_options(**{INCLUDE_DELETED: True})
+        .order_by(ListModel.position)
+        .all()
+    )
+    return {row.title: row.card_count for row in rows}
+
+
+class TestRecountCards:
+    def test_recomputes_drifted_counters(
+        self, db, user_alice, make_board, make_list, make_card
+    ):
+        board = make_board(owner=user_alice)
+        todo = make_list(board=board, title="todo", position=0)
+        done = make_list(board=board, title="done", position=1)
+        empty = make_list(board=board, title="empty", position=2)
+        for _ in range(3):
+            make_card(list_obj=todo, creator=user_alice)
+        gone = make_card(list_obj=done, creator=user_alice)
+        make_card(list_obj=done, creator=user_alice)
+        gone.deleted_at = datetime.now(UTC)
+        empty.card_count = 5
+        db.commit()
+
+        fixed = recount_cards(db, batch_size=2)
+
+        assert fixed == 3
+        db.expire_all()
+        assert _counts(db) == {"todo": 3, "done": 1, "empty": 0}
+
+    def test_leaves_correct_counters_alone(self, db, user_alice, make_board, make_list):
+        make_list(board=make_board(owner=user_alice))
+        assert recount_cards(db) == 0
@@ -0,0 +1,125 @@
+"""Tests for read-replica routing."""
+
+import time
+
+import pytest
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.api import deps
+from app.core.replicas import ReplicaRouter
+
+
+class TestReplicaRouter:
+    def test_without_replicas_everything_hits_primary(self):
+        router = ReplicaRouter("primary", [], pin_seconds=5)
+        assert router.engine_for(read_only=True) == "primary"
+
+    def test_reads_go_to_replicas_and_writes_to_primary(self):
+        router = ReplicaRouter("primary", ["replica"], pin_seconds=5)
+        assert router.engine_for(read_only=True) == "replica"
+        assert router.engine_for(read_only=False) == "primary"
+
+    def test_writes_use_the_writer(self):
+        router = ReplicaRouter("primary", [], pin_seconds=5, writer="writer")
+        assert router.engine_for(read_only=False) == "writer"
+        assert router.engine_for(read_only=True) == "primary"
+
+    def test_recent_writer_reads_from_primary(self):
+        router = ReplicaRouter("primary", ["replica"], pin_seconds=5)
+        written_at = time.time() - 1
+        assert router.engine_for(read_only=True, written_at=written_at) == "primary"
+
+    def test_pin_expires(self):
+        router = ReplicaRouter("primary", ["replica"], pin_seconds=5)
+        written_at = time.time() - 6
+        assert router.engine_for(read_only=True, written_at=written_at) == "replica"
+
+    def test_write_times_from_the_future_are_ignored(self):
+        router = ReplicaRouter("primary", ["replica"], pin_seconds=5)
+        written_at = time.time() + 3600
+        assert router.engine_for(read_only=True, written_at=written_at) == "replica"
+
+
+probes = Table("probes", MetaData(), Column("id", Integer, primary_key=True))
+
+
+@pytest.fixture()
+def probe_app(monkeypatch):
+    """App whose endpoints report which engine their session is bound to."""
+    names = {}
+    for name in ("primary", "replica"):
+        engine = create_engine(
+            "sqlite://",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        probes.metadata.create_all(engine)
+        names[engine] = name
+    primary, replica = names
+    monkeypatch.setattr(
+        deps, "db_router", ReplicaRouter(primary, [replica], pin_seconds=5)
+    )
+    app = FastAPI()
+
+    @app.get("/probe")
+    def read(db: Session = Depends(deps.get_db)):
+        return names[db.get_bind()]
+
+    @app.post("/probe")
+    def write(db: Session = Depends(deps.get_db)):
+        db.execute(insert(probes))
+        db.commit()
+        return names[db.get_bind()]
+
+    @app.post("/empty-commit")
+    def empty_commit(db: Session = Depends(deps.get_db)):
+        db.commit()
+        return names[db.get_bind()]
+
+    @app.post("/failed-write")
+    def failed_write(db: Session = Depends(deps.get_db)):
+        db.execute(insert(probes))
+        db.rollback()
+        db.commit()
+        return Response(status_code=400)
+
+    yield app
+    for engine in names:
+        engine.dispose()
+
+
+class TestGetDbRouting:
+    def test_read_then_write_then_read(self, probe_app):
+        with TestClient(probe_app) as alice, TestClient(probe_app) as bob:
+            assert alice.get("/probe").json() == "replica"
+            assert alice.post("/probe").json() == "primary"
+            # The write time comes back with the write's own response.
+            assert alice.cookies.get(deps.LAST_WRITE_COOKIE)
+            assert alice.get("/probe").json() == "primary"
+            assert bob.get("/probe").json() == "replica"
+
+    def test_write_time_may_be_sent_as_a_header(self, probe_app):
+        with TestClient(probe_app) as writer, TestClient(probe_app) as reader:
+            written_at = writer.post("/probe").headers[deps.LAST_WRITE_HEADER]
+            headers = {deps.LAST_WRITE_HEADER: written_at}
+            assert reader.get("/probe", headers=headers).json() == "primary"
+            headers = {deps.LAST_WRITE_HEADER: "garbage"}
+            assert reader.get("/probe", headers=headers).json() == "replica"
+
+    def test_nothing_committed_nothing_remembered(self, probe_app):
+        with TestClient(probe_app) as client:
+            resp = client.post("/failed-write")
+            assert deps.LAST_WRITE_HEADER not in resp.headers
+            assert client.get("/probe").json() == "replica"
+
+    def test_commit_without_writes_is_not_remembered(self, probe_app):
+        # As when a retryable write ends the read transaction before it
+        # starts over at its own isolation level.
+        with TestClient(probe_app) as client:
+            resp = client.post("/empty-commit")
+            assert deps.LAST_WRITE_HEADER not in resp.headers
+            assert client.get("/probe").json() == "replica"
@@ -0,0 +1,62 @@
+"""Tests for the in-process revoked-session list."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from app.core.revocation import RevocationList
+from app.models.refresh_token import RefreshToken
+
+
+def _token(user, revoked_at=None):
+    return RefreshToken(
+        user_id=user.id,
+        family_id=uuid.uuid4(),
+        token_hash=uuid.uuid4().hex,
+        expires_at=datetime.now(UTC) + timedelta(days=1),
+        revoked_at=revoked_at,
+    )
+
+
+class TestRevocationList:
+    def test_revoke_is_visible_immediately(self):
+        revocations = RevocationList(refresh_seconds=60)
+        revocations.revoke("abc")
+        assert revocations.is_revoked("abc") is True
+        assert revocations.is_revoked("def") is False
+
+    def test_reload_keeps_own_revocations(self, db):
+        # Revoked here, but not committed where the reload looks.
+        revocations = RevocationList(refresh_seconds=60)
+        revocations.revoke("abc")
+        revocations.reload(db)
+        assert revocations.is_revoked("abc") is True
+
+    def test_stale_until_loaded(self, db):
+        revocations = RevocationList(refresh_seconds=60)
+        assert revocations.is_stale() is True
+        revocations.reload(db)
+        assert revocations.is_stale() is False
+
+    def test_reload_picks_up_recent_revocations_only(self, db, user_alice):
+        recent = _token(user_alice, revoked_at=datetime.now(UTC))
+        old = _token(user_alice, revoked_at=datetime.now(UTC) - timedelta(days=1))
+        active = _token(user_alice)
+        db.add_all([recent, old, active])
+        db.commit()
+
+        revocations = RevocationList(refresh_seconds=60)
+        revocations.reload(db)
+        assert revocations.is_revoked(str(recent.family_id)) is True
+        assert revocations.is_revoked(str(old.family_id)) is False
+        assert revocations.is_revoked(str(active.family_id)) is False
+
+    def test_reload_if_stale_skips_fresh_list(self, db, user_alice):
+        revocations = RevocationList(refresh_seconds=60)
+        revocations.reload(db)
+
+        token = _token(user_alice, revoked_at=datetime.now(UTC))
+        db.add(token)
+        db.commit()
+
+        revocations.reload_if_stale(db)
+        assert revocations.is_revoked(str(token.family_id)) is False
@@ -1,12 +1,21 @@
 """Tests for core security helpers (hashing, JWT)."""
 
-from datetime import UTC, datetime
+import uuid
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from jose import jwt
 
 from app.core.config import settings
-from app.core.security import create_access_token, hash_password, verify_password
+from app.core.security import (
+    build_pwd_context,
+    create_access_token,
+    create_invitation_token,
+    hash_password,
+    verify_and_update_password,
+    verify_invitation_token,
+    verify_password,
+)
 
 
 class TestPasswordHashing:
@@ -29,6 +38,34 @@ class TestPasswordHashing:
         assert h1 != h2
 
 
+class TestPasswordRehash:
+    def test_context_uses_configured_rounds(self):
+        context = build_pwd_context("bcrypt", 5)
+        assert context.hash("pw").startswith("$2b$05$")
+
+    def test_needs_update_when_rounds_change(self):
+        old = build_pwd_context("bcrypt", 4).hash("pw")
+        assert build_pwd_context("bcrypt", 5).needs_update(old) is True
+        assert build_pwd_context("bcrypt", 4).needs_update(old) is False
+
+    def test_legacy_bcrypt_hash_still_verifies_after_scheme_change(self):
+        old = build_pwd_context("bcrypt", 4).hash("pw")
+        context = build_pwd_context("pbkdf2_sha256", 1000)
+        valid, new_hash = context.verify_and_update("pw", old)
+        assert valid is True
+        assert new_hash.startswith("$pbkdf2-sha256$")
+
+    def test_verify_and_update_current_hash(self):
+        valid, new_hash = verify_and_update_password("pw", hash_password("pw"))
+        assert valid is True
+        assert new_hash is None
+
+    def test_verify_and_update_wrong_password(self):
+        valid, new_hash = verify_and_update_password("nope", hash_password("pw"))
+        assert valid is False
+        assert new_hash is None
+
+
 class TestJWT:
     def test_create_access_token_returns_string(self):
         token = create_access_token("user-123")
@@ -66,3 +103,30 @@ class TestJWT:
         token = create_access_token("user-123")
         with pytest.raises(jwt.JWTError):
             jwt.decode(token, "wrong-secret", algorithms=[settings.JWT_ALGORITHM])
+
+
+class TestInvitationToken:
+    def test_round_trip(self):
+        board_id = uuid.uuid4()
+        token = create_invitation_token(
+            board_id, "member", datetime.now(UTC) + timedelta(hours=1)
+        )
+        assert verify_invitation_token(token) == (board_id, "member")
+
+    def test_expired(self):
+        token = create_invitation_token(
+            uuid.uuid4(), "member", datetime.now(UTC) - timedelta(seconds=1)
+        )
+        assert verify_invitation_token(token) is None
+
+    def test_signed_with_other_secret(self, monkeypatch):
+        token = create_invitation_token(
+            uuid.uuid4(), "member", datetime.now(UTC) + timedelta(hours=1)
+        )
+        monkeypatch.setattr(settings, "JWT_SECRET", "another-secret")
+        assert verify_invitation_token(token) is None
+
+    def test_malformed(self):
+        assert verify_invitation_token("") is None
+        assert verify_invitation_token("a.b.c") is None
+        assert verify_invitation_token("!!!.???") is None
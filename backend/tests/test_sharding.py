@@ -0,0 +1,259 @@
+"""Tests for board-keyed sharding across several databases."""
+
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.api import auth as auth_module
+from app.api import cards as cards_module
+from app.api import deps
+from app.commands.migrate import migrate
+from app.core.replicas import ReplicaRouter
+from app.core.sharding import (
+    SHARD_BUCKETS,
+    ShardRouter,
+    bucket_of,
+    colocated_id,
+    shard_key,
+)
+from app.core.sqlite import configure_sqlite_engine
+from app.models.card import Card
+from app.models.list import List as ListModel
+from tests.conftest import register_and_login
+
+
+def _id_in_bucket(bucket: int) -> uuid.UUID:
+    fresh = uuid.uuid4().int
+    return uuid.UUID(int=fresh - fresh % SHARD_BUCKETS + bucket)
+
+
+class TestRouting:
+    def test_colocated_ids_share_their_owners_bucket(self):
+        board_id = uuid.uuid4()
+        child = colocated_id(board_id)
+        assert child != board_id
+        assert child.version == 4
+        assert bucket_of(child) == bucket_of(board_id)
+
+    def test_buckets_map_to_contiguous_shards(self):
+        router = ShardRouter(ReplicaRouter("global", [], 0), ["s0", "s1"])
+        assert router.shard_for(_id_in_bucket(0)) == "0"
+        assert router.shard_for(_id_in_bucket(SHARD_BUCKETS // 2 - 1)) == "0"
+        assert router.shard_for(_id_in_bucket(SHARD_BUCKETS // 2)) == "1"
+        assert router.shard_for(_id_in_bucket(SHARD_BUCKETS - 1)) == "1"
+
+    def test_doubling_the_shards_splits_each_one(self):
+        two = ShardRouter(ReplicaRouter("global", [], 0), ["s"] * 2)
+        four = ShardRouter(ReplicaRouter("global", [], 0), ["s"] * 4)
+        for bucket in range(SHARD_BUCKETS):
+            board_id = _id_in_bucket(bucket)
+            assert int(four.shard_for(board_id)) // 2 == int(two.shard_for(board_id))
+
+    def test_shard_key_from_request_params(self):
+        board_id, card_id = uuid.uuid4(), uuid.uuid4()
+        assert shard_key({"card_id": str(card_id)}) == card_id
+        assert shard_key({"card_id": str(card_id), "board_id": str(board_id)}) == (
+            board_id
+        )
+        assert shard_key({"list_id": "not-a-uuid"}) is None
+        assert shard_key({}) is None
+
+    def test_board_rows_get_ids_in_their_boards_bucket(
+        self, db, user_alice, make_board
+    ):
+        board = make_board(user_alice)
+        lst = ListModel(title="To Do", position=0, board_id=board.id)
+        db.add(lst)
+        db.flush()
+        card = Card(
+            title="Card",
+            position=0,
+            list_id=lst.id,
+            board_id=board.id,
+            creator_id=user_alice.id,
+        )
+        db.add(card)
+        db.commit()
+        assert bucket_of(lst.id) == bucket_of(board.id)
+        assert bucket_of(card.id) == bucket_of(board.id)
+
+
+@pytest.fixture()
+def databases(tmp_path):
+    migrate(f"sqlite:///{tmp_path / 'global.db'}")
+    for index in range(2):
+        migrate(f"sqlite:///{tmp_path / f'shard{index}.db'}", shard=True)
+
+    engines = {}
+    for name in ("global", "shard0", "shard1"):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / f'{name}.db'}", poolclass=NullPool
+        )
+        configure_sqlite_engine(engine)
+        engines[name] = engine
+    yield engines
+    for engine in engines.values():
+        engine.dispose()
+
+
+@pytest.fixture()
+def sharded_client(databases, monkeypatch):
+    from app.main import app
+
+    global_router = ReplicaRouter(databases["global"], [], 0)
+    router = ShardRouter(global_router, [databases["shard0"], databases["shard1"]])
+    monkeypatch.setattr(deps, "db_router", global_router)
+    monkeypatch.setattr(deps, "shard_router", router)
+    monkeypatch.setattr(cards_module, "shard_router", router)
+
+    def global_db():
+        with Session(databases["global"]) as db:
+            yield db
+
+    # Authentication only touches the global database, without a router.
+    app.dependency_overrides[auth_module.get_db] = global_db
+    with TestClient(app) as client:
+        yield client, router
+    app.dependency_overrides.clear()
+
+
+def _count(engine, table: str, where: str = "1 = 1", **params) -> int:
+    with engine.connect() as conn:
+        sql = f"SELECT count(*) FROM {table} WHERE {where}"
+        return conn.execute(text(sql), params).scalar()
+
+
+def _boards_on_each_shard(client, headers, router) -> dict[str, dict]:
+    boards: dict[str, dict] = {}
+    while len(boards) < 2:
+        resp = client.post("/api/boards/", json={"title": "Board"}, headers=headers)
+        assert resp.status_code == 201, resp.text
+        boards.setdefault(router.shard_for(resp.json()["id"]), resp.json())
+    return boards
+
+
+class TestShardedApi:
+    def test_shard_schema_has_no_keys_into_global_tables(self, databases):
+        with databases["shard0"].connect() as conn:
+            keys = conn.exec_driver_sql("PRAGMA foreign_key_list(boards)").all()
+            card_keys = conn.exec_driver_sql("PRAGMA foreign_key_list(cards)").all()
+        assert keys == []
+        assert {key[2] for key in card_keys} == {"lists", "boards"}
+
+    def test_board_data_lives_on_its_shard(self, sharded_client, databases):
+        client, router = sharded_client
+        _, _, headers = register_and_login(client)
+        boards = _boards_on_each_shard(client, headers, router)
+        assert _count(databases["global"], "users") == 1
+        assert _count(databases["shard0"], "users") == 0
+        assert _count(databases["global"], "boards") == 0
+
+        board = boards["1"]
+        lst = client.post(
+            "/api/lists/",
+            params={"board_id": board["id"]},
+            json={"title": "Todo"},
+            headers=headers,
+        ).json()
+        card = client.post(
+            "/api/cards/",
+            params={"list_id": lst["id"]},
+            json={"title": "Task"},
+            headers=headers,
+        ).json()
+        assert router.shard_for(card["id"]) == "1"
+        assert _count(databases["shard1"], "cards") == 1
+        assert _count(databases["shard0"], "cards") == 0
+
+        resp = client.get("/api/cards/", params={"list_id": lst["id"]}, headers=headers)
+        assert [c["id"] for c in resp.json()] == [card["id"]]
+
+        resp = client.put(
+            f"/api/cards/{card['id']}", json={"title": "Renamed"}, headers=headers
+        )
+        assert resp.status_code == 200
+        assert resp.json()["title"] == "Renamed"
+
+    def test_listing_boards_reads_every_shard(self, sharded_client):
+        client, router = sharded_client
+        _, _, headers = register_and_login(client)
+        boards = _boards_on_each_shard(client, headers, router)
+
+        listed = {b["id"] for b in client.get("/api/boards/", headers=headers).json()}
+        assert {board["id"] for board in boards.values()} <= listed
+
+        deleted = boards["0"]["id"]
+        resp = client.delete(f"/api/boards/{deleted}", headers=headers)
+        assert resp.status_code == 204
+        listed = {b["id"] for b in client.get("/api/boards/", headers=headers).json()}
+        assert deleted not in listed
+        assert boards["1"]["id"] in listed
+
+    def test_invitations_are_redeemed_on_the_boards_shard(
+        self, sharded_client, databases
+    ):
+        client, router = sharded_client
+        _, _, headers = register_and_login(client)
+        _, _, bob_headers = register_and_login(
+            client, email="bob@example.com", username="bob"
+        )
+        board = _boards_on_each_shard(client, headers, router)["1"]
+        token = client.post(
+            f"/api/boards/{board['id']}/invitations", json={}, headers=headers
+        ).json()["token"]
+
+        resp = client.post(f"/api/invitations/{token}/accept", headers=bob_headers)
+        assert resp.status_code == 200, resp.text
+        board_id = uuid.UUID(board["id"]).hex  # stored as CHAR(32) on SQLite
+        members = _count(
+            databases["shard1"], "board_members", "board_id = :id", id=board_id
+        )
+        assert members == 2
+
+    def test_members_join_users_across_databases(self, sharded_client):
+        client, router = sharded_client
+        _, _, headers = register_and_login(client)
+        register_and_login(client, email="bob@example.com", username="bob")
+        board = _boards_on_each_shard(client, headers, router)["1"]
+
+        resp = client.post(
+            f"/api/boards/{board['id']}/members/",
+            json={"email": "bob@example.com"},
+            headers=headers,
+        )
+        assert resp.status_code == 201, resp.text
+
+        resp = client.get(f"/api/boards/{board['id']}/members/", headers=headers)
+        assert sorted(m["username"] for m in resp.json()) == ["alice", "bob"]
+
+    def test_moves_between_shards_are_rejected(self, sharded_client):
+        client, router = sharded_client
+        _, _, headers = register_and_login(client)
+        boards = _boards_on_each_shard(client, headers, router)
+        lists = {
+            shard: client.post(
+                "/api/lists/",
+                params={"board_id": board["id"]},
+                json={"title": "Todo"},
+                headers=headers,
+            ).json()
+            for shard, board in boards.items()
+        }
+        card = client.post(
+            "/api/cards/",
+            params={"list_id": lists["0"]["id"]},
+            json={"title": "Task"},
+            headers=headers,
+        ).json()
+
+        resp = client.put(
+            f"/api/cards/{card['id']}",
+            json={"list_id": lists["1"]["id"]},
+            headers=headers,
+        )
+        assert resp.status_code == 400
+        assert "another shard" in resp.json()["detail"]
@@ -0,0 +1,74 @@
+"""Tests for the embedded SQLite backend."""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
+
+from app.commands.migrate import migrate
+from app.core.config import settings
+from app.core.sqlite import configure_sqlite_engine, immediate_writes
+
+
+@pytest.fixture()
+def file_engine(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_BUSY_TIMEOUT_MS", 50)
+    engine = create_engine(f"sqlite:///{tmp_path / 'app.db'}", poolclass=NullPool)
+    configure_sqlite_engine(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE t (x INTEGER)")
+    yield engine
+    engine.dispose()
+
+
+class TestSQLiteEngine:
+    def test_connections_use_wal_and_pragmas(self, file_engine):
+        with file_engine.connect() as conn:
+
+            def pragma(name):
+                return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+            assert pragma("journal_mode") == "wal"
+            assert pragma("synchronous") == 1  # NORMAL
+            assert pragma("foreign_keys") == 1
+            assert pragma("busy_timeout") == 50
+            assert pragma("mmap_size") == settings.SQLITE_MMAP_SIZE_BYTES
+
+    def test_writers_take_the_lock_up_front(self, file_engine):
+        writer = immediate_writes(file_engine)
+        with writer.begin() as first:
+            first.execute(text("SELECT count(*) FROM t"))
+            # A second writer waits for the lock, then gives up ...
+            with (
+                pytest.raises(OperationalError, match="database is locked"),
+                writer.begin() as second,
+            ):
+                second.execute(text("SELECT 1"))
+            # ... while readers are not blocked.
+            with file_engine.connect() as reader:
+                assert reader.execute(text("SELECT count(*) FROM t")).scalar() == 0
+            first.execute(text("INSERT INTO t VALUES (1)"))
+
+        with writer.begin() as conn:
+            conn.execute(text("INSERT INTO t VALUES (2)"))
+            assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 2
+
+    def test_immediate_writes_only_changes_sqlite(self, file_engine):
+        postgres = create_engine("postgresql://u@db/trello")
+        assert immediate_writes(postgres) is postgres
+        assert immediate_writes(file_engine) is immediate_writes(file_engine)
+
+
+class TestMigrate:
+    def test_fresh_sqlite_database_is_created_and_stamped(self, tmp_path):
+        url = f"sqlite:///{tmp_path / 'fresh.db'}"
+
+        assert migrate(url) == "created"
+        assert migrate(url) == "upgraded"
+
+        engine = create_engine(url)
+        with engine.connect() as conn:
+            version = conn.exec_driver_sql("SELECT version_num FROM alembic_version")
+            assert version.scalar()
+            assert conn.exec_driver_sql("SELECT count(*) FROM cards").scalar() == 0
+        engine.dispose()
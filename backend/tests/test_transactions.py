@@ -0,0 +1,257 @@
+"""Tests for retried write transactions."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.api import auth as auth_module
+from app.api import cards as cards_module
+from app.api.deps import get_db
+from app.core import board_snapshots, transactions
+from app.core.config import settings
+from app.core.database import Base
+from app.core.transactions import (
+    TransactionConflictError,
+    is_transient,
+    retry_delay,
+    run_in_transaction,
+    transaction_metrics,
+)
+from tests.conftest import auth_header, register_and_login
+
+
+class FakeDriverError(Exception):
+    def __init__(self, pgcode=None, message="boom"):
+        super().__init__(message)
+        self.pgcode = pgcode
+
+
+def deadlock() -> OperationalError:
+    return OperationalError("UPDATE cards", {}, FakeDriverError("40P01"))
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(transactions.time, "sleep", lambda seconds: None)
+
+
+class TestRunInTransaction:
+    def test_transient_errors(self):
+        assert is_transient(deadlock())
+        assert is_transient(OperationalError("x", {}, FakeDriverError("40001")))
+        assert is_transient(
+            OperationalError("x", {}, FakeDriverError(message="database is locked"))
+        )
+        assert not is_transient(IntegrityError("x", {}, FakeDriverError("23505")))
+
+    def test_retries_until_success(self, db):
+        calls = []
+
+        def operation():
+            calls.append(1)
+            if len(calls) < 3:
+                raise deadlock()
+            return "done"
+
+        before = transaction_metrics.snapshot()["retries"]
+        assert run_in_transaction(db, operation, name="op") == "done"
+        assert len(calls) == 3
+        assert transaction_metrics.snapshot()["retries"] == before + 2
+
+    def test_gives_up_after_the_last_attempt(self, db, monkeypatch):
+        monkeypatch.setattr(settings, "TX_RETRY_ATTEMPTS", 2)
+        calls = []
+
+        def operation():
+            calls.append(1)
+            raise deadlock()
+
+        before = transaction_metrics.snapshot()["operations"].get("stuck", {})
+        with pytest.raises(TransactionConflictError):
+            run_in_transaction(db, operation, name="stuck")
+        assert len(calls) == 2
+        after = transaction_metrics.snapshot()["operations"]["stuck"]
+        assert after["give_ups"] == before.get("give_ups", 0) + 1
+
+    def test_other_errors_are_not_retried(self, db):
+        calls = []
+
+        def operation():
+            calls.append(1)
+            raise IntegrityError("INSERT", {}, FakeDriverError("23505"))
+
+        with pytest.raises(IntegrityError):
+            run_in_transaction(db, operation, name="op")
+        assert len(calls) == 1
+
+    def test_backoff_is_jittered_and_capped(self, monkeypatch):
+        monkeypatch.setattr(settings, "TX_RETRY_BASE_MS", 100)
+        monkeypatch.setattr(settings, "TX_RETRY_MAX_MS", 300)
+        for attempt, ceiling in ((1, 0.1), (2, 0.2), (3, 0.3), (6, 0.3)):
+            delays = [retry_delay(attempt) for _ in range(50)]
+            assert all(0 <= delay <= ceiling for delay in delays)
+            assert len(set(delays)) > 1
+
+
+class TestTransactionalRoutes:
+    def _create_list(self, client, headers):
+        board_id = client.post(
+            "/api/boards/", json={"title": "Board"}, headers=headers
+        ).json()["id"]
+        return client.post(
+            "/api/lists/",
+            params={"board_id": board_id},
+            json={"title": "Todo"},
+            headers=headers,
+        ).json()["id"]
+
+    def test_route_retries_a_deadlocked_commit(self, client, db, monkeypatch):
+        _, _, headers = register_and_login(client)
+        list_id = self._create_list(client, headers)
+
+        commit = db.commit
+        failures = [deadlock()]
+
+        def flaky_commit():
+            if failures:
+                raise failures.pop()
+            commit()
+
+        monkeypatch.setattr(db, "commit", flaky_commit)
+        resp = client.post(
+            "/api/cards/",
+            params={"list_id": list_id},
+            json={"title": "Task"},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+        monkeypatch.setattr(db, "commit", commit)
+        resp = client.get("/api/cards/", params={"list_id": list_id}, headers=headers)
+        assert [card["title"] for card in resp.json()] == ["Task"]
+
+    def test_route_answers_409_once_retries_run_out(self, client, db, monkeypatch):
+        _, _, headers = register_and_login(client)
+        list_id = self._create_list(client, headers)
+
+        def deadlocked_commit():
+            raise deadlock()
+
+        monkeypatch.setattr(db, "commit", deadlocked_commit)
+        resp = client.post(
+            "/api/cards/",
+            params={"list_id": list_id},
+            json={"title": "Task"},
+            headers=headers,
+        )
+        assert resp.status_code == 409
+
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-me")
+        metrics = client.get(
+            "/api/metrics/transactions", headers=auth_header("scrape-me")
+        ).json()
+        assert metrics["operations"]["create_card"]["give_ups"] >= 1
+        assert metrics["operations"]["create_card"]["retries"] >= (
+            settings.TX_RETRY_ATTEMPTS - 1
+        )
+
+
+@pytest.fixture()
+def postgres_client():
+    """Client on the Postgres database named by TEST_POSTGRES_URL: write skew
+    only shows between concurrent transactions, which SQLite serializes."""
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    from app.main import app
+
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    make_session = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        with make_session() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_module.get_db] = override_get_db
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.dependency_overrides.clear()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+class TestConcurrentCreates:
+    """Two creates that both read the last position before either commits."""
+
+    def _create_together(self, monkeypatch, module, step, create):
+        """Run two ``create`` calls, both held at ``module.step``, the first
+        write after reading the last position, until both got there."""
+        barrier = threading.Barrier(2)
+        waited = set()
+        original = getattr(module, step)
+
+        def after_both_read(*args, **kwargs):
+            # Only the first attempt waits: a retry runs alone.
+            if threading.get_ident() not in waited:
+                waited.add(threading.get_ident())
+                barrier.wait(timeout=10)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(module, step, after_both_read)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            responses = list(pool.map(create, ("first", "second")))
+        assert [resp.status_code for resp in responses] == [201, 201]
+        return sorted(resp.json()["position"] for resp in responses)
+
+    def test_lists_get_distinct_positions(self, postgres_client, monkeypatch):
+        client = postgres_client
+        _, _, headers = register_and_login(client)
+        board_id = client.post(
+            "/api/boards/", json={"title": "Board"}, headers=headers
+        ).json()["id"]
+
+        def create(title):
+            return client.post(
+                "/api/lists/",
+                params={"board_id": board_id},
+                json={"title": title},
+                headers=headers,
+            )
+
+        assert self._create_together(
+            monkeypatch, board_snapshots, "put_list", create
+        ) == [0, 1]
+
+    def test_cards_get_distinct_positions(self, postgres_client, monkeypatch):
+        client = postgres_client
+        _, _, headers = register_and_login(client)
+        board_id = client.post(
+            "/api/boards/", json={"title": "Board"}, headers=headers
+        ).json()["id"]
+        list_id = client.post(
+            "/api/lists/",
+            params={"board_id": board_id},
+            json={"title": "Todo"},
+            headers=headers,
+        ).json()["id"]
+
+        def create(title):
+            return client.post(
+                "/api/cards/",
+                params={"list_id": list_id},
+                json={"title": title},
+                headers=headers,
+            )
+
+        assert self._create_together(
+            monkeypatch, cards_module, "_count_cards", create
+        ) == [0, 1]
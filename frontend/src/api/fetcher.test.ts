@@ -5,6 +5,8 @@ import { apiFetch } from './fetcher';
 // --- mocks ---
 vi.mock('@/auth/token', () => ({
   getAccessToken: vi.fn(),
+  getRefreshToken: vi.fn(),
+  setTokens: vi.fn(),
   logout: vi.fn(),
 }));
 
@@ -12,7 +14,7 @@ vi.mock('@/config/api', () => ({
   API_BASE_URL: 'http://api.test',
 }));
 
-import { getAccessToken, logout } from '@/auth/token';
+import { getAccessToken, getRefreshToken, logout, setTokens } from '@/auth/token';
 
 describe('apiFetch', () => {
   const fetchMock = vi.fn();
@@ -105,6 +107,18 @@ describe('apiFetch', () => {
     });
   });
 
+  it('sends cookies to the API', async () => {
+    (getAccessToken as any).mockReturnValue(null);
+
+    const res = { status: 200 } as Response;
+    fetchMock.mockResolvedValue(res);
+
+    await apiFetch('/cookies');
+
+    const [, init] = fetchMock.mock.calls[0];
+    expect(init.credentials).toBe('include');
+  });
+
   it('passes through other fetch options (method/body)', async () => {
     (getAccessToken as any).mockReturnValue(null);
 
@@ -132,4 +146,76 @@ describe('apiFetch', () => {
     expect(logout).toHaveBeenCalledTimes(1);
     expect(window.location.replace).toHaveBeenCalledWith('/login');
   });
+
+  it('on 401 with a refresh token: refreshes and retries the request', async () => {
+    (getAccessToken as any).mockReturnValueOnce('old').mockReturnValue('new');
+    (getRefreshToken as any).mockReturnValue('r1');
+
+    const ok = { status: 200 } as Response;
+    fetchMock
+      .mockResolvedValueOnce({ status: 401 } as Response)
+      .mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        json: async () => ({ access_token: 'new', refresh_token: 'r2' }),
+      })
+      .mockResolvedValueOnce(ok);
+
+    const out = await apiFetch('/secure');
+
+    expect(out).toBe(ok);
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+
+    const [refreshUrl, refreshInit] = fetchMock.mock.calls[1];
+    expect(refreshUrl).toBe('http://api.test/api/auth/refresh');
+    expect(refreshInit.body).toBe(JSON.stringify({ refresh_token: 'r1' }));
+    expect(setTokens).toHaveBeenCalledWith('new', 'r2');
+
+    const [, retryInit] = fetchMock.mock.calls[2];
+    expect(retryInit.headers).toMatchObject({ Authorization: 'Bearer new' });
+    expect(logout).not.toHaveBeenCalled();
+  });
+
+  it('on 401 when the refresh fails: logs out and redirects', async () => {
+    (getAccessToken as any).mockReturnValue('old');
+    (getRefreshToken as any).mockReturnValue('r1');
+
+    fetchMock
+      .mockResolvedValueOnce({ status: 401 } as Response)
+      .mockResolvedValueOnce({ ok: false, status: 401 } as Response);
+
+    await expect(apiFetch('/secure')).rejects.toThrow('Unauthorized');
+
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(logout).toHaveBeenCalledTimes(1);
+    expect(window.location.replace).toHaveBeenCalledWith('/login');
+  });
+
+  it('on 401 after another tab refreshed: reuses its tokens', async () => {
+    (getAccessToken as any).mockReturnValueOnce('old').mockReturnValue('new');
+    // The refresh token was rotated while this tab waited for the lock.
+    (getRefreshToken as any).mockReturnValueOnce('r1').mockReturnValue('r2');
+    const request = vi.fn((_name: string, task: () => Promise<boolean>) => task());
+    Object.defineProperty(navigator, 'locks', {
+      value: { request },
+      configurable: true,
+    });
+
+    const ok = { status: 200 } as Response;
+    fetchMock.mockResolvedValueOnce({ status: 401 } as Response).mockResolvedValueOnce(ok);
+
+    try {
+      const out = await apiFetch('/secure');
+
+      expect(out).toBe(ok);
+      expect(request).toHaveBeenCalledTimes(1);
+      // No refresh call: the retry goes out with the other tab's token.
+      expect(fetchMock).toHaveBeenCalledTimes(2);
+      expect(setTokens).not.toHaveBeenCalled();
+      const [, retryInit] = fetchMock.mock.calls[1];
+      expect(retryInit.headers).toMatchObject({ Authorization: 'Bearer new' });
+    } finally {
+      delete (navigator as any).locks;
+    }
+  });
 });
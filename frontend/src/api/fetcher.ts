@@ -1,10 +1,67 @@
-import { getAccessToken, logout } from '@/auth/token';
+import { getAccessToken, getRefreshToken, logout, setTokens } from '@/auth/token';
 import { API_BASE_URL } from '@/config/api';
 
-export async function apiFetch(path: string, options: RequestInit = {}) {
+// Shared by concurrent requests so an expired access token triggers a single
+// refresh (refresh tokens are single-use).
+let pendingRefresh: Promise<boolean> | null = null;
+
+// Tabs share the tokens in localStorage. The lock makes them refresh one at a
+// time, so a second tab never replays a refresh token the first one already
+// spent, which the API treats as theft and answers by ending the session.
+const REFRESH_LOCK = 'epitrello-token-refresh';
+
+function withRefreshLock<T>(task: () => Promise<T>): Promise<T> {
+  if (typeof navigator === 'undefined' || !navigator.locks) return task();
+  return navigator.locks.request(REFRESH_LOCK, task);
+}
+
+async function refreshAccessToken(): Promise<boolean> {
+  const seenRefreshToken = getRefreshToken();
+  if (!seenRefreshToken) return false;
+
+  return withRefreshLock(async () => {
+    const refreshToken = getRefreshToken();
+    if (!refreshToken) return false;
+    // Another tab refreshed while this one waited: use its tokens.
+    if (refreshToken !== seenRefreshToken) return true;
+    return exchange(refreshToken);
+  });
+}
+
+async function exchange(refreshToken: string): Promise<boolean> {
+  const res = await fetch(`${API_BASE_URL}/api/auth/refresh`, {
+    method: 'POST',
+    credentials: 'include',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ refresh_token: refreshToken }),
+  });
+  if (!res.ok) return false;
+
+  const data: { access_token?: string; refresh_token?: string } = await res.json();
+  if (!data?.access_token) return false;
+
+  setTokens(data.access_token, data.refresh_token);
+  return true;
+}
+
+function refreshOnce(): Promise<boolean> {
+  if (!pendingRefresh) {
+    pendingRefresh = refreshAccessToken()
+      .catch(() => false)
+      .finally(() => {
+        pendingRefresh = null;
+      });
+  }
+  return pendingRefresh;
+}
+
+function send(path: string, options: RequestInit) {
   const token = getAccessToken();
 
-  const res = await fetch(`${API_BASE_URL}${path}`, {
+  return fetch(`${API_BASE_URL}${path}`, {
+    // The API answers writes with a last_write cookie that keeps this
+    // browser's next reads on the primary database; send it back.
+    credentials: 'include',
     ...options,
     headers: {
       'Content-Type': 'application/json',
@@ -12,6 +69,14 @@ export async function apiFetch(path: string, options: RequestInit = {}) {
       ...options.headers,
     },
   });
+}
+
+export async function apiFetch(path: string, options: RequestInit = {}) {
+  let res = await send(path, options);
+
+  if (res.status === 401 && (await refreshOnce())) {
+    res = await send(path, options);
+  }
 
   if (res.status === 401) {
     logout();
@@ -1,5 +1,5 @@
 import { describe, it, expect, beforeEach } from 'vitest';
-import { getAccessToken, isAuthenticated, logout } from './token';
+import { getAccessToken, getRefreshToken, isAuthenticated, logout, setTokens } from './token';
 
 describe('auth/token', () => {
   beforeEach(() => {
@@ -26,8 +26,23 @@ describe('auth/token', () => {
 
   it('logout removes token', () => {
     localStorage.setItem('access_token', 'abc');
+    localStorage.setItem('refresh_token', 'def');
     logout();
     expect(localStorage.getItem('access_token')).toBeNull();
+    expect(localStorage.getItem('refresh_token')).toBeNull();
+  });
+
+  it('setTokens stores both tokens', () => {
+    setTokens('abc', 'def');
+    expect(getAccessToken()).toBe('abc');
+    expect(getRefreshToken()).toBe('def');
+  });
+
+  it('setTokens keeps the refresh token when none is given', () => {
+    setTokens('abc', 'def');
+    setTokens('xyz');
+    expect(getAccessToken()).toBe('xyz');
+    expect(getRefreshToken()).toBe('def');
   });
 
   it('isAuthenticated is false when token is empty string', () => {
@@ -2,10 +2,22 @@ export function getAccessToken(): string | null {
   return localStorage.getItem('access_token');
 }
 
+export function getRefreshToken(): string | null {
+  return localStorage.getItem('refresh_token');
+}
+
+export function setTokens(accessToken: string, refreshToken?: string) {
+  localStorage.setItem('access_token', accessToken);
+  if (refreshToken) {
+    localStorage.setItem('refresh_token', refreshToken);
+  }
+}
+
 export function isAuthenticated(): boolean {
   return !!getAccessToken();
 }
 
 export function logout() {
   localStorage.removeItem('access_token');
+  localStorage.removeItem('refresh_token');
 }
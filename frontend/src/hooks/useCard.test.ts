@@ -147,6 +147,16 @@ describe('hooks/useCard', () => {
 
     await result.current.api.removeCard('c1');
 
+    expect(apiFetch).toHaveBeenLastCalledWith('/api/cards/c1?board_id=b1', { method: 'DELETE' });
+  });
+
+  it('api.removeCard without a board leaves board_id out', async () => {
+    const { result } = renderHook(() => useCard(undefined, []));
+
+    (apiFetch as any).mockResolvedValueOnce({ ok: true, status: 204 });
+
+    await result.current.api.removeCard('c1');
+
     expect(apiFetch).toHaveBeenLastCalledWith('/api/cards/c1', { method: 'DELETE' });
   });
 
@@ -248,7 +258,7 @@ describe('hooks/useCard', () => {
 
     expect(result.current.cardsByListId['list-1'][0].title).toBe('New');
 
-    expect(apiFetch).toHaveBeenLastCalledWith('/api/cards/c1', {
+    expect(apiFetch).toHaveBeenLastCalledWith('/api/cards/c1?board_id=b1', {
       method: 'PUT',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify({
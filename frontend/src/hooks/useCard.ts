@@ -23,6 +23,12 @@ export function useCard(boardId?: string, lists?: ListModel[]) {
     [lists],
   );
 
+  // The board id lets the API find the card in its board's partition.
+  function cardPath(cardId: string): string {
+    const path = `/api/cards/${encodeURIComponent(cardId)}`;
+    return boardId ? `${path}?board_id=${encodeURIComponent(boardId)}` : path;
+  }
+
   async function getCards(listId: string): Promise<CardModel[]> {
     const res = await apiFetch(`/api/cards/?list_id=${encodeURIComponent(listId)}`);
     const cards = (await res.json()) as CardModel[];
@@ -40,7 +46,7 @@ export function useCard(boardId?: string, lists?: ListModel[]) {
   }
 
   async function updateCard(cardId: string, payload: CardPut): Promise<void> {
-    const res = await apiFetch(`/api/cards/${encodeURIComponent(cardId)}`, {
+    const res = await apiFetch(cardPath(cardId), {
       method: 'PUT',
       headers: { 'Content-Type': 'application/json' },
       body: JSON.stringify(payload),
@@ -53,7 +59,7 @@ export function useCard(boardId?: string, lists?: ListModel[]) {
   }
 
   async function removeCard(cardId: string): Promise<void> {
-    await apiFetch(`/api/cards/${encodeURIComponent(cardId)}`, { method: 'DELETE' });
+    await apiFetch(cardPath(cardId), { method: 'DELETE' });
   }
 
   useEffect(() => {
@@ -311,7 +311,7 @@ describe('useMember', () => {
         const out = await actResolve(() => result.current.actions.getCardMembers());
         expect(out).toEqual([]);
 
-        expect(apiFetchMock).toHaveBeenCalledWith('/api/cards/c1/members/');
+        expect(apiFetchMock).toHaveBeenCalledWith('/api/cards/c1/members/?board_id=b1');
         await waitFor(() => expect(result.current.loading).toBe(false));
         expect(result.current.error).toBe(null);
       });
@@ -394,7 +394,7 @@ describe('useMember', () => {
         const out = await actResolve(() => result.current.actions.addCardMember('X@Y.com'));
         expect(out).toEqual({ status: 201, detail: 'Added' });
 
-        expect(apiFetchMock).toHaveBeenCalledWith('/api/cards/c%201/members/', {
+        expect(apiFetchMock).toHaveBeenCalledWith('/api/cards/c%201/members/?board_id=b1', {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({ email: 'X@Y.com' }),
@@ -447,7 +447,7 @@ describe('useMember', () => {
 
         await actResolve(() => result.current.actions.deleteCardMember('a@a.com'));
 
-        expect(apiFetchMock).toHaveBeenCalledWith('/api/cards/c1/members/', {
+        expect(apiFetchMock).toHaveBeenCalledWith('/api/cards/c1/members/?board_id=b1', {
           method: 'DELETE',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({ email: 'a@a.com' }),
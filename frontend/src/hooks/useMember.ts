@@ -46,6 +46,12 @@ async function readDetail(res: Response): Promise<string> {
   }
 }
 
+export function cardMembersPath(cardId: string, boardId?: string): string {
+  const path = `/api/cards/${encodeURIComponent(cardId)}/members/`;
+  // The board id lets the API find the card in its board's partition.
+  return boardId ? `${path}?board_id=${encodeURIComponent(boardId)}` : path;
+}
+
 export function useMember(boardId?: string, cardId?: string) {
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<unknown>(null);
@@ -136,7 +142,7 @@ export function useMember(boardId?: string, cardId?: string) {
     setError(null);
 
     try {
-      const res = await apiFetch(`/api/cards/${encodeURIComponent(cardId)}/members/`);
+      const res = await apiFetch(cardMembersPath(cardId, boardId));
       if (!res.ok) {
         const detail = await readDetail(res);
         throw new ApiError(res.status, detail);
@@ -150,7 +156,7 @@ export function useMember(boardId?: string, cardId?: string) {
     } finally {
       setLoading(false);
     }
-  }, [cardId]);
+  }, [boardId, cardId]);
 
   const addCardMember = useCallback(
     async (email: string): Promise<ActionResult> => {
@@ -160,7 +166,7 @@ export function useMember(boardId?: string, cardId?: string) {
       setError(null);
 
       try {
-        const res = await apiFetch(`/api/cards/${encodeURIComponent(cardId)}/members/`, {
+        const res = await apiFetch(cardMembersPath(cardId, boardId), {
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({ email }),
@@ -177,7 +183,7 @@ export function useMember(boardId?: string, cardId?: string) {
         setLoading(false);
       }
     },
-    [cardId],
+    [boardId, cardId],
   );
 
   const deleteCardMember = useCallback(
@@ -188,7 +194,7 @@ export function useMember(boardId?: string, cardId?: string) {
       setError(null);
 
       try {
-        const res = await apiFetch(`/api/cards/${encodeURIComponent(cardId)}/members/`, {
+        const res = await apiFetch(cardMembersPath(cardId, boardId), {
           method: 'DELETE',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({ email }),
@@ -205,7 +211,7 @@ export function useMember(boardId?: string, cardId?: string) {
         setLoading(false);
       }
     },
-    [cardId],
+    [boardId, cardId],
   );
 
   const getMembers = useCallback(() => getBoardMembers(), [getBoardMembers]);
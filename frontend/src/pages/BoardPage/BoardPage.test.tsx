@@ -197,7 +197,8 @@ const memberMock = vi.hoisted(() => ({
   },
 }));
 
-vi.mock('@/hooks/useMember', () => ({
+vi.mock('@/hooks/useMember', async (importOriginal) => ({
+  cardMembersPath: (await importOriginal<typeof import('@/hooks/useMember')>()).cardMembersPath,
   useMember: () => ({
     loading: false,
     error: null,
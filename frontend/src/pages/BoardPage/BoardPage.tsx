@@ -10,7 +10,7 @@ import { useBoard } from '@/hooks/useBoard';
 import { useList } from '@/hooks/useList';
 import { useCard } from '@/hooks/useCard';
 import { useSortableLists } from '@/hooks/useSortableLists';
-import { useMember } from '@/hooks/useMember';
+import { cardMembersPath, useMember } from '@/hooks/useMember';
 import { apiFetch } from '@/api/fetcher';
 
 import styles from './BoardPage.module.css';
@@ -103,7 +103,7 @@ export default function BoardPage() {
   }
 
   async function fetchCardMemberIds(cardId: string): Promise<string[]> {
-    const res = await apiFetch(`/api/cards/${encodeURIComponent(cardId)}/members/`);
+    const res = await apiFetch(cardMembersPath(cardId, boardId));
     if (!res.ok) {
       return [];
     }
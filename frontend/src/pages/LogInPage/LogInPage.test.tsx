@@ -111,6 +111,23 @@ describe('pages/LogInPage', () => {
     expect(nav.navigate).toHaveBeenCalledWith('/boards');
   });
 
+  it('stores refresh_token when the server returns one', async () => {
+    (fetch as any).mockResolvedValueOnce(
+      makeFetchResJson({ access_token: 'jwt-123', refresh_token: 'r-456' }, true),
+    );
+
+    renderPage();
+
+    fireEvent.change(screen.getByLabelText(/email/i), { target: { value: 'a@b.com' } });
+    fireEvent.change(screen.getByLabelText(/password/i), { target: { value: 'secret' } });
+
+    await act(async () => {
+      fireEvent.click(screen.getByRole('button', { name: /continue/i }));
+    });
+
+    expect(localStorage.getItem('refresh_token')).toBe('r-456');
+  });
+
   it('shows "Unexpected server response" when ok=true but access_token missing', async () => {
     (fetch as any).mockResolvedValueOnce(makeFetchResJson({ token_type: 'bearer' }, true));
 
@@ -1,6 +1,7 @@
 import { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import styles from './LogInPage.module.css';
+import { setTokens } from '@/auth/token';
 import { API_BASE_URL } from '@/config/api';
 
 function TrelloLogo() {
@@ -13,6 +14,12 @@ function TrelloLogo() {
   );
 }
 
+type LoginResponse = {
+  access_token: string;
+  refresh_token?: string;
+  token_type?: string;
+};
+
 export default function LogInPage() {
   const navigate = useNavigate();
 
@@ -36,10 +43,10 @@ export default function LogInPage() {
       return;
     }
 
-    const data: { access_token: string; token_type?: string } = await res.json();
+    const data: LoginResponse = await res.json();
 
     if (data?.access_token) {
-      localStorage.setItem('access_token', data.access_token);
+      setTokens(data.access_token, data.refresh_token);
       navigate('/boards');
     } else {
       setError('Unexpected server response');